@@ -0,0 +1,420 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+import logging
+import math
+import pickle
+from typing import TYPE_CHECKING, Any, Awaitable, Optional, cast
+
+from docuisine.core.invalidation import InvalidationBus
+from docuisine.utils.cache import CacheStats, TTLCache
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError, WatchError
+else:
+    try:
+        from redis.asyncio import Redis
+        from redis.exceptions import RedisError, WatchError
+    except ImportError:  # The Redis backend is optional
+        Redis = None
+        RedisError = WatchError = OSError
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached values, split into namespaces that are cleared independently.
+    """
+
+    shared = False
+    """Whether every worker sees the same entries, so invalidations need no `InvalidationBus`."""
+
+    def configure(self, namespace: str, maxsize: int) -> None:
+        """
+        Set the maximum number of entries kept for a namespace.
+
+        Backends that manage their own memory, such as Redis, ignore it.
+        """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Get the value stored for ``key``, or ``None`` if it is missing or expired."""
+
+    @abstractmethod
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store ``value`` for ``key`` for ``ttl`` seconds.
+
+        If ``generation`` is given, the value is only stored while it is still
+        the namespace's generation.
+        """
+
+    @abstractmethod
+    async def delete(self, namespace: str, key: str) -> None:
+        """Remove the entry for ``key`` if there is one."""
+
+    @abstractmethod
+    async def clear(self, namespace: str) -> None:
+        """Remove every entry of a namespace."""
+
+    @abstractmethod
+    async def generation(self, namespace: str) -> Optional[int]:
+        """Get the generation of a namespace, or ``None`` if it cannot be read."""
+
+    @abstractmethod
+    async def bump_generation(self, namespace: str) -> None:
+        """Start a new generation of a namespace."""
+
+    @abstractmethod
+    def stats(self, namespace: str) -> CacheStats:
+        """Get the counters of a namespace."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Backend keeping entries in the memory of the current worker.
+
+    Each namespace is a bounded `TTLCache`. Entries, invalidations and
+    generations are not shared with other workers.
+    """
+
+    def __init__(self) -> None:
+        self._caches: dict[str, TTLCache[str, Any]] = {}
+        self._generations: defaultdict[str, int] = defaultdict(int)
+
+    def configure(self, namespace: str, maxsize: int) -> None:
+        self._caches[namespace] = TTLCache(maxsize=maxsize, ttl=math.inf)
+
+    def _cache(self, namespace: str) -> TTLCache[str, Any]:
+        if namespace not in self._caches:
+            self.configure(namespace, maxsize=0)
+        return self._caches[namespace]
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self._cache(namespace).get(key)
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        if generation is None or generation == self._generations[namespace]:
+            self._cache(namespace).set(key, value, ttl=ttl)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        self._cache(namespace).pop(key)
+
+    async def clear(self, namespace: str) -> None:
+        self._cache(namespace).clear()
+
+    async def generation(self, namespace: str) -> Optional[int]:
+        return self._generations[namespace]
+
+    async def bump_generation(self, namespace: str) -> None:
+        self._generations[namespace] += 1
+
+    def stats(self, namespace: str) -> CacheStats:
+        return self._cache(namespace).stats()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend keeping entries in Redis, or any server speaking its protocol,
+    so every worker shares them.
+
+    Values are pickled, so the server must only be reachable by trusted
+    clients. A failing server is logged and treated as a cache miss, so
+    requests fall back to the database instead of failing. Redis expires and
+    evicts keys itself, so only the hits and misses of this worker are counted.
+    The generation of a namespace is a counter stored next to its entries.
+
+    Parameters
+    ----------
+    client : redis.asyncio.Redis
+        The client connected to the server.
+    prefix : str
+        Prefix of every key written by this backend. Default is ``"docuisine:"``.
+    """
+
+    CLEAR_BATCH_SIZE = 500
+    shared = True
+
+    def __init__(self, client: "Redis", prefix: str = "docuisine:") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._stats: defaultdict[str, CacheStats] = defaultdict(CacheStats)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}{namespace}:{key}"
+
+    def _generation_key(self, namespace: str) -> str:
+        # Outside the namespace's key pattern, so clearing it keeps the counter.
+        return f"{self.prefix}{namespace}#generation"
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        try:
+            # The client does not decode responses, so values are the pickled bytes.
+            data = cast(Optional[bytes], await self.client.get(self._key(namespace, key)))
+        except RedisError as e:
+            logger.warning("Cache read from %s failed: %s", namespace, e)
+            data = None
+        try:
+            value = None if data is None else pickle.loads(data)
+        except (pickle.UnpicklingError, AttributeError, EOFError) as e:
+            logger.warning("Cache entry in %s could not be loaded: %s", namespace, e)
+            value = None
+        if value is None:
+            self._stats[namespace].misses += 1
+            return None
+        self._stats[namespace].hits += 1
+        return value
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        data = pickle.dumps(value)
+        px = max(int(ttl * 1000), 1)
+        try:
+            if generation is None:
+                await self.client.set(self._key(namespace, key), data, px=px)
+                return
+            # The write is dropped if the generation changes before EXEC.
+            async with self.client.pipeline() as pipe:
+                await pipe.watch(self._generation_key(namespace))
+                if int(await pipe.get(self._generation_key(namespace)) or 0) != generation:
+                    return
+                pipe.multi()
+                pipe.set(self._key(namespace, key), data, px=px)
+                await pipe.execute()
+        except WatchError:
+            pass
+        except RedisError as e:
+            logger.warning("Cache write to %s failed: %s", namespace, e)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        try:
+            await self.client.unlink(self._key(namespace, key))
+        except RedisError as e:
+            logger.warning("Cache delete from %s failed: %s", namespace, e)
+
+    async def clear(self, namespace: str) -> None:
+        try:
+            batch: list[Any] = []
+            async for key in self.client.scan_iter(
+                match=self._key(namespace, "*"), count=self.CLEAR_BATCH_SIZE
+            ):
+                batch.append(key)
+                if len(batch) >= self.CLEAR_BATCH_SIZE:
+                    await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                await self.client.unlink(*batch)
+        except RedisError as e:
+            logger.warning("Cache clear of %s failed: %s", namespace, e)
+
+    async def generation(self, namespace: str) -> Optional[int]:
+        try:
+            return int(await self.client.get(self._generation_key(namespace)) or 0)
+        except RedisError as e:
+            logger.warning("Cache generation of %s could not be read: %s", namespace, e)
+            return None
+
+    async def bump_generation(self, namespace: str) -> None:
+        try:
+            await cast(Awaitable[int], self.client.incr(self._generation_key(namespace)))
+        except RedisError as e:
+            logger.warning("Cache generation of %s could not be bumped: %s", namespace, e)
+
+    def stats(self, namespace: str) -> CacheStats:
+        return CacheStats(hits=self._stats[namespace].hits, misses=self._stats[namespace].misses)
+
+
+class Cache:
+    """
+    A namespace of a `CacheBackend` with its own size and time-to-live.
+
+    The namespace has a generation, which every invalidation moves on. A value
+    read from the database can be stored with the generation taken before the
+    read, so it is dropped if a write started in the meantime.
+
+    Parameters
+    ----------
+    backend : CacheBackend
+        The backend storing the entries.
+    namespace : str
+        The name of the namespace, e.g. ``"categories"``.
+    maxsize : int
+        The maximum number of entries. A size of 0 disables the cache.
+    ttl : float
+        The maximum number of seconds an entry stays valid.
+    bus : Optional[InvalidationBus]
+        The bus publishing this cache's deletes and clears to the other workers.
+        Ignored with a shared backend. Default is None (this worker only).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        maxsize: int,
+        ttl: float,
+        bus: Optional[InvalidationBus] = None,
+    ) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.bus = None if backend.shared else bus
+        backend.configure(namespace, maxsize)
+        if self.bus is not None:
+            self.bus.register(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get the value stored for ``key``.
+
+        Returns
+        -------
+        Optional[Any]
+            The cached value, or ``None`` if the key is missing or expired.
+        """
+        if not self.enabled:
+            return None
+        return await self.backend.get(self.namespace, key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store ``value`` for ``key``.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : Any
+            The value to cache. Must be picklable for shared backends.
+        ttl : Optional[float]
+            Seconds the entry stays valid, capped at the cache's ``ttl``.
+            Default is the cache's ``ttl``. Entries with a non-positive TTL are not stored.
+        generation : Optional[int]
+            The `generation` the value was read in. The value is not stored if the
+            generation has moved on since. Default is None (always stored).
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if not self.enabled or ttl <= 0:
+            return
+        await self.backend.set(self.namespace, key, value, ttl, generation=generation)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove the entry for ``key``, for every worker sharing the backend or the bus.
+
+        Like `clear`, it moves the generation on, so a value read before the
+        delete is not stored after it.
+        """
+        await self.backend.bump_generation(self.namespace)
+        await self.backend.delete(self.namespace, key)
+        if self.bus is not None:
+            await self.bus.publish(self, key)
+
+    async def clear(self) -> None:
+        """Remove every entry of the namespace, for every worker sharing the backend or the bus."""
+        await self.backend.bump_generation(self.namespace)
+        await self.backend.clear(self.namespace)
+        if self.bus is not None:
+            await self.bus.publish(self, None)
+
+    async def generation(self) -> Optional[int]:
+        """
+        Get the generation of the namespace, to pass to `set` after a read.
+
+        Returns
+        -------
+        Optional[int]
+            The generation, or ``None`` if the backend cannot tell, in which case
+            nothing read now should be stored.
+        """
+        return await self.backend.generation(self.namespace)
+
+    async def bump_generation(self) -> None:
+        """
+        Start a new generation before a write, so reads that are in flight do not
+        store what they read. Other workers sharing the bus move on when the
+        write's `clear` reaches them.
+        """
+        await self.backend.bump_generation(self.namespace)
+
+    async def evict_locally(self, key: Optional[str]) -> None:
+        """
+        Apply an invalidation received from the bus without publishing it again.
+
+        Parameters
+        ----------
+        key : Optional[str]
+            The key to remove, or ``None`` to remove every entry of the namespace.
+        """
+        await self.backend.bump_generation(self.namespace)
+        if key is None:
+            await self.backend.clear(self.namespace)
+        else:
+            await self.backend.delete(self.namespace, key)
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the namespace's counters."""
+        return self.backend.stats(self.namespace)
+
+
+def create_cache_backend(url: str) -> CacheBackend:
+    """
+    Create the cache backend for a URL.
+
+    Parameters
+    ----------
+    url : str
+        ``memory://`` for a per-worker backend, or a ``redis://``,
+        ``rediss://`` or ``unix://`` URL for a shared Redis backend.
+
+    Returns
+    -------
+    CacheBackend
+        The backend for the URL.
+
+    Raises
+    ------
+    ValueError
+        If the URL scheme is not supported.
+    ImportError
+        If a Redis URL is given but the ``redis`` package is not installed.
+    """
+    if url.startswith("memory://"):
+        return MemoryCacheBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        if Redis is None:
+            raise ImportError("The redis package is required for a Redis cache backend.")
+        return RedisCacheBackend(Redis.from_url(url))
+    raise ValueError(f"Unsupported cache URL: {url}")
@@ -0,0 +1,315 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Brotli compression is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Zstandard compression is optional
+    zstandard = None
+
+DEFAULT_CONTENT_TYPES = ("application/json", "application/msgpack", "text/*")
+"""Media types compressed by default. A ``type/*`` entry matches every subtype."""
+
+NOT_COMPRESSED_STATUSES = frozenset({204, 304})
+
+
+class Encoder(ABC):
+    """
+    Compressor of one response body, fed in chunks.
+
+    A body sent in one message is passed to `compress` and then `finish`. A
+    streamed body is passed chunk by chunk, each followed by `flush`, so the
+    client can decode every chunk as soon as it arrives.
+    """
+
+    encoding: str
+    """The ``Content-Encoding`` token of the coding."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, returning the output that is ready so far."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return the output of every chunk compressed so far."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return the rest of the output and end the compressed stream."""
+
+
+class GzipEncoder(Encoder):
+    """Gzip encoder, at the level of ``zlib``'s default speed and size trade-off."""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder(Encoder):
+    """Brotli encoder, at a quality suited to compressing each response on the fly."""
+
+    encoding = "br"
+
+    def __init__(self, quality: int = 4) -> None:
+        if brotli is None:
+            raise ImportError("The brotli package is required for Brotli compression.")
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    """Zstandard encoder, at the library's default level."""
+
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:
+            raise ImportError("The zstandard package is required for Zstandard compression.")
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS: dict[str, type[Encoder]] = {
+    "gzip": GzipEncoder,
+    "br": BrotliEncoder,
+    "zstd": ZstdEncoder,
+}
+"""Encoders by ``Content-Encoding`` token."""
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a whole body in one of the `ENCODERS` codings, e.g. ``"br"``."""
+    encoder = ENCODERS[encoding]()
+    return encoder.compress(data) + encoder.finish()
+
+
+def allows_content_type(content_type: str, content_types: Sequence[str]) -> bool:
+    """
+    Check whether a response's media type is one of the media types to compress.
+
+    Parameters
+    ----------
+    content_type : str
+        The response's ``Content-Type``, e.g. ``"application/json; charset=utf-8"``.
+    content_types : Sequence[str]
+        The media types to compress. A ``type/*`` entry matches every subtype.
+
+    Returns
+    -------
+    bool
+        Whether the response may be compressed.
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    for allowed in content_types:
+        allowed = allowed.lower()
+        if (
+            media_type.startswith(allowed[:-1])
+            if allowed.endswith("/*")
+            else media_type == allowed
+        ):
+            return True
+    return False
+
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: Sequence[str]) -> Optional[str]:
+    """
+    Choose the content coding of a response from the request's ``Accept-Encoding``.
+
+    Parameters
+    ----------
+    accept_encoding : Optional[str]
+        The request's ``Accept-Encoding`` header, e.g. ``"gzip, br;q=0.8"``.
+    encodings : Sequence[str]
+        The codings the server can produce, in order of preference.
+
+    Returns
+    -------
+    Optional[str]
+        The coding the client weights highest, the server's preference breaking
+        ties, or ``None`` if the client accepts none of them.
+    """
+    weights: dict[str, float] = {}
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name.strip():
+            weights[name.strip().lower()] = weight
+
+    chosen, chosen_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > chosen_weight:
+            chosen, chosen_weight = encoding, weight
+    return chosen
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses in the best coding a client accepts.
+
+    Only responses with an allowed media type and a body of at least
+    ``min_size`` bytes are compressed. Responses that already carry a
+    ``Content-Encoding``, such as the precompressed bodies served from the
+    response caches, are passed through, as are responses marked
+    ``Cache-Control: no-transform``. Streamed responses are compressed chunk by
+    chunk. A compressed response gets ``Vary: Accept-Encoding``, and its ETag is
+    made weak, since the bytes differ but the ``If-None-Match`` comparison of
+    the routes still matches.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The application to wrap.
+    encodings : Sequence[str]
+        The codings to offer, in order of preference, out of ``"zstd"``,
+        ``"br"`` and ``"gzip"``. No codings disables compression.
+    min_size : int
+        The smallest body in bytes worth compressing.
+    content_types : Sequence[str]
+        The media types to compress, e.g. ``"application/json"`` or ``"text/*"``.
+
+    Raises
+    ------
+    ValueError
+        If a coding is not supported.
+    ImportError
+        If ``"br"`` or ``"zstd"`` is offered but the ``brotli`` or ``zstandard``
+        package is not installed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("gzip",),
+        min_size: int = 1024,
+        content_types: Sequence[str] = DEFAULT_CONTENT_TYPES,
+    ) -> None:
+        for encoding in encodings:
+            if encoding not in ENCODERS:
+                raise ValueError(f"Unsupported content coding: {encoding}")
+        if "br" in encodings and brotli is None:
+            raise ImportError("The brotli package is required for Brotli compression.")
+        if "zstd" in encodings and zstandard is None:
+            raise ImportError("The zstandard package is required for Zstandard compression.")
+        self.app = app
+        self.encodings = tuple(encodings)
+        self.min_size = min_size
+        self.content_types = tuple(content_type.lower() for content_type in content_types)
+
+    def _compressible(self, start: Message, headers: Headers, size: Optional[int]) -> bool:
+        if start["status"] < 200 or start["status"] in NOT_COMPRESSED_STATUSES:
+            return False
+        if (
+            "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "").lower()
+        ):
+            return False
+        if not allows_content_type(headers.get("content-type", ""), self.content_types):
+            return False
+        if size is None and "content-length" in headers:
+            size = int(headers["content-length"])
+        return size is None or size >= self.min_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder: Optional[Encoder] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk tells whether to compress.
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            more_body: bool = message.get("more_body", False)
+            if start is not None:
+                first, start = start, None
+                headers = MutableHeaders(raw=list(first.get("headers", [])))
+                if not self._compressible(first, headers, None if more_body else len(body)):
+                    await send(first)
+                    await send(message)
+                    return
+                encoder = ENCODERS[encoding]()
+                data = encoder.compress(body) + (
+                    encoder.flush() if more_body else encoder.finish()
+                )
+                if not more_body and len(data) >= len(body):
+                    await send(first)
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(data))
+                await send({**first, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            if encoder is None:
+                await send(message)
+                return
+            data = encoder.compress(body) + (encoder.flush() if more_body else encoder.finish())
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,88 +1,133 @@
+from functools import cached_property
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from docuisine.core.compression import DEFAULT_CONTENT_TYPES
+from docuisine.schemas.auth import JWTConfig
+from docuisine.schemas.enums import JWTAlgorithm, Mode
+
+
+class Settings(BaseModel):
+    """
+    Application settings, read from the environment and validated once.
+
+    Field names match the environment variables. Booleans accept ``1``,
+    ``true``, ``yes`` and ``on`` (or their negations), and a missing required
+    variable or an unparsable value fails at startup instead of on the first
+    request that reads it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    DATABASE_URL: str
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_POOL_TIMEOUT: float = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds, -1 disables recycling
+    DB_POOL_PRE_PING: bool = True
+    DB_QUERY_COUNT_THRESHOLD: int = 20  # Statements per request
+    DB_QUERY_REPEAT_THRESHOLD: int = 5  # Repeats of one statement
+
+    COMMIT_HASH: Optional[str] = None
+    VERSION: Optional[str] = None
+    MODE: Mode
+
+    JWT_SECRET_KEY: str
+    JWT_ALGORITHM: JWTAlgorithm = JWTAlgorithm.HS256
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=525600, ge=1)  # Default to 1 year
+    JWT_STATELESS: bool = False  # Trust id and role claims, only checking the token version
+
+    AUTH_CACHE_SIZE: int = Field(default=1024, ge=0)  # Cached tokens, 0 disables the cache
+    AUTH_CACHE_TTL: float = 60  # Seconds a cached token stays valid
+    CACHE_URL: str = "memory://"  # memory:// per worker, or a redis:// URL
+    CACHE_INVALIDATION: Literal["local", "postgres"] = "local"  # postgres for LISTEN/NOTIFY
+    READ_CACHE_SIZE: int = Field(default=256, ge=0)  # Cached reads per entity, 0 disables
+    READ_CACHE_TTL: float = 300  # Seconds a cached read stays valid
+    NOT_FOUND_CACHE_SIZE: int = Field(default=1024, ge=0)  # Cached missing names, 0 disables
+    NOT_FOUND_CACHE_TTL: float = 30  # Seconds a missing name stays cached
+    SINGLE_FLIGHT_MAX_BODY_SIZE: int = Field(
+        default=1048576, ge=0
+    )  # Bytes of a GET response shared by identical concurrent requests, 0 disables sharing
+    COMPRESSION_ENCODINGS: tuple[Literal["zstd", "br", "gzip"], ...] = (
+        "gzip",
+    )  # Comma-separated, in order of preference, empty disables compression
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0)  # Smaller bodies are sent as is
+    COMPRESSION_CONTENT_TYPES: tuple[str, ...] = DEFAULT_CONTENT_TYPES  # Comma-separated
+
+    S3_ENDPOINT_URL: str
+    S3_ACCESS_KEY: str
+    S3_SECRET_KEY: str
+    S3_BUCKET_NAME: str = "docuisine-images"
+    S3_REGION: str = "apac"
+
+    @field_validator("CACHE_INVALIDATION", mode="before")
+    @classmethod
+    def _normalize_kind(cls, value: object) -> object:
+        return value.strip().lower() if isinstance(value, str) else value
+
+    @field_validator("COMPRESSION_ENCODINGS", "COMPRESSION_CONTENT_TYPES", mode="before")
+    @classmethod
+    def _split_list(cls, value: object) -> object:
+        if isinstance(value, str):
+            return tuple(item.strip().lower() for item in value.split(",") if item.strip())
+        return value
+
+    @cached_property
+    def jwt(self) -> JWTConfig:
+        """The JWT configuration, built once per settings object."""
+        return JWTConfig(
+            secret_key=self.JWT_SECRET_KEY,
+            algorithm=self.JWT_ALGORITHM,
+            access_token_expire_minutes=self.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+            stateless=self.JWT_STATELESS,
+        )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Read the settings from the environment and the ``.env`` file.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If a required variable is not set or a value is invalid.
+        """
+        load_dotenv()
+        return cls.model_validate(
+            {name: os.environ[name] for name in cls.model_fields if name in os.environ}
+        )
 
 
-class Environment:
-    """Environment configuration loader."""
+settings = Settings.from_env()
 
-    def __init__(self) -> None:
-        load_dotenv()
 
-    @property
-    def DATABASE_URL(self) -> str:
-        URL = os.getenv("DATABASE_URL")
-        if URL is None:
-            raise EnvironmentError("DATABASE_URL environment variable is not set.")
-        return URL
-
-    @property
-    def COMMIT_HASH(self) -> Optional[str]:
-        return os.getenv("COMMIT_HASH", None)
-
-    @property
-    def VERSION(self) -> Optional[str]:
-        return os.getenv("VERSION", None)
-
-    @property
-    def MODE(self) -> str:
-        mode = os.getenv("MODE")
-        if mode is None:
-            raise EnvironmentError("MODE environment variable is not set.")
-        return mode
-
-    @property
-    def JWT_SECRET_KEY(self) -> str:
-        secret_key = os.getenv("JWT_SECRET_KEY", None)
-        if secret_key is None:
-            raise EnvironmentError("JWT_SECRET_KEY environment variable is not set.")
-        return secret_key
-
-    @property
-    def JWT_ALGORITHM(self) -> str:
-        algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-        return algorithm
-
-    @property
-    def JWT_ACCESS_TOKEN_EXPIRE_MINUTES(self) -> int:
-        expire_minutes = os.getenv(
-            "JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "525600"
-        )  # Default to 1 year
-        return int(expire_minutes)
-
-    @property
-    def S3_ENDPOINT_URL(self) -> str:
-        endpoint_url = os.getenv("S3_ENDPOINT_URL")
-        if endpoint_url is None:
-            raise EnvironmentError("S3_ENDPOINT_URL environment variable is not set.")
-        return endpoint_url
-
-    @property
-    def S3_ACCESS_KEY(self) -> str:
-        access_key = os.getenv("S3_ACCESS_KEY")
-        if access_key is None:
-            raise EnvironmentError("S3_ACCESS_KEY environment variable is not set.")
-        return access_key
-
-    @property
-    def S3_SECRET_KEY(self) -> str:
-        secret_key = os.getenv("S3_SECRET_KEY")
-        if secret_key is None:
-            raise EnvironmentError("S3_SECRET_KEY environment variable is not set.")
-        return secret_key
-
-    @property
-    def S3_BUCKET_NAME(self) -> str:
-        bucket_name = os.getenv("S3_BUCKET_NAME", "docuisine-images")
-        return bucket_name
-
-    @property
-    def S3_REGION(self) -> str:
-        region = os.getenv("S3_REGION", "apac")
-        if region is None:
-            raise EnvironmentError("S3_REGION environment variable is not set.")
-        return region
-
-
-env = Environment()
+def get_settings() -> Settings:
+    """Get the current settings. As a dependency, it picks up `reload_settings`."""
+    return settings
+
+
+def reload_settings() -> Settings:
+    """
+    Read the environment again and replace the current settings.
+
+    Returns
+    -------
+    Settings
+        The new settings.
+
+    Notes
+    -----
+    - Objects built from the settings at import, such as the database engines,
+      the caches, the middleware and the S3 client, keep the values they were
+      built with. Everything else reads the settings through `get_settings`
+      and sees the new ones, e.g. `IS_PRODUCTION` and the JWT configuration.
+    - Variables already set in the process environment are not overridden by
+      the ``.env`` file.
+    """
+    global settings
+    settings = Settings.from_env()
+    return settings
@@ -0,0 +1,209 @@
+from abc import ABC, abstractmethod
+import asyncio
+from collections import defaultdict
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+import uuid
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+if TYPE_CHECKING:
+    from docuisine.core.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationBus(ABC):
+    """
+    Channel telling the caches of other workers which entries a write made stale.
+
+    Every `Cache` with a per-worker backend registers itself, and publishes
+    each ``delete`` and ``clear`` it performs. The bus then evicts the same
+    entries from the caches of that namespace everywhere else, without
+    publishing them again.
+    """
+
+    def __init__(self) -> None:
+        self._caches: defaultdict[str, list["Cache"]] = defaultdict(list)
+
+    def register(self, cache: "Cache") -> None:
+        """Receive the invalidations published for the namespace of ``cache``."""
+        self._caches[cache.namespace].append(cache)
+
+    async def start(self) -> None:
+        """Start receiving invalidations from other workers."""
+
+    async def stop(self) -> None:
+        """Stop receiving invalidations and release the bus's connections."""
+
+    @abstractmethod
+    async def publish(self, origin: "Cache", key: Optional[str]) -> None:
+        """
+        Evict an entry, or a whole namespace, from every other cache.
+
+        Parameters
+        ----------
+        origin : Cache
+            The cache that was invalidated. It is not evicted again.
+        key : Optional[str]
+            The key that was deleted, or ``None`` if the namespace was cleared.
+        """
+
+    async def _evict(
+        self, namespace: str, key: Optional[str], origin: Optional["Cache"] = None
+    ) -> None:
+        for cache in self._caches.get(namespace, []):
+            if cache is not origin:
+                await cache.evict_locally(key)
+
+
+class LocalInvalidationBus(InvalidationBus):
+    """
+    Bus delivering invalidations to the caches of the current process only.
+
+    Enough for a single worker. With several workers, each keeps serving its
+    own stale entries until they expire.
+    """
+
+    async def publish(self, origin: "Cache", key: Optional[str]) -> None:
+        await self._evict(origin.namespace, key, origin)
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """
+    Bus delivering invalidations to every worker through Postgres ``LISTEN/NOTIFY``.
+
+    Each worker listens on ``channel`` with a dedicated connection and
+    publishes with ``pg_notify`` on another one, so invalidations reach the
+    other workers as soon as the write is committed. A worker whose listening
+    connection drops clears all of its caches once it reconnects, since it
+    may have missed invalidations in the meantime.
+
+    Parameters
+    ----------
+    dsn : str
+        The ``postgresql://`` URL of the database.
+    channel : str
+        The notification channel. Default is ``"docuisine_cache"``.
+    """
+
+    MAX_PAYLOAD_SIZE = 7999
+    """Notification payloads must be shorter than 8000 bytes."""
+
+    RECONNECT_DELAY = 1.0
+    """Seconds between attempts to reconnect the listening connection."""
+
+    def __init__(self, dsn: str, channel: str = "docuisine_cache") -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._listener: Optional[asyncpg.Connection] = None
+        self._publisher: Optional[asyncpg.Connection] = None
+        self._publish_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stopped = False
+
+    async def start(self) -> None:
+        self._stopped = False
+        await self._listen()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        for task in list(self._tasks):
+            task.cancel()
+        for connection in (self._listener, self._publisher):
+            if connection is not None and not connection.is_closed():
+                await connection.close()
+        self._listener = self._publisher = None
+
+    async def publish(self, origin: "Cache", key: Optional[str]) -> None:
+        await self._evict(origin.namespace, key, origin)
+        payload = self._payload(origin.namespace, key)
+        if len(payload.encode()) > self.MAX_PAYLOAD_SIZE:
+            payload = self._payload(origin.namespace, None)
+        try:
+            async with self._publish_lock:
+                if self._publisher is None or self._publisher.is_closed():
+                    self._publisher = await asyncpg.connect(self.dsn)
+                await self._publisher.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            logger.warning("Cache invalidation of %s was not published: %s", origin.namespace, e)
+
+    def _payload(self, namespace: str, key: Optional[str]) -> str:
+        return json.dumps({"origin": self.origin, "namespace": namespace, "key": key})
+
+    async def _listen(self) -> None:
+        self._listener = await asyncpg.connect(self.dsn)
+        self._listener.add_termination_listener(self._on_termination)
+        await self._listener.add_listener(self.channel, self._on_notification)
+
+    def _spawn(self, coroutine: Any) -> None:
+        # The event loop only keeps weak references to its tasks.
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            message = json.loads(payload)
+            if message["origin"] == self.origin:
+                return
+            self._spawn(self._evict(message["namespace"], message["key"]))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed cache invalidation %r: %s", payload, e)
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        if not self._stopped:
+            logger.warning("Cache invalidation listener disconnected, reconnecting")
+            self._spawn(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._stopped:
+            try:
+                await self._listen()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning("Cache invalidation listener could not reconnect: %s", e)
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+            for namespace in list(self._caches):
+                await self._evict(namespace, None)
+            return
+
+
+def create_invalidation_bus(kind: str, database_url: str) -> InvalidationBus:
+    """
+    Create the invalidation bus of a kind.
+
+    Parameters
+    ----------
+    kind : str
+        ``"local"`` for a single process, or ``"postgres"`` to notify every
+        worker connected to the same Postgres database.
+    database_url : str
+        The SQLAlchemy URL of the database, e.g. ``postgresql+psycopg2://...``.
+
+    Returns
+    -------
+    InvalidationBus
+        The bus of that kind. It receives nothing until it is started.
+
+    Raises
+    ------
+    ValueError
+        If the kind is unknown, or ``"postgres"`` is used with another database.
+    """
+    if kind == "local":
+        return LocalInvalidationBus()
+    if kind == "postgres":
+        url = make_url(database_url)
+        if url.get_backend_name() != "postgresql":
+            raise ValueError("Postgres cache invalidation needs a PostgreSQL DATABASE_URL.")
+        return PostgresInvalidationBus(
+            url.set(drivername="postgresql").render_as_string(hide_password=False)
+        )
+    raise ValueError(f"Unsupported cache invalidation: {kind}")
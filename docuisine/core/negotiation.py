@@ -0,0 +1,136 @@
+from contextvars import ContextVar
+from typing import Optional
+
+from pydantic import BaseModel, RootModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import ormsgpack
+except ImportError:  # MessagePack responses are optional
+    ormsgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = frozenset(
+    {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+"""Names clients use for MessagePack in ``Accept``. Responses use `MSGPACK_MEDIA_TYPE`."""
+
+response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+"""The media type negotiated for the current request, set by `ContentNegotiationMiddleware`."""
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Choose between a JSON and a MessagePack response from the request's ``Accept``.
+
+    Parameters
+    ----------
+    accept : Optional[str]
+        The request's ``Accept`` header, e.g. ``"application/msgpack, */*;q=0.1"``.
+
+    Returns
+    -------
+    str
+        `MSGPACK_MEDIA_TYPE` if the client names MessagePack with a weight at
+        least that of JSON, otherwise `JSON_MEDIA_TYPE`. Wildcards only count
+        towards JSON, so clients that do not ask for MessagePack never get it.
+    """
+    if not accept or ormsgpack is None:
+        return JSON_MEDIA_TYPE
+    msgpack_weight = json_weight = 0.0
+    for media_range in accept.split(","):
+        name, _, params = media_range.partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name in MSGPACK_MEDIA_TYPES:
+            msgpack_weight = max(msgpack_weight, weight)
+        elif name in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_weight = max(json_weight, weight)
+    return (
+        MSGPACK_MEDIA_TYPE
+        if msgpack_weight > 0 and msgpack_weight >= json_weight
+        else JSON_MEDIA_TYPE
+    )
+
+
+def encode_model(content: BaseModel, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """
+    Encode a validated model as JSON or MessagePack.
+
+    Both encodings are produced from the model's fields by compiled code,
+    without building intermediate dicts. MessagePack encodes datetimes as
+    RFC 3339 strings, like JSON, and a ``RootModel`` as its root value.
+
+    Parameters
+    ----------
+    content : BaseModel
+        The model to encode, e.g. a ``*Out`` schema or a ``Page`` of them.
+    media_type : str
+        `JSON_MEDIA_TYPE` or `MSGPACK_MEDIA_TYPE`. Default is JSON.
+
+    Returns
+    -------
+    bytes
+        The encoded body.
+
+    Raises
+    ------
+    ImportError
+        If MessagePack is requested but the ``ormsgpack`` package is not installed.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        if ormsgpack is None:
+            raise ImportError("The ormsgpack package is required for MessagePack responses.")
+        if isinstance(content, RootModel):
+            content = content.root
+        return ormsgpack.packb(content, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+    return content.__pydantic_serializer__.to_json(content, by_alias=True)
+
+
+class ContentNegotiationMiddleware:
+    """
+    ASGI middleware that negotiates the media type of model responses.
+
+    It stores the media type chosen by `negotiate_media_type` in
+    `response_media_type` for the duration of the request, where
+    `ModelResponse` and the response cache read it. Responses in either media
+    type, and ``304 Not Modified`` responses, get ``Vary: Accept``. It does
+    nothing if ``ormsgpack`` is not installed, so every response is JSON.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The application to wrap.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or ormsgpack is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = response_media_type.set(negotiate_media_type(Headers(scope=scope).get("accept")))
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message.setdefault("headers", []))
+                media_type = headers.get("content-type", "").partition(";")[0].strip()
+                if message["status"] == 304 or media_type in (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE):
+                    headers.add_vary_header("Accept")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_vary)
+        finally:
+            response_media_type.reset(token)
@@ -0,0 +1,113 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+VARY_HEADERS = (
+    b"authorization",
+    b"cookie",
+    b"accept",
+    b"accept-encoding",
+    b"if-none-match",
+    b"x-read-primary",
+)
+"""Request headers that can change a response, and so are part of the coalescing key."""
+
+
+@dataclass(frozen=True)
+class _RecordedResponse:
+    start: Message
+    body: bytes
+
+
+class SingleFlightMiddleware:
+    """
+    ASGI middleware that runs concurrent identical GET requests only once.
+
+    Requests with the same path, query string and `VARY_HEADERS` (including
+    the ``Authorization`` header, so clients only share responses within their
+    own auth scope) that arrive while one of them is being handled wait for it
+    and receive a copy of its response, instead of each querying the database.
+
+    The first request streams its response to its client as usual while
+    recording it. Responses larger than ``max_body_size`` bytes, responses
+    setting cookies and requests that fail are not shared: the waiting
+    requests then run on their own.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The application to wrap.
+    max_body_size : int
+        The largest response body in bytes that is recorded and shared. A size
+        of 0 disables coalescing.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+        self._in_flight: dict[tuple, asyncio.Future[Optional[_RecordedResponse]]] = {}
+
+    @staticmethod
+    def _key(scope: Scope) -> tuple:
+        headers = dict(scope["headers"])
+        return (
+            scope["path"],
+            scope["query_string"],
+            tuple(headers.get(name) for name in VARY_HEADERS),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or self.max_body_size <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        key = self._key(scope)
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            # Shielded, so a follower whose client disconnects does not cancel the others.
+            recorded = await asyncio.shield(leader)
+            if recorded is None:
+                await self.app(scope, receive, send)
+            else:
+                # Outer middlewares may rewrite the headers, so each follower gets a copy.
+                await send({**recorded.start, "headers": list(recorded.start["headers"])})
+                await send({"type": "http.response.body", "body": recorded.body})
+            return
+
+        future: asyncio.Future[Optional[_RecordedResponse]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        start: Optional[Message] = None
+        chunks: list[bytes] = []
+        size = 0
+        shareable = True
+        complete = False
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal start, size, shareable, complete
+            if message["type"] == "http.response.start":
+                start = {**message, "headers": list(message.get("headers", []))}
+                if any(name.lower() == b"set-cookie" for name, _ in message.get("headers", [])):
+                    shareable = False
+            elif message["type"] == "http.response.body" and shareable:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.max_body_size:
+                    shareable = False
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            del self._in_flight[key]
+            if shareable and complete and start is not None:
+                future.set_result(_RecordedResponse(start=start, body=b"".join(chunks)))
+            else:
+                future.set_result(None)
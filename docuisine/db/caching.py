@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from docuisine.core.cache import Cache
+from docuisine.db.models.base import Base
+from docuisine.db.routing import reading_primary, reads_replica
+from docuisine.utils.pagination import KeysetPage
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """The loaded columns of the rows of a cached result."""
+
+    model: Optional[type[Base]]
+    rows: tuple[tuple[tuple[str, Any], ...], ...]
+    page: bool
+    next: Optional[str] = None
+
+
+def _columns(instance: Base) -> tuple[tuple[str, Any], ...]:
+    state = inspect(instance)
+    return tuple(
+        (key, state.dict[key]) for key in state.mapper.column_attrs.keys() if key in state.dict
+    )
+
+
+def _freeze(result: Any) -> Any:
+    """
+    Copy the loaded columns of a result's model instances into a `_Snapshot`.
+
+    Results other than a model instance or a `KeysetPage` are cached as they are.
+    """
+    if isinstance(result, Base):
+        return _Snapshot(type(result), (_columns(result),), page=False)
+    if isinstance(result, KeysetPage):
+        model = type(result.items[0]) if result.items else None
+        rows = tuple(_columns(item) for item in result.items)
+        return _Snapshot(model, rows, page=True, next=result.next)
+    return result
+
+
+def _thaw(cached: Any) -> Any:
+    """
+    Build new model instances from a `_Snapshot`, detached from any session.
+
+    Columns that were not loaded stay unloaded, and relationships cannot be lazy-loaded.
+    """
+    if not isinstance(cached, _Snapshot):
+        return cached
+    instances = []
+    for row in cached.rows:
+        instance = cached.model(**dict(row))  # type: ignore[misc]
+        make_transient_to_detached(instance)
+        instances.append(instance)
+    if cached.page:
+        return KeysetPage(items=instances, next=cached.next)
+    return instances[0]
+
+
+def cached_read(
+    method: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Cache the results of a read-only service method.
+
+    The decorated method must belong to a service with ``db_session`` and
+    ``cache`` attributes. Results are cached per method and arguments, whose
+    ``repr`` must identify them, and the method runs normally when ``cache``
+    is ``None``. Only the loaded columns of model instances are cached, and
+    every hit returns new detached instances, so no instance is shared
+    between requests. A result is not stored if a write started while it
+    was read (see `invalidates_cache`).
+    """
+
+    @wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        service: Any = args[0]
+        cache: Optional[Cache] = service.cache
+        if cache is None:
+            return await method(*args, **kwargs)
+
+        key = f"{wrapper.__name__}:{args[1:]!r}:{sorted(kwargs.items())!r}"
+        cached = await cache.get(key)
+        if cached is not None:
+            return _thaw(cached)
+        generation = await cache.generation()
+        result = await method(*args, **kwargs)
+        if generation is not None:
+            await cache.set(key, _freeze(result), generation=generation)
+        return result
+
+    return wrapper
+
+
+def invalidates_cache(
+    method: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Clear the service's ``cache`` once a write method succeeds.
+
+    Writes are rare compared to reads, so the whole cache is cleared instead
+    of tracking which cached pages contain the written row. With a shared
+    backend the cache is cleared for every worker. The cache's generation is
+    bumped before the write, so reads in flight cannot store rows read before
+    the write once the cache is cleared.
+    """
+
+    @wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        service: Any = args[0]
+        cache: Optional[Cache] = service.cache
+        if cache is not None:
+            await cache.bump_generation()
+        result = await method(*args, **kwargs)
+        if cache is not None:
+            await cache.clear()
+        return result
+
+    return wrapper
+
+
+async def load_unless_missing(
+    cache: Optional[Cache],
+    kind: str,
+    name: str,
+    session: AsyncSession,
+    load: Callable[[], Awaitable[Optional[R]]],
+) -> Optional[R]:
+    """
+    Look up the row of ``name``, unless a recent lookup found nothing.
+
+    A miss is cached for the cache's short TTL with the generation taken
+    before the lookup, so it is not stored if `forget_missing` ran in the
+    meantime. A miss read on the read replica is looked up again on the
+    primary before it is cached, since the replica may lag behind an insert.
+
+    Parameters
+    ----------
+    cache : Optional[Cache]
+        The cache of not-found lookups. ``None`` disables it.
+    kind : str
+        The kind of name, e.g. ``"categories"``, so names of different kinds do not clash.
+    name : str
+        The name to look up.
+    session : AsyncSession
+        The session ``load`` reads from.
+    load : Callable[[], Awaitable[Optional[R]]]
+        Reads the row of ``name`` from the database.
+
+    Returns
+    -------
+    Optional[R]
+        The row, or ``None`` if it is missing.
+    """
+    if cache is None:
+        return await load()
+    key = f"{kind}:{name}"
+    if await cache.get(key) is not None:
+        return None
+    generation = await cache.generation()
+    result = await load()
+    if result is None and reads_replica(session.sync_session):
+        with reading_primary(session.sync_session):
+            result = await load()
+    if result is None and generation is not None:
+        await cache.set(key, True, generation=generation)
+    return result
+
+
+async def forget_missing(cache: Optional[Cache], kind: str, name: str) -> None:
+    """
+    Drop the not-found entry of ``name`` once a write may have inserted it.
+
+    Only the entry of that name is removed, so other cached misses survive
+    unrelated writes. Deleting it moves the cache's generation on, so a
+    lookup in flight cannot cache its miss afterwards.
+    """
+    if cache is not None:
+        await cache.delete(f"{kind}:{name}")
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+import logging
+from typing import Optional, Sequence
+
+from sqlalchemy import Connection, MetaData, inspect
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexAudit:
+    """
+    Differences between the declared indexes and columns and the live database schema.
+
+    Attributes
+    ----------
+    missing_columns : list[str]
+        Columns declared on the models that do not exist in the database, as
+        ``table.column``. ``create_all`` does not add columns to tables that
+        already exist, and every query selecting them fails, so these have to
+        be added by a migration from ``scripts/migrations``.
+    missing_indexes : list[str]
+        Indexes declared on the models that do not exist in the database,
+        as ``table.index_name``. ``create_all`` does not add indexes to tables
+        that already exist, so these have to be created by hand or by a migration.
+    unindexed_foreign_keys : list[str]
+        Foreign keys whose columns are not the leading columns of any index,
+        primary key or unique constraint in the database, as ``table(columns)``.
+        Lookups and cascades through these columns scan the whole table.
+    """
+
+    missing_columns: list[str] = field(default_factory=list)
+    missing_indexes: list[str] = field(default_factory=list)
+    unindexed_foreign_keys: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return (
+            not self.missing_columns
+            and not self.missing_indexes
+            and not self.unindexed_foreign_keys
+        )
+
+
+def _is_covered(columns: Sequence[str], indexed: list[list[Optional[str]]]) -> bool:
+    """Check whether ``columns`` are the leading columns of one of the ``indexed`` column lists."""
+    return any(index[: len(columns)] == list(columns) for index in indexed)
+
+
+def audit_indexes(connection: Connection, metadata: MetaData) -> IndexAudit:
+    """
+    Compare the columns and indexes declared on ``metadata`` against the live schema.
+
+    Parameters
+    ----------
+    connection : Connection
+        A synchronous connection, e.g. from ``AsyncConnection.run_sync``.
+    metadata : MetaData
+        The declared schema, usually ``Base.metadata``.
+
+    Returns
+    -------
+    IndexAudit
+        The declared columns and indexes missing from the database and the
+        foreign keys without a supporting index. Tables that do not exist yet
+        are skipped.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    audit = IndexAudit()
+
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        live_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in live_columns:
+                audit.missing_columns.append(f"{table.name}.{column.name}")
+
+        live_indexes = inspector.get_indexes(table.name)
+        live_names = {index["name"] for index in live_indexes}
+        # Expression indexes report ``None`` for the columns they do not name.
+        indexed: list[list[Optional[str]]] = [
+            list(index["column_names"]) for index in live_indexes
+        ]
+        indexed.append(list(inspector.get_pk_constraint(table.name)["constrained_columns"]))
+        indexed.extend(
+            list(constraint["column_names"])
+            for constraint in inspector.get_unique_constraints(table.name)
+        )
+
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            if index.name not in live_names:
+                audit.missing_indexes.append(f"{table.name}.{index.name}")
+
+        for foreign_key in inspector.get_foreign_keys(table.name):
+            columns = foreign_key["constrained_columns"]
+            if not _is_covered(columns, indexed):
+                audit.unindexed_foreign_keys.append(f"{table.name}({', '.join(columns)})")
+
+    return audit
+
+
+def log_index_audit(connection: Connection, metadata: MetaData) -> IndexAudit:
+    """
+    Run `audit_indexes` and log every problem it finds: missing columns as
+    errors, since queries selecting them fail, and the rest as warnings.
+
+    Returns
+    -------
+    IndexAudit
+        The result of the audit.
+    """
+    audit = audit_indexes(connection, metadata)
+    for name in audit.missing_columns:
+        logger.error(
+            "Declared column %s does not exist in the database. "
+            "Apply the migrations in scripts/migrations.",
+            name,
+        )
+    for name in audit.missing_indexes:
+        logger.warning("Declared index %s does not exist in the database.", name)
+    for name in audit.unindexed_foreign_keys:
+        logger.warning("Foreign key %s has no supporting index.", name)
+    return audit
+
+
+if __name__ == "__main__":
+    from docuisine.db.database import engine
+    from docuisine.db.models import Base
+
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    with engine.connect() as connection:
+        result = log_index_audit(connection, Base.metadata)
+    raise SystemExit(0 if result.ok else 1)
@@ -1,28 +1,40 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
-    pass
+    """
+    Declarative base of all models.
+
+    ``eager_defaults`` fetches server-generated columns with ``RETURNING``
+    as part of the INSERT/UPDATE, so a flushed object is fully loaded
+    without a follow-up SELECT.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class Default:
     """
     Default model with common attributes.
 
+    Both timestamps are generated by the database and read back through
+    ``RETURNING`` (see `Base`).
+
     Attributes:
         created_at (datetime): Timestamp when the record was created.
-        updated_at (datetime): Timestamp when the record was last updated.
+        updated_at (datetime): Timestamp when the record was last updated. Also set by
+            bulk ``UPDATE`` statements that do not assign it.
     """
 
-    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -33,8 +33,17 @@ class Ingredient(Base, Entity):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(nullable=True)
-    recipe_id: Mapped[Optional[int]] = mapped_column(ForeignKey("recipes.id"), nullable=True)
+    recipe_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("recipes.id", ondelete="SET NULL"), nullable=True, index=True
+    )
 
     recipe = relationship("Recipe", back_populates="product")
-    recipes = relationship("Recipe", secondary="recipe_ingredients", back_populates="ingredients")
-    stores = relationship("Store", secondary="shelves", back_populates="ingredients")
+    recipes = relationship(
+        "Recipe",
+        secondary="recipe_ingredients",
+        back_populates="ingredients",
+        passive_deletes=True,
+    )
+    stores = relationship(
+        "Store", secondary="shelves", back_populates="ingredients", passive_deletes=True
+    )
@@ -32,8 +32,8 @@ class Recipe(Base, Entity):
     __tablename__ = "recipes"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    name: Mapped[str] = mapped_column(nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(nullable=False, index=True)
     cook_time_sec: Mapped[int] = mapped_column(nullable=True)
     prep_time_sec: Mapped[int] = mapped_column(nullable=True)
     non_blocking_time_sec: Mapped[int] = mapped_column(nullable=True)
@@ -41,14 +41,22 @@ class Recipe(Base, Entity):
     description: Mapped[str] = mapped_column(nullable=True)
 
     creator = relationship("User", back_populates="recipes")
-    steps = relationship("RecipeStep", back_populates="recipe", cascade="all, delete-orphan")
+    steps = relationship(
+        "RecipeStep", back_populates="recipe", cascade="all, delete-orphan", passive_deletes=True
+    )
     ingredients = relationship(
-        "Ingredient", secondary="recipe_ingredients", back_populates="recipes"
+        "Ingredient",
+        secondary="recipe_ingredients",
+        back_populates="recipes",
+        passive_deletes=True,
+    )
+    categories = relationship(
+        "Category", secondary="recipe_categories", back_populates="recipes", passive_deletes=True
     )
-    categories = relationship("Category", secondary="recipe_categories", back_populates="recipes")
     product = relationship(
         "Ingredient",
         back_populates="recipe",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -75,7 +83,9 @@ class RecipeStep(Base, Entity):
 
     __tablename__ = "recipe_steps"
 
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
     step_number: Mapped[int] = mapped_column(nullable=False, primary_key=True)
     description: Mapped[str] = mapped_column(nullable=False)
 
@@ -102,8 +112,12 @@ class RecipeIngredient(Base, Entity):
 
     __tablename__ = "recipe_ingredients"
 
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
-    ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
     amount_grams: Mapped[int] = mapped_column(nullable=False)
     amount_readable: Mapped[str] = mapped_column(nullable=False)
 
@@ -120,5 +134,9 @@ class RecipeCategory(Base, Entity):
     """
 
     __tablename__ = "recipe_categories"
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
@@ -35,7 +35,7 @@ class Store(Base, Entity):
     __tablename__ = "stores"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False, index=True)
     longitude: Mapped[Optional[float]] = mapped_column(nullable=True)
     latitude: Mapped[Optional[float]] = mapped_column(nullable=True)
     address: Mapped[str] = mapped_column(nullable=False)
@@ -43,7 +43,9 @@ class Store(Base, Entity):
     website: Mapped[Optional[str]] = mapped_column(nullable=True)
     description: Mapped[Optional[str]] = mapped_column(nullable=True)
 
-    ingredients = relationship("Ingredient", secondary="shelves", back_populates="stores")
+    ingredients = relationship(
+        "Ingredient", secondary="shelves", back_populates="stores", passive_deletes=True
+    )
 
     __table_args__ = (
         CheckConstraint("longitude >= -180 AND longitude <= 180", name="longitude_range_check"),
@@ -67,8 +69,12 @@ class Shelf(Base, Entity):
 
     __tablename__ = "shelves"
 
-    store_id: Mapped[int] = mapped_column(ForeignKey("stores.id"), primary_key=True)
-    ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.id"), primary_key=True)
+    store_id: Mapped[int] = mapped_column(
+        ForeignKey("stores.id", ondelete="CASCADE"), primary_key=True
+    )
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
     quantity: Mapped[int] = mapped_column(nullable=False)
 
     __table_args__ = (CheckConstraint("quantity >= 0", name="shelf_quantity_non_negative"),)
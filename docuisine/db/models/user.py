@@ -23,6 +23,9 @@ class User(Base, Entity):
         Hashed password of the user.
     role : str
         Role of the user in the system (e.g., ``admin``, ``user``).
+    token_version : int
+        Version of the user's access tokens. Bumping it revokes every token
+        issued before.
     recipes : list[Recipe]
         Recipes created by the user.
     """
@@ -34,5 +37,6 @@ class User(Base, Entity):
     email: Mapped[Optional[str]] = mapped_column(unique=True, nullable=True)
     password: Mapped[str]
     role: Mapped[str] = mapped_column(nullable=False, default=Role.USER.value)
+    token_version: Mapped[int] = mapped_column(nullable=False, default=1)
 
     recipes = relationship("Recipe", back_populates="creator")
@@ -0,0 +1,121 @@
+from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass
+class PoolWaitStats:
+    """
+    Counters describing how long checkouts waited for a free connection.
+
+    Attributes
+    ----------
+    waits : int
+        Number of checkouts that found the pool and its overflow exhausted
+        and had to wait for a connection to be returned.
+    timeouts : int
+        Number of waiting checkouts that gave up after ``pool_timeout`` seconds.
+    wait_time_total : float
+        Total seconds spent waiting, across all waiting checkouts.
+    wait_time_max : float
+        Longest single wait in seconds.
+    """
+
+    waits: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+
+if TYPE_CHECKING:
+    # The mixin relies on the internals of the ``QueuePool`` it is mixed into.
+    _QueuePoolBase = QueuePool
+else:
+    _QueuePoolBase = object
+
+
+class TimedPoolMixin(_QueuePoolBase):
+    """
+    Record wait-time counters for a ``QueuePool`` based connection pool.
+
+    Only checkouts that start while every pooled and overflow connection is
+    in use are counted, so the counters stay at zero for a correctly sized pool.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+        self._wait_stats_lock = threading.Lock()
+
+    def _do_get(self):
+        must_wait = (
+            self._max_overflow > -1 and self._overflow >= self._max_overflow and self._pool.empty()
+        )
+        if not must_wait:
+            return super()._do_get()
+
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._wait_stats_lock:
+                self.wait_stats.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_stats_lock:
+                self.wait_stats.waits += 1
+                self.wait_stats.wait_time_total += waited
+                self.wait_stats.wait_time_max = max(self.wait_stats.wait_time_max, waited)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """``QueuePool`` that records wait-time counters."""
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records wait-time counters."""
+
+
+def get_pool_stats(pool: Pool) -> dict[str, Any]:
+    """
+    Collect a snapshot of a connection pool's usage.
+
+    Parameters
+    ----------
+    pool : Pool
+        The connection pool of an engine, e.g. ``async_engine.pool``.
+
+    Returns
+    -------
+    dict[str, Any]
+        The pool class name, its size limits, the number of checked out,
+        idle and overflow connections and the wait-time counters. Values
+        that the pool class does not track are ``None``.
+    """
+    stats: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "size": None,
+        "max_overflow": None,
+        "timeout": None,
+        "checked_out": None,
+        "idle": None,
+        "overflow": None,
+        **{field: None for field in PoolWaitStats.__dataclass_fields__},
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, TimedPoolMixin):
+        stats.update(asdict(pool.wait_stats))
+    return stats
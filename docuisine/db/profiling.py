@@ -0,0 +1,159 @@
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+QUERY_TIME_HEADER = "X-Query-Time-Ms"
+_START_TIME = "query_start_time"
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements issued while handling a single request.
+
+    Attributes
+    ----------
+    count : int
+        Number of statements sent to the database.
+    duration : float
+        Total seconds spent executing them.
+    statements : Counter[str]
+        How often each statement shape was executed. Parameters are bound
+        separately, so the same query with different values has one shape.
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """
+        Get the statement shapes executed at least ``threshold`` times.
+
+        Many executions of one shape in a single request usually mean an
+        N+1 pattern, e.g. lazy-loading a relationship inside a loop.
+        """
+        return {
+            statement: count for statement, count in self.statements.items() if count >= threshold
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_TIME, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info[_START_TIME].pop()
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started
+    stats.statements[statement] += 1
+
+
+def install_query_counter(engine: Engine) -> None:
+    """
+    Count the statements an engine executes for the current request.
+
+    Parameters
+    ----------
+    engine : Engine
+        A synchronous engine. For an ``AsyncEngine`` pass its ``sync_engine``.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_tracking() -> QueryStats:
+    """Start counting statements in the current context and return the counters."""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+class QueryCounterMiddleware:
+    """
+    ASGI middleware that counts the SQL statements issued by each request.
+
+    Requests issuing more than ``max_queries`` statements are logged, and so
+    is every statement shape executed at least ``repeat_threshold`` times.
+    When ``expose_headers`` is set, the statement count and the total
+    database time in milliseconds are sent in the ``X-Query-Count`` and
+    ``X-Query-Time-Ms`` response headers.
+
+    The headers are written with the first response message, so a
+    streaming response only reports the statements issued before it
+    started streaming. The log check runs once the response has finished.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_queries: int,
+        repeat_threshold: int,
+        expose_headers: bool = False,
+    ) -> None:
+        self.app = app
+        self.max_queries = max_queries
+        self.repeat_threshold = repeat_threshold
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_tracking()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                headers.append(
+                    (QUERY_TIME_HEADER.lower().encode(), f"{stats.duration * 1000:.2f}".encode())
+                )
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            self.report(scope, stats)
+
+    def report(self, scope: Scope, stats: QueryStats) -> None:
+        """Log the request if it issued too many statements or repeated statement shapes."""
+        request = f"{scope.get('method', '')} {scope.get('path', '')}"
+        if stats.count > self.max_queries:
+            logger.warning(
+                "%s issued %d SQL statements in %.2f ms (threshold %d).",
+                request,
+                stats.count,
+                stats.duration * 1000,
+                self.max_queries,
+            )
+        for statement, count in stats.repeated(self.repeat_threshold).items():
+            logger.warning(
+                "%s executed the same statement %d times, likely an N+1 query: %s",
+                request,
+                count,
+                " ".join(statement.split()),
+            )
+
+
+def get_current_stats() -> Optional[QueryStats]:
+    """Get the statement counters of the current request, if any are being tracked."""
+    return _current_stats.get()
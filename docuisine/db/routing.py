@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+from functools import wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generator,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+USE_REPLICA = "use_replica"
+HAS_WRITTEN = "has_written"
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a read replica and everything else to the primary.
+
+    Reads only go to the replica while ``info["use_replica"]`` is set, which
+    is done by the `replica_read` decorator on read-only service methods.
+    As soon as the session writes (a flush or an INSERT/UPDATE/DELETE
+    statement), it sticks to the primary for the rest of its lifetime, so a
+    request always reads its own writes. Writes are recorded in
+    ``info["has_written"]`` by the session's ``before_flush`` and
+    ``do_orm_execute`` events, before the statements are bound.
+
+    Attributes
+    ----------
+    replica : Optional[Engine]
+        The synchronous engine of the read replica. When ``None`` every
+        statement goes to the session's own bind.
+    """
+
+    replica: ClassVar[Optional[Engine]] = None
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        if (
+            self.replica is not None
+            and self.info.get(USE_REPLICA)
+            and not self.info.get(HAS_WRITTEN)
+        ):
+            return self.replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _flush_writes(session: Session, *args: Any) -> None:
+    session.info[HAS_WRITTEN] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[HAS_WRITTEN] = True
+
+
+def replica_read(
+    method: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Run a read-only service method against the read replica.
+
+    The decorated method must belong to a service with a ``db_session``
+    attribute. Sessions that already wrote keep reading from the primary.
+    """
+
+    @wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        service: Any = args[0]
+        info = service.db_session.info
+        previous = info.get(USE_REPLICA, False)
+        info[USE_REPLICA] = True
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            info[USE_REPLICA] = previous
+
+    return wrapper
+
+
+def reads_replica(session: Session) -> bool:
+    """Check whether the next read of a session goes to the read replica."""
+    return (
+        isinstance(session, RoutingSession)
+        and session.replica is not None
+        and bool(session.info.get(USE_REPLICA))
+        and not session.info.get(HAS_WRITTEN)
+    )
+
+
+@contextmanager
+def reading_primary(session: Session) -> Generator[None, None, None]:
+    """
+    Send the reads of a session to the primary inside the block, e.g. to confirm
+    that a row missing from the replica is missing from the primary too.
+    """
+    previous = session.info.get(USE_REPLICA, False)
+    session.info[USE_REPLICA] = False
+    try:
+        yield
+    finally:
+        session.info[USE_REPLICA] = previous
+
+
+def use_primary(session: Session) -> None:
+    """
+    Send every following statement of a session to the primary.
+
+    Use this when a request needs to read data written by another request
+    or worker that the replica may not have received yet. Requests ask for it
+    with the ``X-Read-Primary`` header (see `get_async_db_session`).
+    """
+    session.info[HAS_WRITTEN] = True
@@ -1,15 +1,15 @@
 import boto3
 from botocore import client
 
-from docuisine.core.config import env
+from docuisine.core.config import get_settings
 from docuisine.schemas.image import S3Config
 
 s3_config = S3Config(
-    endpoint_url=env.S3_ENDPOINT_URL,
-    access_key=env.S3_ACCESS_KEY,
-    secret_key=env.S3_SECRET_KEY,
-    bucket_name=env.S3_BUCKET_NAME,
-    region=env.S3_REGION,
+    endpoint_url=get_settings().S3_ENDPOINT_URL,
+    access_key=get_settings().S3_ACCESS_KEY,
+    secret_key=get_settings().S3_SECRET_KEY,
+    bucket_name=get_settings().S3_BUCKET_NAME,
+    region=get_settings().S3_REGION,
 )
 
 s3_storage: client.BaseClient = boto3.client(
@@ -1,5 +1,5 @@
 from .auth import AuthenticatedUser, AuthForm, AuthToken
-from .db import DB_Session
+from .db import Async_DB_Session, DB_Session
 from .services import (
     Category_Service,
     Image_Service,
@@ -8,12 +8,15 @@ from .services import (
     Store_Service,
     User_Service,
 )
+from .settings import App_Settings
 
 __all__ = [
+    "App_Settings",
     "AuthenticatedUser",
     "AuthForm",
     "AuthToken",
     "DB_Session",
+    "Async_DB_Session",
     "User_Service",
     "Category_Service",
     "Image_Service",
@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
-from docuisine.db.models import User
+from docuisine.schemas.auth import Principal
 from docuisine.utils import errors
 
 from .services import User_Service
@@ -15,9 +15,9 @@ AuthToken = Annotated[str, Depends(OAuth2_Scheme)]
 AuthForm = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
-async def get_client_user(token: AuthToken, user_service: User_Service):
+async def get_client_user(token: AuthToken, user_service: User_Service) -> Principal:
     try:
-        user = user_service.authorize_user(token=token)
+        user = await user_service.authorize_user(token=token)
     except errors.InvalidCredentialsError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -27,4 +27,4 @@ async def get_client_user(token: AuthToken, user_service: User_Service):
     return user
 
 
-AuthenticatedUser = Annotated[User, Depends(get_client_user)]
+AuthenticatedUser = Annotated[Principal, Depends(get_client_user)]
@@ -1,9 +1,12 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from docuisine.db.database import SessionLocal
+from docuisine.db.database import AsyncSessionLocal, SessionLocal
+from docuisine.db.routing import use_primary
+from docuisine.schemas.annotations import ReadPrimary
 
 
 def get_db_session():
@@ -14,4 +17,12 @@ def get_db_session():
         db.close()
 
 
+async def get_async_db_session(x_read_primary: ReadPrimary = False) -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        if x_read_primary:
+            use_primary(db.sync_session)
+        yield db
+
+
 DB_Session = Annotated[Session, Depends(get_db_session)]
+Async_DB_Session = Annotated[AsyncSession, Depends(get_async_db_session)]
@@ -3,49 +3,100 @@ from typing import Annotated
 from fastapi import Depends
 
 from docuisine import services
-from docuisine.core.config import env
-from docuisine.schemas.auth import JWTConfig
-from docuisine.schemas.enums import JWTAlgorithm
+from docuisine.core.cache import Cache, create_cache_backend
+from docuisine.core.config import get_settings
+from docuisine.core.invalidation import create_invalidation_bus
 
-from .db import DB_Session
+from .db import Async_DB_Session
+from .settings import App_Settings
 from .storage import S3_Client
 
+# Created at import, so a reload of the settings does not resize or move the caches.
+cache_backend = create_cache_backend(get_settings().CACHE_URL)
+invalidation_bus = create_invalidation_bus(
+    get_settings().CACHE_INVALIDATION, get_settings().DATABASE_URL
+)
+principal_cache = Cache(
+    cache_backend,
+    "principals",
+    maxsize=get_settings().AUTH_CACHE_SIZE,
+    ttl=get_settings().AUTH_CACHE_TTL,
+    bus=invalidation_bus,
+)
+category_cache = Cache(
+    cache_backend,
+    "categories",
+    maxsize=get_settings().READ_CACHE_SIZE,
+    ttl=get_settings().READ_CACHE_TTL,
+    bus=invalidation_bus,
+)
+ingredient_cache = Cache(
+    cache_backend,
+    "ingredients",
+    maxsize=get_settings().READ_CACHE_SIZE,
+    ttl=get_settings().READ_CACHE_TTL,
+    bus=invalidation_bus,
+)
+store_cache = Cache(
+    cache_backend,
+    "stores",
+    maxsize=get_settings().READ_CACHE_SIZE,
+    ttl=get_settings().READ_CACHE_TTL,
+    bus=invalidation_bus,
+)
+not_found_cache = Cache(
+    cache_backend,
+    "not_found",
+    maxsize=get_settings().NOT_FOUND_CACHE_SIZE,
+    ttl=get_settings().NOT_FOUND_CACHE_TTL,
+    bus=invalidation_bus,
+)
+
+# The caches of the application, by namespace, as reported by the admin API.
+caches: dict[str, Cache] = {
+    cache.namespace: cache
+    for cache in (principal_cache, category_cache, ingredient_cache, store_cache, not_found_cache)
+}
+
 
 def get_user_service(
-    db_session: DB_Session,
+    db_session: Async_DB_Session,
+    settings: App_Settings,
 ) -> services.UserService:
     return services.UserService(
         db_session,
-        jwt_config=JWTConfig(
-            secret_key=env.JWT_SECRET_KEY,
-            algorithm=JWTAlgorithm(value=env.JWT_ALGORITHM),
-            access_token_expire_minutes=env.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
-        ),
+        jwt_config=settings.jwt,
+        principal_cache=principal_cache,
+        not_found_cache=not_found_cache,
     )
 
 
 def get_category_service(
-    db_session: DB_Session,
+    db_session: Async_DB_Session,
 ) -> services.CategoryService:
-    return services.CategoryService(db_session)
+    return services.CategoryService(
+        db_session, cache=category_cache, not_found_cache=not_found_cache
+    )
 
 
 def get_ingredient_service(
-    db_session: DB_Session,
+    db_session: Async_DB_Session,
 ) -> services.IngredientService:
-    return services.IngredientService(db_session)
+    return services.IngredientService(
+        db_session, cache=ingredient_cache, not_found_cache=not_found_cache
+    )
 
 
 def get_store_service(
-    db_session: DB_Session,
+    db_session: Async_DB_Session,
 ) -> services.StoreService:
-    return services.StoreService(db_session)
+    return services.StoreService(db_session, cache=store_cache)
 
 
 def get_recipe_service(
-    db_session: DB_Session,
+    db_session: Async_DB_Session,
 ) -> services.RecipeService:
-    return services.RecipeService(db_session)
+    return services.RecipeService(db_session, ingredient_cache=ingredient_cache)
 
 
 def get_image_service(
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from docuisine.core.config import Settings, get_settings
+
+App_Settings = Annotated[Settings, Depends(get_settings)]
@@ -6,9 +6,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from docuisine import routes
-from docuisine.db.database import engine
+from docuisine.core.compression import CompressionMiddleware
+from docuisine.core.config import get_settings
+from docuisine.core.negotiation import ContentNegotiationMiddleware
+from docuisine.core.singleflight import SingleFlightMiddleware
+from docuisine.db.database import IS_PRODUCTION, async_engine, async_replica_engine, engine
+from docuisine.db.indexes import log_index_audit
 from docuisine.db.models.base import Base
+from docuisine.db.profiling import QueryCounterMiddleware, install_query_counter
 from docuisine.db.storage import s3_config, s3_storage
+from docuisine.dependencies.services import invalidation_bus
 
 ## Define S3 bucket policy to allow public read access to objects
 policy = {
@@ -32,31 +39,60 @@ async def on_startup(app: FastAPI):
     Notes
     -----
     This startup event runs when the application starts
-    It does two things:
+    It does four things:
     1. Creates all database tables based on the defined models
-    2. Ensures the S3 bucket for image storage exists with the correct policy
+    2. Reports declared columns and indexes missing from the database and unindexed foreign keys
+    3. Ensures the S3 bucket for image storage exists with the correct policy
+    4. Subscribes the worker's caches to invalidations published by other workers
     """
     try:
-        Base.metadata.create_all(bind=engine)
+        async with async_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.run_sync(log_index_audit, Base.metadata)
         try:
             s3_storage.head_bucket(Bucket=s3_config.bucket_name)
         except ClientError:
             s3_storage.create_bucket(Bucket=s3_config.bucket_name)
             s3_storage.put_bucket_policy(Bucket=s3_config.bucket_name, Policy=json.dumps(policy))
+        await invalidation_bus.start()
         yield
     finally:
-        # Dispose of the database engine when the application shuts down
-        if not callable(hasattr(engine, "dispose")):
-            raise RuntimeError(
-                "Database engine is not initialized. "
-                "This is likely because the provided DATABASE_URL is wrong."
-            )
-        else:
-            await engine.dispose()
+        await invalidation_bus.stop()
+        # Dispose of the database engines when the application shuts down
+        await async_engine.dispose()
+        if async_replica_engine is not None:
+            await async_replica_engine.dispose()
+        engine.dispose()
 
 
 app = FastAPI(lifespan=on_startup)
 
+install_query_counter(engine)
+install_query_counter(async_engine.sync_engine)
+if async_replica_engine is not None:
+    install_query_counter(async_replica_engine.sync_engine)
+
+app.add_middleware(ContentNegotiationMiddleware)
+
+# Inside the single-flight middleware, so coalesced requests share the compressed body.
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=get_settings().COMPRESSION_ENCODINGS,
+    min_size=get_settings().COMPRESSION_MIN_SIZE,
+    content_types=get_settings().COMPRESSION_CONTENT_TYPES,
+)
+
+app.add_middleware(
+    SingleFlightMiddleware,
+    max_body_size=get_settings().SINGLE_FLIGHT_MAX_BODY_SIZE,
+)
+
+app.add_middleware(
+    QueryCounterMiddleware,
+    max_queries=get_settings().DB_QUERY_COUNT_THRESHOLD,
+    repeat_threshold=get_settings().DB_QUERY_REPEAT_THRESHOLD,
+    expose_headers=not IS_PRODUCTION(),
+)
 
 app.add_middleware(
     CORSMiddleware,  # type: ignore
@@ -75,3 +111,4 @@ app.include_router(routes.ingredient.router)
 app.include_router(routes.recipe.router)
 app.include_router(routes.health.router)
 app.include_router(routes.image.router)
+app.include_router(routes.admin.router)
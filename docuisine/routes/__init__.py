@@ -1,3 +1,14 @@
-from . import auth, category, health, image, ingredient, recipe, root, store, user
+from . import admin, auth, category, health, image, ingredient, recipe, root, store, user
 
-__all__ = ["auth", "category", "health", "image", "ingredient", "recipe", "root", "store", "user"]
+__all__ = [
+    "admin",
+    "auth",
+    "category",
+    "health",
+    "image",
+    "ingredient",
+    "recipe",
+    "root",
+    "store",
+    "user",
+]
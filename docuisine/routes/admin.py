@@ -0,0 +1,70 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, status
+
+from docuisine.db.database import async_engine, async_replica_engine
+from docuisine.db.pool import get_pool_stats
+from docuisine.dependencies import AuthenticatedUser
+from docuisine.dependencies.services import caches
+from docuisine.schemas import admin as admin_schemas
+from docuisine.schemas.common import Detail
+from docuisine.utils.responses import ModelResponse
+from docuisine.utils.validation import validate_role
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get(
+    "/pool",
+    status_code=status.HTTP_200_OK,
+    response_model=admin_schemas.DatabasePools,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+    },
+)
+async def get_pool(authenticated_user: AuthenticatedUser) -> ModelResponse:
+    """
+    Get live statistics of the database connection pools, of the primary
+    and, if one is configured, of the read replica.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    replica = (
+        admin_schemas.PoolStats(**get_pool_stats(async_replica_engine.pool))
+        if async_replica_engine is not None
+        else None
+    )
+    return ModelResponse(
+        admin_schemas.DatabasePools(
+            primary=admin_schemas.PoolStats(**get_pool_stats(async_engine.pool)),
+            replica=replica,
+        )
+    )
+
+
+@router.get(
+    "/cache",
+    status_code=status.HTTP_200_OK,
+    response_model=admin_schemas.CachesStats,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+    },
+)
+async def get_cache(authenticated_user: AuthenticatedUser) -> ModelResponse:
+    """
+    Get the hit, miss and eviction counters of this worker's caches.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    return ModelResponse(
+        admin_schemas.CachesStats(
+            {
+                name: admin_schemas.CacheStats(**asdict(cache.stats()))
+                for name, cache in caches.items()
+            }
+        )
+    )
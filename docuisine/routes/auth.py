@@ -7,6 +7,7 @@ from docuisine.schemas import auth as auth_schemas
 from docuisine.schemas.common import Detail
 from docuisine.schemas.enums import TokenType
 from docuisine.utils import errors
+from docuisine.utils.responses import ModelResponse
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -22,14 +23,14 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
         status.HTTP_404_NOT_FOUND: {"model": Detail},
     },
 )
-async def login(form_data: AuthForm, user_service: User_Service) -> auth_schemas.Token:
+async def login(form_data: AuthForm, user_service: User_Service) -> ModelResponse:
     """
     Authenticate user and return an access token.
 
     Access Level: Public
     """
     try:
-        user = user_service.authenticate_user(
+        user = await user_service.authenticate_user(
             username=form_data.username, password=form_data.password
         )
     except errors.UserNotFoundError as e:
@@ -47,7 +48,9 @@ async def login(form_data: AuthForm, user_service: User_Service) -> auth_schemas
 
     if isinstance(user, User):
         access_token = user_service.create_access_token(user)
-        return auth_schemas.Token(access_token=access_token, token_type=TokenType.BEARER)
+        return ModelResponse(
+            auth_schemas.Token(access_token=access_token, token_type=TokenType.BEARER)
+        )
 
     raise HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
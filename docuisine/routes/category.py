@@ -1,51 +1,120 @@
 from typing import Optional
 
-from fastapi import APIRouter, Form, HTTPException, status
+from fastapi import APIRouter, Form, HTTPException, Request, Response, status
 
 from docuisine.db.models import Category
 from docuisine.dependencies import AuthenticatedUser, Category_Service, Image_Service
 from docuisine.schemas import category as category_schemas
-from docuisine.schemas.annotations import CategoryName, ImageUpload
-from docuisine.schemas.common import Detail
+from docuisine.schemas.annotations import (
+    CategoryName,
+    IfNoneMatch,
+    ImageUpload,
+    PageCursor,
+    PageLimit,
+    SortByName,
+    SparseFields,
+)
+from docuisine.schemas.common import Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.etag import (
+    entity_etag,
+    etag_matches,
+    negotiated_etag,
+    not_modified,
+    page_etag,
+)
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from docuisine.utils.responses import ModelResponse, cached_response
+from docuisine.utils.serialization import select_fields, sparse_schema, validate_list
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[category_schemas.CategoryOut])
-async def get_categories(category_service: Category_Service) -> list[category_schemas.CategoryOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[category_schemas.CategoryOut],
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+    },
+)
+async def get_categories(
+    request: Request,
+    category_service: Category_Service,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByName = "id",
+    fields: SparseFields = None,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
-    Get all categories.
+    Get a page of categories.
+
+    The encoded page is cached until the next write to categories.
 
     Access Level: Public
     """
-    categories: list[Category] = category_service.get_all_categories()
-    return [category_schemas.CategoryOut.model_validate(category) for category in categories]
+    try:
+        selected = select_fields(category_schemas.CategoryOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(category_schemas.CategoryOut, selected)
+
+    async def build() -> tuple[str, Page[category_schemas.CategoryOut]]:
+        try:
+            page: KeysetPage[Category] = await category_service.get_all_categories(
+                limit=limit, after=after, sort=sort, fields=selected
+            )
+        except errors.InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+        return page_etag(page, selected), Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        )
+
+    return await cached_response(
+        category_service.cache,
+        f"{request.url.path}:{limit}:{after}:{sort}:{selected}",
+        build,
+        if_none_match=if_none_match,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
 
 
 @router.get(
     "/{category_id}",
     status_code=status.HTTP_200_OK,
     response_model=category_schemas.CategoryOut,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+    },
 )
 async def get_category(
-    category_id: int, category_service: Category_Service
-) -> category_schemas.CategoryOut:
+    category_id: int,
+    category_service: Category_Service,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get a category by ID.
 
     Access Level: Public
     """
     try:
-        category: Category = category_service.get_category(category_id=category_id)
-        return category_schemas.CategoryOut.model_validate(category)
+        category: Category = await category_service.get_category(category_id=category_id)
     except errors.CategoryNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    etag = negotiated_etag(entity_etag(category))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return ModelResponse(
+        category_schemas.CategoryOut.model_validate(category), headers={"ETag": etag}
+    )
 
 
 @router.post(
@@ -65,7 +134,7 @@ async def create_category(
         description="The category description",
         examples=["Sweet dishes and treats"],
     ),
-) -> category_schemas.CategoryOut:
+) -> ModelResponse:
     """
     Create a new category.
 
@@ -76,13 +145,16 @@ async def create_category(
         image_set = image_service.upload_image(await image.read())
 
     try:
-        new_category: Category = category_service.create_category(
+        new_category: Category = await category_service.create_category(
             name=name,
             description=description,
             img=image_set.original if image is not None else None,
             preview_img=image_set.preview if image is not None else None,
         )
-        return category_schemas.CategoryOut.model_validate(new_category)
+        return ModelResponse(
+            category_schemas.CategoryOut.model_validate(new_category),
+            status_code=status.HTTP_201_CREATED,
+        )
     except errors.CategoryExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -104,7 +176,7 @@ async def update_category(
     category: category_schemas.CategoryUpdate,
     category_service: Category_Service,
     authenticated_user: AuthenticatedUser,
-) -> category_schemas.CategoryOut:
+) -> ModelResponse:
     """
     Update an existing category.
 
@@ -112,10 +184,10 @@ async def update_category(
     """
     validate_role(authenticated_user.role, "a")
     try:
-        updated_category: Category = category_service.update_category(
+        updated_category: Category = await category_service.update_category(
             category_id=category.id, name=category.name, description=category.description
         )
-        return category_schemas.CategoryOut.model_validate(updated_category)
+        return ModelResponse(category_schemas.CategoryOut.model_validate(updated_category))
     except errors.CategoryNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +208,7 @@ async def update_category(
 )
 async def delete_category(
     category_id: int, category_service: Category_Service, authenticated_user: AuthenticatedUser
-) -> Detail:
+) -> ModelResponse:
     """
     Delete a category by ID.
 
@@ -144,8 +216,8 @@ async def delete_category(
     """
     validate_role(authenticated_user.role, "a")
     try:
-        category_service.delete_category(category_id=category_id)
-        return Detail(detail=f"Category with ID {category_id} has been deleted.")
+        await category_service.delete_category(category_id=category_id)
+        return ModelResponse(Detail(detail=f"Category with ID {category_id} has been deleted."))
     except errors.CategoryNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,20 +1,23 @@
 from fastapi import APIRouter
 
-from docuisine.core.config import env
+from docuisine.dependencies import App_Settings
 from docuisine.schemas import health as health_schemas
+from docuisine.utils.responses import ModelResponse
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
 @router.get("/", response_model=health_schemas.HealthCheck)
-def health_check():
+def health_check(settings: App_Settings):
     """
     Health check endpoint.
 
     Access Level: Public
     """
-    return health_schemas.HealthCheck(
-        status=health_schemas.Status.HEALTHY,
-        commit_hash=env.COMMIT_HASH,
-        version=env.VERSION,
+    return ModelResponse(
+        health_schemas.HealthCheck(
+            status=health_schemas.Status.HEALTHY,
+            commit_hash=settings.COMMIT_HASH,
+            version=settings.VERSION,
+        )
     )
@@ -4,6 +4,7 @@ from docuisine.dependencies import AuthenticatedUser, Image_Service
 from docuisine.schemas import image as image_schemas
 from docuisine.schemas.annotations import ImageUpload
 from docuisine.schemas.common import Detail
+from docuisine.utils.responses import ModelResponse
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/image", tags=["Image"])
@@ -17,11 +18,11 @@ router = APIRouter(prefix="/image", tags=["Image"])
 )
 async def upload_image(
     authenticated_user: AuthenticatedUser, image_service: Image_Service, image: ImageUpload
-) -> image_schemas.ImageSet:
+) -> ModelResponse:
     """
     Upload images.
 
     Access Level: Admin
     """
     validate_role(authenticated_user.role, "a")
-    return image_service.upload_image(await image.read())
+    return ModelResponse(image_service.upload_image(await image.read()))
@@ -1,54 +1,140 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from docuisine.db.models import Ingredient
 from docuisine.dependencies import AuthenticatedUser, Ingredient_Service
 from docuisine.schemas import ingredient as ingredient_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.annotations import (
+    IfNoneMatch,
+    PageCursor,
+    PageLimit,
+    SortByName,
+    SparseFields,
+)
+from docuisine.schemas.common import Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.etag import (
+    entity_etag,
+    etag_matches,
+    negotiated_etag,
+    not_modified,
+    page_etag,
+)
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from docuisine.utils.responses import ModelResponse, cached_response
+from docuisine.utils.serialization import select_fields, sparse_schema, validate_list
+from docuisine.utils.streaming import stream_json_array
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/ingredients", tags=["Ingredients"])
 
 
 @router.get(
-    "/", status_code=status.HTTP_200_OK, response_model=list[ingredient_schemas.IngredientOut]
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[ingredient_schemas.IngredientOut],
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+    },
 )
 async def get_ingredients(
+    request: Request,
     ingredient_service: Ingredient_Service,
-) -> list[ingredient_schemas.IngredientOut]:
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByName = "id",
+    fields: SparseFields = None,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
-    Get all ingredients.
+    Get a page of ingredients.
+
+    The encoded page is cached until the next write to ingredients.
 
     Access Level: Public
     """
-    ingredients: list[Ingredient] = ingredient_service.get_all_ingredients()
-    return [
-        ingredient_schemas.IngredientOut.model_validate(ingredient) for ingredient in ingredients
-    ]
+    try:
+        selected = select_fields(ingredient_schemas.IngredientOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(ingredient_schemas.IngredientOut, selected)
+
+    async def build() -> tuple[str, Page[ingredient_schemas.IngredientOut]]:
+        try:
+            page: KeysetPage[Ingredient] = await ingredient_service.get_all_ingredients(
+                limit=limit, after=after, sort=sort, fields=selected
+            )
+        except errors.InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+        return page_etag(page, selected), Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        )
+
+    return await cached_response(
+        ingredient_service.cache,
+        f"{request.url.path}:{limit}:{after}:{sort}:{selected}",
+        build,
+        if_none_match=if_none_match,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ingredient_schemas.IngredientOut],
+)
+async def stream_ingredients(ingredient_service: Ingredient_Service) -> StreamingResponse:
+    """
+    Stream all ingredients as a single JSON array.
+
+    Intended for bulk consumers; rows are read and serialized in batches
+    so the response size does not affect the worker's memory.
+
+    Access Level: Public
+    """
+    result = await ingredient_service.stream_ingredients()
+    return StreamingResponse(
+        stream_json_array(result, ingredient_schemas.IngredientOut), media_type="application/json"
+    )
 
 
 @router.get(
     "/{ingredient_id}",
     status_code=status.HTTP_200_OK,
     response_model=ingredient_schemas.IngredientOut,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+    },
 )
 async def get_ingredient(
-    ingredient_id: int, ingredient_service: Ingredient_Service
-) -> ingredient_schemas.IngredientOut:
+    ingredient_id: int,
+    ingredient_service: Ingredient_Service,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get an ingredient by ID.
 
     Access Level: Public
     """
     try:
-        ingredient: Ingredient = ingredient_service.get_ingredient(ingredient_id=ingredient_id)
-        return ingredient_schemas.IngredientOut.model_validate(ingredient)
+        ingredient: Ingredient = await ingredient_service.get_ingredient(
+            ingredient_id=ingredient_id
+        )
     except errors.IngredientNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    etag = negotiated_etag(entity_etag(ingredient))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return ModelResponse(
+        ingredient_schemas.IngredientOut.model_validate(ingredient), headers={"ETag": etag}
+    )
 
 
 @router.post(
@@ -61,7 +147,7 @@ async def create_ingredient(
     ingredient: ingredient_schemas.IngredientCreate,
     ingredient_service: Ingredient_Service,
     authenticated_user: AuthenticatedUser,
-) -> ingredient_schemas.IngredientOut:
+) -> ModelResponse:
     """
     Create a new ingredient.
 
@@ -69,12 +155,15 @@ async def create_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_ingredient: Ingredient = ingredient_service.create_ingredient(
+        new_ingredient: Ingredient = await ingredient_service.create_ingredient(
             name=ingredient.name,
             description=ingredient.description,
             recipe_id=ingredient.recipe_id,
         )
-        return ingredient_schemas.IngredientOut.model_validate(new_ingredient)
+        return ModelResponse(
+            ingredient_schemas.IngredientOut.model_validate(new_ingredient),
+            status_code=status.HTTP_201_CREATED,
+        )
     except errors.IngredientExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -96,7 +185,7 @@ async def update_ingredient(
     ingredient: ingredient_schemas.IngredientUpdate,
     ingredient_service: Ingredient_Service,
     authenticated_user: AuthenticatedUser,
-) -> ingredient_schemas.IngredientOut:
+) -> ModelResponse:
     """
     Update an ingredient by ID.
 
@@ -104,13 +193,13 @@ async def update_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        updated_ingredient: Ingredient = ingredient_service.update_ingredient(
+        updated_ingredient: Ingredient = await ingredient_service.update_ingredient(
             ingredient_id=ingredient_id,
             name=ingredient.name,
             description=ingredient.description,
             recipe_id=ingredient.recipe_id,
         )
-        return ingredient_schemas.IngredientOut.model_validate(updated_ingredient)
+        return ModelResponse(ingredient_schemas.IngredientOut.model_validate(updated_ingredient))
     except errors.IngredientNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,7 +222,7 @@ async def delete_ingredient(
     ingredient_id: int,
     ingredient_service: Ingredient_Service,
     authenticated_user: AuthenticatedUser,
-) -> Detail:
+) -> ModelResponse:
     """
     Delete an ingredient by ID.
 
@@ -141,8 +230,10 @@ async def delete_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        ingredient_service.delete_ingredient(ingredient_id=ingredient_id)
-        return Detail(detail=f"Ingredient with ID {ingredient_id} has been deleted.")
+        await ingredient_service.delete_ingredient(ingredient_id=ingredient_id)
+        return ModelResponse(
+            Detail(detail=f"Ingredient with ID {ingredient_id} has been deleted.")
+        )
     except errors.IngredientNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,61 +1,163 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 
 from docuisine.db.models import Recipe
 from docuisine.dependencies import AuthenticatedUser, Recipe_Service
 from docuisine.schemas import recipe as recipe_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.annotations import (
+    IfNoneMatch,
+    PageCursor,
+    PageLimit,
+    SortByName,
+    SparseFields,
+)
+from docuisine.schemas.common import Detail, Page
 from docuisine.schemas.enums import Role
 from docuisine.utils import errors
+from docuisine.utils.etag import (
+    entity_etag,
+    etag_matches,
+    negotiated_etag,
+    not_modified,
+    page_etag,
+)
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from docuisine.utils.responses import ModelResponse
+from docuisine.utils.serialization import select_fields, sparse_schema, validate_list
+from docuisine.utils.streaming import stream_json_array
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[recipe_schemas.RecipeOut])
-async def get_recipes(recipe_service: Recipe_Service) -> list[recipe_schemas.RecipeOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[recipe_schemas.RecipeOut],
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+    },
+)
+async def get_recipes(
+    recipe_service: Recipe_Service,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByName = "id",
+    fields: SparseFields = None,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
-    Get all recipes.
+    Get a page of recipes.
 
     Access Level: Public
     """
-    recipes: list[Recipe] = recipe_service.get_all_recipes()
-    return [recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes]
+    try:
+        selected = select_fields(recipe_schemas.RecipeOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(recipe_schemas.RecipeOut, selected)
+    try:
+        page: KeysetPage[Recipe] = await recipe_service.get_all_recipes(
+            limit=limit, after=after, sort=sort, fields=selected
+        )
+    except errors.InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    etag = negotiated_etag(page_etag(page, selected))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return ModelResponse(
+        Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        ),
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/stream", status_code=status.HTTP_200_OK, response_model=list[recipe_schemas.RecipeOut]
+)
+async def stream_recipes(recipe_service: Recipe_Service) -> StreamingResponse:
+    """
+    Stream all recipes as a single JSON array.
+
+    Intended for bulk consumers; rows are read and serialized in batches
+    so the response size does not affect the worker's memory.
+
+    Access Level: Public
+    """
+    result = await recipe_service.stream_recipes()
+    return StreamingResponse(
+        stream_json_array(result, recipe_schemas.RecipeOut), media_type="application/json"
+    )
 
 
 @router.get(
     "/user/{user_id}",
     status_code=status.HTTP_200_OK,
-    response_model=list[recipe_schemas.RecipeOut],
+    response_model=Page[recipe_schemas.RecipeOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
 )
 async def get_recipes_by_user(
-    user_id: int, recipe_service: Recipe_Service
-) -> list[recipe_schemas.RecipeOut]:
+    user_id: int,
+    recipe_service: Recipe_Service,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByName = "id",
+    fields: SparseFields = None,
+) -> ModelResponse:
     """
-    Get all recipes created by a specific user.
+    Get a page of recipes created by a specific user.
 
     Access Level: Public
     """
-    recipes: list[Recipe] = recipe_service.get_recipes_by_user(user_id=user_id)
-    return [recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes]
+    try:
+        selected = select_fields(recipe_schemas.RecipeOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(recipe_schemas.RecipeOut, selected)
+    try:
+        page: KeysetPage[Recipe] = await recipe_service.get_recipes_by_user(
+            user_id=user_id, limit=limit, after=after, sort=sort, fields=selected
+        )
+    except errors.InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return ModelResponse(
+        Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        )
+    )
 
 
 @router.get(
     "/{recipe_id}",
     status_code=status.HTTP_200_OK,
     response_model=recipe_schemas.RecipeOut,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+    },
 )
-async def get_recipe(recipe_id: int, recipe_service: Recipe_Service) -> recipe_schemas.RecipeOut:
+async def get_recipe(
+    recipe_id: int,
+    recipe_service: Recipe_Service,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get a recipe by ID.
 
     Access Level: Public
     """
     try:
-        recipe: Recipe = recipe_service.get_recipe(recipe_id=recipe_id)
-        return recipe_schemas.RecipeOut.model_validate(recipe)
+        recipe: Recipe = await recipe_service.get_recipe(recipe_id=recipe_id)
     except errors.RecipeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    etag = negotiated_etag(entity_etag(recipe))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return ModelResponse(recipe_schemas.RecipeOut.model_validate(recipe), headers={"ETag": etag})
 
 
 @router.post(
@@ -68,7 +170,7 @@ async def create_recipe(
     recipe: recipe_schemas.RecipeCreate,
     recipe_service: Recipe_Service,
     authenticated_user: AuthenticatedUser,
-) -> recipe_schemas.RecipeOut:
+) -> ModelResponse:
     """
     Create a new recipe.
 
@@ -76,7 +178,7 @@ async def create_recipe(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_recipe: Recipe = recipe_service.create_recipe(
+        new_recipe: Recipe = await recipe_service.create_recipe(
             user_id=authenticated_user.id,
             name=recipe.name,
             cook_time_sec=recipe.cook_time_sec,
@@ -85,7 +187,10 @@ async def create_recipe(
             servings=recipe.servings,
             description=recipe.description,
         )
-        return recipe_schemas.RecipeOut.model_validate(new_recipe)
+        return ModelResponse(
+            recipe_schemas.RecipeOut.model_validate(new_recipe),
+            status_code=status.HTTP_201_CREATED,
+        )
     except errors.RecipeExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
 
@@ -104,7 +209,7 @@ async def update_recipe(
     recipe: recipe_schemas.RecipeUpdate,
     recipe_service: Recipe_Service,
     authenticated_user: AuthenticatedUser,
-) -> recipe_schemas.RecipeOut:
+) -> ModelResponse:
     """
     Update a recipe by ID.
 
@@ -112,10 +217,10 @@ async def update_recipe(
     """
     validate_role(authenticated_user.role, "au")
     if authenticated_user.role == Role.USER:
-        if recipe_id not in {r.id for r in authenticated_user.recipes}:
+        if not await recipe_service.is_owner(recipe_id=recipe_id, user_id=authenticated_user.id):
             raise errors.ForbiddenAccessError
     try:
-        updated: Recipe = recipe_service.update_recipe(
+        updated: Recipe = await recipe_service.update_recipe(
             recipe_id=recipe_id,
             name=recipe.name,
             cook_time_sec=recipe.cook_time_sec,
@@ -124,7 +229,7 @@ async def update_recipe(
             servings=recipe.servings,
             description=recipe.description,
         )
-        return recipe_schemas.RecipeOut.model_validate(updated)
+        return ModelResponse(recipe_schemas.RecipeOut.model_validate(updated))
     except errors.RecipeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except errors.RecipeExistsError as e:
@@ -139,7 +244,7 @@ async def update_recipe(
 )
 async def delete_recipe(
     recipe_id: int, recipe_service: Recipe_Service, authenticated_user: AuthenticatedUser
-) -> Detail:
+) -> ModelResponse:
     """
     Delete a recipe by ID.
 
@@ -147,10 +252,10 @@ async def delete_recipe(
     """
     validate_role(authenticated_user.role, "au")
     if authenticated_user.role == Role.USER:
-        if recipe_id not in {r.id for r in authenticated_user.recipes}:
+        if not await recipe_service.is_owner(recipe_id=recipe_id, user_id=authenticated_user.id):
             raise errors.ForbiddenAccessError
     try:
-        recipe_service.delete_recipe(recipe_id=recipe_id)
-        return Detail(detail=f"Recipe with ID {recipe_id} has been deleted.")
+        await recipe_service.delete_recipe(recipe_id=recipe_id)
+        return ModelResponse(Detail(detail=f"Recipe with ID {recipe_id} has been deleted."))
     except errors.RecipeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -1,43 +1,129 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from docuisine.db.models import Store
 from docuisine.dependencies import AuthenticatedUser, Store_Service
 from docuisine.schemas import store as store_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.annotations import (
+    IfNoneMatch,
+    PageCursor,
+    PageLimit,
+    SortByName,
+    SparseFields,
+)
+from docuisine.schemas.common import Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.etag import (
+    entity_etag,
+    etag_matches,
+    negotiated_etag,
+    not_modified,
+    page_etag,
+)
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from docuisine.utils.responses import ModelResponse, cached_response
+from docuisine.utils.serialization import select_fields, sparse_schema, validate_list
+from docuisine.utils.streaming import stream_json_array
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/stores", tags=["Stores"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[store_schemas.StoreOut])
-async def get_stores(store_service: Store_Service) -> list[store_schemas.StoreOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[store_schemas.StoreOut],
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+    },
+)
+async def get_stores(
+    request: Request,
+    store_service: Store_Service,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByName = "id",
+    fields: SparseFields = None,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
-    Get all stores.
+    Get a page of stores.
+
+    The encoded page is cached until the next write to stores.
 
     Access Level: Public
     """
-    stores: list[Store] = store_service.get_all_stores()
-    return [store_schemas.StoreOut.model_validate(store) for store in stores]
+    try:
+        selected = select_fields(store_schemas.StoreOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(store_schemas.StoreOut, selected)
+
+    async def build() -> tuple[str, Page[store_schemas.StoreOut]]:
+        try:
+            page: KeysetPage[Store] = await store_service.get_all_stores(
+                limit=limit, after=after, sort=sort, fields=selected
+            )
+        except errors.InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+        return page_etag(page, selected), Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        )
+
+    return await cached_response(
+        store_service.cache,
+        f"{request.url.path}:{limit}:{after}:{sort}:{selected}",
+        build,
+        if_none_match=if_none_match,
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+
+
+@router.get("/stream", status_code=status.HTTP_200_OK, response_model=list[store_schemas.StoreOut])
+async def stream_stores(store_service: Store_Service) -> StreamingResponse:
+    """
+    Stream all stores as a single JSON array.
+
+    Intended for bulk consumers; rows are read and serialized in batches
+    so the response size does not affect the worker's memory.
+
+    Access Level: Public
+    """
+    result = await store_service.stream_stores()
+    return StreamingResponse(
+        stream_json_array(result, store_schemas.StoreOut), media_type="application/json"
+    )
 
 
 @router.get(
     "/{store_id}",
     status_code=status.HTTP_200_OK,
     response_model=store_schemas.StoreOut,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+    },
 )
-async def get_store(store_id: int, store_service: Store_Service) -> store_schemas.StoreOut:
+async def get_store(
+    store_id: int,
+    store_service: Store_Service,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get a store by ID.
 
     Access Level: Public
     """
     try:
-        store: Store = store_service.get_store(store_id=store_id)
-        return store_schemas.StoreOut.model_validate(store)
+        store: Store = await store_service.get_store(store_id=store_id)
     except errors.StoreNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    etag = negotiated_etag(entity_etag(store))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return ModelResponse(store_schemas.StoreOut.model_validate(store), headers={"ETag": etag})
 
 
 @router.post(
@@ -50,7 +136,7 @@ async def create_store(
     store: store_schemas.StoreCreate,
     store_service: Store_Service,
     authenticated_user: AuthenticatedUser,
-) -> store_schemas.StoreOut:
+) -> ModelResponse:
     """
     Create a new store.
 
@@ -58,7 +144,7 @@ async def create_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_store: Store = store_service.create_store(
+        new_store: Store = await store_service.create_store(
             name=store.name,
             address=store.address,
             longitude=store.longitude,
@@ -67,7 +153,9 @@ async def create_store(
             website=store.website,
             description=store.description,
         )
-        return store_schemas.StoreOut.model_validate(new_store)
+        return ModelResponse(
+            store_schemas.StoreOut.model_validate(new_store), status_code=status.HTTP_201_CREATED
+        )
     except errors.StoreExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
 
@@ -86,7 +174,7 @@ async def update_store(
     store: store_schemas.StoreUpdate,
     store_service: Store_Service,
     authenticated_user: AuthenticatedUser,
-) -> store_schemas.StoreOut:
+) -> ModelResponse:
     """
     Update a store by ID.
 
@@ -94,7 +182,7 @@ async def update_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        updated: Store = store_service.update_store(
+        updated: Store = await store_service.update_store(
             store_id=store_id,
             name=store.name,
             address=store.address,
@@ -104,7 +192,7 @@ async def update_store(
             website=store.website,
             description=store.description,
         )
-        return store_schemas.StoreOut.model_validate(updated)
+        return ModelResponse(store_schemas.StoreOut.model_validate(updated))
     except errors.StoreNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except errors.StoreExistsError as e:
@@ -119,7 +207,7 @@ async def update_store(
 )
 async def delete_store(
     store_id: int, store_service: Store_Service, authenticated_user: AuthenticatedUser
-) -> Detail:
+) -> ModelResponse:
     """
     Delete a store by ID.
 
@@ -127,7 +215,7 @@ async def delete_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        store_service.delete_store(store_id=store_id)
-        return Detail(detail=f"Store with ID {store_id} has been deleted.")
+        await store_service.delete_store(store_id=store_id)
+        return ModelResponse(Detail(detail=f"Store with ID {store_id} has been deleted."))
     except errors.StoreNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -5,24 +5,59 @@ from fastapi import APIRouter, Form, HTTPException, status
 from docuisine.db.models import User
 from docuisine.dependencies import AuthenticatedUser, Image_Service, User_Service
 from docuisine.schemas import user as user_schemas
-from docuisine.schemas.annotations import ImageUpload
-from docuisine.schemas.common import Detail
+from docuisine.schemas.annotations import (
+    ImageUpload,
+    PageCursor,
+    PageLimit,
+    SortByUsername,
+    SparseFields,
+)
+from docuisine.schemas.common import Detail, Page
 from docuisine.schemas.enums import Role
 from docuisine.utils import errors
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from docuisine.utils.responses import ModelResponse
+from docuisine.utils.serialization import select_fields, sparse_schema, validate_list
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[user_schemas.UserOut])
-async def get_users(user_service: User_Service) -> list[user_schemas.UserOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[user_schemas.UserOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
+)
+async def get_users(
+    user_service: User_Service,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    after: PageCursor = None,
+    sort: SortByUsername = "id",
+    fields: SparseFields = None,
+) -> ModelResponse:
     """
-    Get all users.
+    Get a page of users.
 
     Access Level: Public
     """
-    users: list[User] = user_service.get_all_users()
-    return [user_schemas.UserOut.model_validate(user) for user in users]
+    try:
+        selected = select_fields(user_schemas.UserOut, fields)
+    except errors.InvalidFieldsError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    schema = sparse_schema(user_schemas.UserOut, selected)
+    try:
+        page: KeysetPage[User] = await user_service.get_all_users(
+            limit=limit, after=after, sort=sort, fields=selected
+        )
+    except errors.InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+    return ModelResponse(
+        Page[schema](
+            items=validate_list(schema, page.items),
+            next=page.next,
+        )
+    )
 
 
 @router.get(
@@ -31,15 +66,15 @@ async def get_users(user_service: User_Service) -> list[user_schemas.UserOut]:
     response_model=user_schemas.UserOut,
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
-async def get_user(username: str, user_service: User_Service) -> user_schemas.UserOut:
+async def get_user(username: str, user_service: User_Service) -> ModelResponse:
     """
     Get a user by username.
 
     Access Level: Public
     """
     try:
-        user: User = user_service.get_user(username=username)
-        return user_schemas.UserOut.model_validate(user)
+        user: User = await user_service.get_user(username=username)
+        return ModelResponse(user_schemas.UserOut.model_validate(user))
     except errors.UserNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -53,17 +88,17 @@ async def get_user(username: str, user_service: User_Service) -> user_schemas.Us
     response_model=user_schemas.UserOut,
     responses={status.HTTP_409_CONFLICT: {"model": Detail}},
 )
-async def create_user(
-    user: user_schemas.UserCreate, user_service: User_Service
-) -> user_schemas.UserOut:
+async def create_user(user: user_schemas.UserCreate, user_service: User_Service) -> ModelResponse:
     """
     Create a new user.
 
     Access Level: Public
     """
     try:
-        new_user: User = user_service.create_user(user.username, user.password, user.email)
-        return user_schemas.UserOut.model_validate(new_user)
+        new_user: User = await user_service.create_user(user.username, user.password, user.email)
+        return ModelResponse(
+            user_schemas.UserOut.model_validate(new_user), status_code=status.HTTP_201_CREATED
+        )
     except errors.UserExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -79,7 +114,7 @@ async def create_user(
 )
 async def delete_user(
     user_id: int, user_service: User_Service, authenticated_user: AuthenticatedUser
-) -> Detail:
+) -> ModelResponse:
     """
     Delete a user by ID.
 
@@ -89,8 +124,8 @@ async def delete_user(
     if (authenticated_user.id != user_id) and (authenticated_user.role != Role.ADMIN):
         raise errors.ForbiddenAccessError
     try:
-        user_service.delete_user(user_id=user_id)
-        return Detail(detail=f"User with ID {user_id} has been deleted.")
+        await user_service.delete_user(user_id=user_id)
+        return ModelResponse(Detail(detail=f"User with ID {user_id} has been deleted."))
     except errors.UserNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,7 +147,7 @@ async def update_user_email(
     user: user_schemas.UserUpdateEmail,
     user_service: User_Service,
     authenticated_user: AuthenticatedUser,
-) -> user_schemas.UserOut:
+) -> ModelResponse:
     """
     Update user email.
 
@@ -122,8 +157,10 @@ async def update_user_email(
     if authenticated_user.id != user.id:
         raise errors.ForbiddenAccessError
     try:
-        updated_user: User = user_service.update_user_email(user_id=user.id, new_email=user.email)
-        return user_schemas.UserOut.model_validate(updated_user)
+        updated_user: User = await user_service.update_user_email(
+            user_id=user.id, new_email=user.email
+        )
+        return ModelResponse(user_schemas.UserOut.model_validate(updated_user))
     except errors.UserNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -148,7 +185,7 @@ async def update_user_password(
     user: user_schemas.UserUpdatePassword,
     user_service: User_Service,
     authenticated_user: AuthenticatedUser,
-) -> user_schemas.UserOut:
+) -> ModelResponse:
     """
     Update user password.
 
@@ -158,10 +195,10 @@ async def update_user_password(
     if authenticated_user.id != user.id:
         raise errors.ForbiddenAccessError
     try:
-        updated_user: User = user_service.update_user_password(
+        updated_user: User = await user_service.update_user_password(
             user_id=user.id, old_password=user.old_password, new_password=user.new_password
         )
-        return user_schemas.UserOut.model_validate(updated_user)
+        return ModelResponse(user_schemas.UserOut.model_validate(updated_user))
     except errors.UserNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -185,7 +222,7 @@ async def update_user_img(
     authenticated_user: AuthenticatedUser,
     fileb: ImageUpload,
     image_service: Image_Service,
-) -> user_schemas.UserOut:
+) -> ModelResponse:
     """
     Update the current user's profile.
 
@@ -198,10 +235,10 @@ async def update_user_img(
     try:
         image_set = image_service.upload_image(await fileb.read())
 
-        updated_user = user_service.update_user_img(
+        updated_user = await user_service.update_user_img(
             user_id=user_id, img=image_set.original, preview_img=image_set.preview
         )
-        return updated_user
+        return ModelResponse(updated_user)
 
     except errors.UserNotFoundError as e:
         raise HTTPException(
@@ -1,4 +1,5 @@
 from . import (
+    admin,
     annotations,
     common,
     enums,
@@ -13,6 +14,7 @@ from .enums import Role, Status
 from .health import HealthCheck
 
 __all__ = [
+    "admin",
     "annotations",
     "common",
     "enums",
@@ -0,0 +1,81 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, RootModel
+
+
+class PoolStats(BaseModel):
+    """
+    Snapshot of the database connection pool.
+
+    Size and connection counts are ``None`` for pools that do not queue
+    connections, such as the SQLite pools used in development and tests.
+    """
+
+    pool_class: str = Field(
+        ..., description="The connection pool implementation", examples=["QueuePool"]
+    )
+    size: Optional[int] = Field(
+        None, description="Number of connections kept open in the pool", examples=[5]
+    )
+    max_overflow: Optional[int] = Field(
+        None, description="Connections allowed beyond the pool size", examples=[10]
+    )
+    timeout: Optional[float] = Field(
+        None, description="Seconds a checkout waits for a free connection", examples=[30.0]
+    )
+    checked_out: Optional[int] = Field(
+        None, description="Connections currently in use", examples=[3]
+    )
+    idle: Optional[int] = Field(
+        None, description="Open connections waiting in the pool", examples=[2]
+    )
+    overflow: Optional[int] = Field(
+        None, description="Connections currently open beyond the pool size", examples=[0]
+    )
+    waits: Optional[int] = Field(
+        None, description="Checkouts that had to wait for a free connection", examples=[0]
+    )
+    timeouts: Optional[int] = Field(
+        None, description="Checkouts that timed out waiting for a connection", examples=[0]
+    )
+    wait_time_total: Optional[float] = Field(
+        None, description="Total seconds spent waiting for connections", examples=[0.0]
+    )
+    wait_time_max: Optional[float] = Field(
+        None, description="Longest wait for a connection in seconds", examples=[0.0]
+    )
+
+
+class DatabasePools(BaseModel):
+    """
+    Snapshots of the connection pools of the worker answering the request, by database role.
+    """
+
+    primary: PoolStats = Field(..., description="The pool of the primary database")
+    replica: Optional[PoolStats] = Field(
+        None, description="The pool of the read replica, if ``DATABASE_REPLICA_URL`` is set"
+    )
+
+
+class CacheStats(BaseModel):
+    """
+    Counters of one in-process cache of the worker answering the request.
+    """
+
+    hits: int = Field(..., description="Lookups answered from the cache", examples=[120])
+    misses: int = Field(
+        ..., description="Lookups that found no valid entry, expired ones included", examples=[8]
+    )
+    evictions: int = Field(
+        ..., description="Entries removed to make room for newer ones", examples=[0]
+    )
+    expirations: int = Field(
+        ..., description="Entries found expired and removed by a lookup", examples=[3]
+    )
+    size: int = Field(..., description="Number of entries currently stored", examples=[5])
+
+
+class CachesStats(RootModel[dict[str, CacheStats]]):
+    """
+    Counters of the worker's caches, by cache name, e.g. ``"categories"``.
+    """
@@ -1,9 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Literal, Optional
 
 from annotated_types import Len, MinLen
-from fastapi import File, Form, UploadFile
+from fastapi import File, Form, Header, Query, UploadFile
 from pydantic import AfterValidator
 
+from docuisine.utils.pagination import MAX_PAGE_SIZE
 from docuisine.utils.validation import validate_password, validate_version
 
 CommitHash = Annotated[str, Len(7, 7)]
@@ -14,6 +15,38 @@ Password = Annotated[
 Version = Annotated[str, MinLen(5), AfterValidator(validate_version)]
 ImageUpload = Annotated[UploadFile, File()]
 
+PageLimit = Annotated[
+    int,
+    Query(
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description=f"The maximum number of items per page, at most {MAX_PAGE_SIZE}",
+    ),
+]
+PageCursor = Annotated[
+    Optional[str], Query(description="The `next` cursor returned with the previous page")
+]
+SparseFields = Annotated[
+    Optional[str],
+    Query(
+        description="Comma-separated fields to return, e.g. `id,name`. Default is every field",
+        examples=["id,name"],
+    ),
+]
+SortByName = Annotated[Literal["id", "name"], Query(description="The field to sort by")]
+SortByUsername = Annotated[Literal["id", "username"], Query(description="The field to sort by")]
+IfNoneMatch = Annotated[
+    Optional[str],
+    Header(description="ETags of cached copies; a match returns `304 Not Modified`"),
+]
+ReadPrimary = Annotated[
+    bool,
+    Header(
+        description="Read from the primary database instead of a replica, "
+        "e.g. to see a write made by an earlier request",
+    ),
+]
+
 
 CategoryName = Annotated[
     str, Form(..., description="The category name", examples=["Dessert", "Vegetarian"])
@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .enums import JWTAlgorithm, TokenType
+from .enums import JWTAlgorithm, Role, TokenType
 
 
 class Token(BaseModel):
@@ -26,8 +26,33 @@ class JWTConfig(BaseModel):
         The algorithm used for signing the JWT tokens.
     access_token_expire_minutes : Optional[int]
         The expiration time for access tokens in minutes. Defaults to 525600 (1 year).
+    stateless : bool
+        Whether to trust the ``uid`` and ``role`` claims of a token instead of
+        loading the user from the database. Defaults to False.
     """
 
     secret_key: str
     algorithm: JWTAlgorithm = Field(default=JWTAlgorithm.HS256)
     access_token_expire_minutes: Optional[int] = Field(default=60 * 24 * 365, ge=1)
+    stateless: bool = Field(default=False)
+
+
+class Principal(BaseModel):
+    """
+    The identity of an authenticated client.
+
+    Attributes
+    ----------
+    id : int
+        The user's unique identifier.
+    username : str
+        The user's username.
+    role : Union[Role, str]
+        The user's role.
+    """
+
+    id: int
+    username: str
+    role: Union[Role, str]
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
+T = TypeVar("T")
+
 
 class Detail(BaseModel):
     """
@@ -48,3 +50,23 @@ class Entity(BaseModel):
     preview_img: Optional[str] = Field(
         None, description="URL or path to the preview image", examples=["preview_image.jpg"]
     )
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Schema for one page of a paginated list.
+
+    Attributes
+    ----------
+    items : list[T]
+        The items of the page.
+    next : Optional[str]
+        Cursor to pass as ``after`` to fetch the next page, ``None`` on the last page.
+    """
+
+    items: list[T] = Field(..., description="The items of the page")
+    next: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, null on the last page",
+        examples=["eyJzb3J0IjoiaWQiLCJrZXkiOlsxMF19"],
+    )
@@ -1,17 +1,51 @@
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
-
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from docuisine.core.cache import Cache
+from docuisine.db.caching import (
+    cached_read,
+    forget_missing,
+    invalidates_cache,
+    load_unless_missing,
+)
 from docuisine.db.models import Category
+from docuisine.db.routing import replica_read
 from docuisine.utils.errors.category import CategoryExistsError, CategoryNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage, paginate
 
 
 class CategoryService:
-    def __init__(self, db_session: Session):
-        self.db_session: Session = db_session
+    SORT_COLUMNS = {"id": Category.id, "name": Category.name}
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        cache: Optional[Cache] = None,
+        not_found_cache: Optional[Cache] = None,
+    ):
+        """
+        Initialize the CategoryService with a database session and an optional read cache.
+
+        Parameters
+        ----------
+        db_session : AsyncSession
+            The SQLAlchemy asyncio database session for database operations.
+        cache : Optional[Cache], optional
+            Cache of the categories read by `get_category` and `get_all_categories`, shared
+            between requests and cleared by every write, by default None (no caching).
+        not_found_cache : Optional[Cache], optional
+            Short-lived cache of names `get_category` did not find, so repeated lookups of a
+            missing name skip the database, by default None (no caching).
+        """
+        self.db_session: AsyncSession = db_session
+        self.cache: Optional[Cache] = cache
+        self.not_found_cache: Optional[Cache] = not_found_cache
 
-    def create_category(
+    @invalidates_cache
+    async def create_category(
         self,
         name: str,
         description: Optional[str] = None,
@@ -51,13 +85,16 @@ class CategoryService:
         )
         try:
             self.db_session.add(new_category)
-            self.db_session.commit()
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise CategoryExistsError(name)
+        await forget_missing(self.not_found_cache, "categories", name)
         return new_category
 
-    def get_category(
+    @cached_read
+    @replica_read
+    async def get_category(
         self, category_id: Optional[int] = None, name: Optional[str] = None
     ) -> Category:
         """
@@ -87,9 +124,15 @@ class CategoryService:
         - If both `category_id` and `name` are provided, `category_id` takes precedence.
         """
         if category_id is not None:
-            result = self._get_category_by_id(category_id=category_id)
+            result = await self._get_category_by_id(category_id=category_id)
         elif name is not None:
-            result = self._get_category_by_name(name=name)
+            result = await load_unless_missing(
+                self.not_found_cache,
+                "categories",
+                name,
+                self.db_session,
+                lambda: self._get_category_by_name(name=name),
+            )
         else:
             raise ValueError("Either category ID or name must be provided.")
 
@@ -102,18 +145,54 @@ class CategoryService:
 
         return result
 
-    def get_all_categories(self) -> list[Category]:
+    @cached_read
+    @replica_read
+    async def get_all_categories(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[Category]:
         """
-        Retrieve all categories from the database.
+        Retrieve a page of categories from the database.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of categories to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"name"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
 
         Returns
         -------
-        list[Category]
-            A list of all `Category` instances in the database.
+        KeysetPage[Category]
+            The `Category` instances of the page and the cursor of the next page.
+
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
         """
-        return self.db_session.query(Category).all()
+        return await paginate(
+            self.db_session,
+            select(Category),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
 
-    def update_category(
+    @invalidates_cache
+    async def update_category(
         self,
         category_id: int,
         name: Optional[str] = None,
@@ -148,24 +227,33 @@ class CategoryService:
         - This method commits the transaction immediately.
         - At least one of `name` or `description` should be provided.
         """
-        category = self._get_category_by_id(category_id)
-        if category is None:
-            raise CategoryNotFoundError(category_id=category_id)
-
+        values: dict[str, Any] = {}
         if name is not None:
-            category.name = name
+            values["name"] = name
         if description is not None:
-            category.description = description
+            values["description"] = description
 
         try:
-            self.db_session.commit()
+            if values:
+                category = await self._update_category_by_id(category_id, values)
+            else:
+                category = await self._get_category_by_id(category_id)
+            if category is None:
+                raise CategoryNotFoundError(category_id=category_id)
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
-            raise CategoryExistsError(name if name is not None else category.name)
+            await self.db_session.rollback()
+            if name is None:
+                # Only a rename can collide with another category's name.
+                raise
+            raise CategoryExistsError(name)
 
+        if name is not None:
+            await forget_missing(self.not_found_cache, "categories", name)
         return category
 
-    def delete_category(self, category_id: int) -> None:
+    @invalidates_cache
+    async def delete_category(self, category_id: int) -> None:
         """
         Delete a category from the database by its unique ID.
 
@@ -183,13 +271,11 @@ class CategoryService:
         -----
         - This method commits the transaction immediately.
         """
-        category = self._get_category_by_id(category_id)
-        if category is None:
+        if not await self._delete_category_by_id(category_id):
             raise CategoryNotFoundError(category_id=category_id)
-        self.db_session.delete(category)
-        self.db_session.commit()
+        await self.db_session.commit()
 
-    def _get_category_by_id(self, category_id: int) -> Optional[Category]:
+    async def _get_category_by_id(self, category_id: int) -> Optional[Category]:
         """
         Retrieve a category from the database by its unique ID.
 
@@ -207,9 +293,9 @@ class CategoryService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Category).filter_by(id=category_id).first()
+        return await self.db_session.scalar(select(Category).filter_by(id=category_id).limit(1))
 
-    def _get_category_by_name(self, name: str) -> Optional[Category]:
+    async def _get_category_by_name(self, name: str) -> Optional[Category]:
         """
         Retrieve a category from the database by its name.
 
@@ -227,4 +313,53 @@ class CategoryService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Category).filter_by(name=name).first()
+        return await self.db_session.scalar(select(Category).filter_by(name=name).limit(1))
+
+    async def _update_category_by_id(
+        self, category_id: int, values: dict[str, Any]
+    ) -> Optional[Category]:
+        """
+        Update a category by its unique ID with a single ``UPDATE ... RETURNING``.
+
+        Parameters
+        ----------
+        category_id : int
+            The unique ID of the category to update.
+        values : dict[str, Any]
+            The new column values. Must not be empty.
+
+        Returns
+        -------
+        Optional[Category]
+            The updated `Category` instance if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            update(Category).filter_by(id=category_id).values(**values).returning(Category)
+        )
+
+    async def _delete_category_by_id(self, category_id: int) -> bool:
+        """
+        Delete a category by its unique ID with a single ``DELETE ... RETURNING``.
+
+        Parameters
+        ----------
+        category_id : int
+            The unique ID of the category to delete.
+
+        Returns
+        -------
+        bool
+            Whether a category was deleted.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        deleted_id = await self.db_session.scalar(
+            delete(Category).filter_by(id=category_id).returning(Category.id)
+        )
+        return deleted_id is not None
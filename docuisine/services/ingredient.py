@@ -1,17 +1,52 @@
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
+from docuisine.core.cache import Cache
+from docuisine.db.caching import (
+    cached_read,
+    forget_missing,
+    invalidates_cache,
+    load_unless_missing,
+)
 from docuisine.db.models import Ingredient
+from docuisine.db.routing import replica_read
 from docuisine.utils.errors.ingredient import IngredientExistsError, IngredientNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage, paginate
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
 
 class IngredientService:
-    def __init__(self, db_session: Session):
-        self.db_session: Session = db_session
+    SORT_COLUMNS = {"id": Ingredient.id, "name": Ingredient.name}
 
-    def create_ingredient(
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        cache: Optional[Cache] = None,
+        not_found_cache: Optional[Cache] = None,
+    ):
+        """
+        Initialize the IngredientService with a database session and an optional read cache.
+
+        Parameters
+        ----------
+        db_session : AsyncSession
+            The SQLAlchemy asyncio database session for database operations.
+        cache : Optional[Cache], optional
+            Cache of the ingredients read by `get_ingredient` and `get_all_ingredients`, shared
+            between requests and cleared by every write, by default None (no caching).
+        not_found_cache : Optional[Cache], optional
+            Short-lived cache of names `get_ingredient` did not find, so repeated lookups of a
+            missing name skip the database, by default None (no caching).
+        """
+        self.db_session: AsyncSession = db_session
+        self.cache: Optional[Cache] = cache
+        self.not_found_cache: Optional[Cache] = not_found_cache
+
+    @invalidates_cache
+    async def create_ingredient(
         self,
         name: str,
         description: Optional[str] = None,
@@ -42,13 +77,16 @@ class IngredientService:
         new_ingredient = Ingredient(name=name, description=description, recipe_id=recipe_id)
         try:
             self.db_session.add(new_ingredient)
-            self.db_session.commit()
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise IngredientExistsError(name)
+        await forget_missing(self.not_found_cache, "ingredients", name)
         return new_ingredient
 
-    def get_ingredient(
+    @cached_read
+    @replica_read
+    async def get_ingredient(
         self, ingredient_id: Optional[int] = None, name: Optional[str] = None
     ) -> Ingredient:
         """
@@ -78,9 +116,15 @@ class IngredientService:
         - If both are provided, `ingredient_id` takes precedence.
         """
         if ingredient_id is not None:
-            result = self._get_ingredient_by_id(ingredient_id=ingredient_id)
+            result = await self._get_ingredient_by_id(ingredient_id=ingredient_id)
         elif name is not None:
-            result = self._get_ingredient_by_name(name=name)
+            result = await load_unless_missing(
+                self.not_found_cache,
+                "ingredients",
+                name,
+                self.db_session,
+                lambda: self._get_ingredient_by_name(name=name),
+            )
         else:
             raise ValueError("Either ingredient ID or name must be provided.")
 
@@ -93,18 +137,75 @@ class IngredientService:
 
         return result
 
-    def get_all_ingredients(self) -> list[Ingredient]:
+    @cached_read
+    @replica_read
+    async def get_all_ingredients(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[Ingredient]:
         """
-        Return all ingredients.
+        Retrieve a page of ingredients from the database.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of ingredients to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"name"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
 
         Returns
         -------
-        list[Ingredient]
-            A list of all `Ingredient` instances in the database.
+        KeysetPage[Ingredient]
+            The `Ingredient` instances of the page and the cursor of the next page.
+
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
+        """
+        return await paginate(
+            self.db_session,
+            select(Ingredient),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+    @replica_read
+    async def stream_ingredients(self) -> AsyncScalarResult[Ingredient]:
+        """
+        Stream all ingredients from the database through a server-side cursor.
+
+        Returns
+        -------
+        AsyncScalarResult[Ingredient]
+            The `Ingredient` instances ordered by ID, fetched in batches of
+            `STREAM_BATCH_SIZE` rows.
+
+        Notes
+        -----
+        - The session must stay open until the result is fully consumed.
         """
-        return self.db_session.query(Ingredient).all()
+        return await self.db_session.stream_scalars(
+            select(Ingredient)
+            .order_by(Ingredient.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
 
-    def update_ingredient(
+    @invalidates_cache
+    async def update_ingredient(
         self,
         ingredient_id: int,
         name: Optional[str] = None,
@@ -137,27 +238,35 @@ class IngredientService:
         IngredientExistsError
             If an ingredient with the new name already exists.
         """
-        ingredient = self._get_ingredient_by_id(ingredient_id)
-        if ingredient is None:
-            raise IngredientNotFoundError(ingredient_id=ingredient_id)
-
+        values: dict[str, Any] = {}
         if name is not None:
-            ingredient.name = name
+            values["name"] = name
         if description is not None:
-            ingredient.description = description
+            values["description"] = description
         if recipe_id is not None:
-            ingredient.recipe_id = recipe_id
+            values["recipe_id"] = recipe_id
 
         try:
-            self.db_session.commit()
+            if values:
+                ingredient = await self._update_ingredient_by_id(ingredient_id, values)
+            else:
+                ingredient = await self._get_ingredient_by_id(ingredient_id)
+            if ingredient is None:
+                raise IngredientNotFoundError(ingredient_id=ingredient_id)
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
-            # Use provided name, otherwise current name
-            raise IngredientExistsError(name if name is not None else ingredient.name)
+            await self.db_session.rollback()
+            if name is None:
+                # Only a rename can collide with another ingredient's name.
+                raise
+            raise IngredientExistsError(name)
 
+        if name is not None:
+            await forget_missing(self.not_found_cache, "ingredients", name)
         return ingredient
 
-    def delete_ingredient(self, ingredient_id: int) -> None:
+    @invalidates_cache
+    async def delete_ingredient(self, ingredient_id: int) -> None:
         """
         Delete an ingredient by ID.
 
@@ -166,13 +275,11 @@ class IngredientService:
         IngredientNotFoundError
             If no ingredient is found with the given ID.
         """
-        ingredient = self._get_ingredient_by_id(ingredient_id)
-        if ingredient is None:
+        if not await self._delete_ingredient_by_id(ingredient_id):
             raise IngredientNotFoundError(ingredient_id=ingredient_id)
-        self.db_session.delete(ingredient)
-        self.db_session.commit()
+        await self.db_session.commit()
 
-    def _get_ingredient_by_id(self, ingredient_id: int) -> Optional[Ingredient]:
+    async def _get_ingredient_by_id(self, ingredient_id: int) -> Optional[Ingredient]:
         """
         Primitive query: find ingredient by ID (no business logic).
 
@@ -181,9 +288,11 @@ class IngredientService:
         Optional[Ingredient]
             The `Ingredient` instance if found, else None.
         """
-        return self.db_session.query(Ingredient).filter_by(id=ingredient_id).first()
+        return await self.db_session.scalar(
+            select(Ingredient).filter_by(id=ingredient_id).limit(1)
+        )
 
-    def _get_ingredient_by_name(self, name: str) -> Optional[Ingredient]:
+    async def _get_ingredient_by_name(self, name: str) -> Optional[Ingredient]:
         """
         Primitive query: find ingredient by name (no business logic).
 
@@ -192,4 +301,53 @@ class IngredientService:
         Optional[Ingredient]
             The `Ingredient` instance if found, else None.
         """
-        return self.db_session.query(Ingredient).filter_by(name=name).first()
+        return await self.db_session.scalar(select(Ingredient).filter_by(name=name).limit(1))
+
+    async def _update_ingredient_by_id(
+        self, ingredient_id: int, values: dict[str, Any]
+    ) -> Optional[Ingredient]:
+        """
+        Update a ingredient by its unique ID with a single ``UPDATE ... RETURNING``.
+
+        Parameters
+        ----------
+        ingredient_id : int
+            The unique ID of the ingredient to update.
+        values : dict[str, Any]
+            The new column values. Must not be empty.
+
+        Returns
+        -------
+        Optional[Ingredient]
+            The updated `Ingredient` instance if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            update(Ingredient).filter_by(id=ingredient_id).values(**values).returning(Ingredient)
+        )
+
+    async def _delete_ingredient_by_id(self, ingredient_id: int) -> bool:
+        """
+        Delete a ingredient by its unique ID with a single ``DELETE ... RETURNING``.
+
+        Parameters
+        ----------
+        ingredient_id : int
+            The unique ID of the ingredient to delete.
+
+        Returns
+        -------
+        bool
+            Whether a ingredient was deleted.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        deleted_id = await self.db_session.scalar(
+            delete(Ingredient).filter_by(id=ingredient_id).returning(Ingredient.id)
+        )
+        return deleted_id is not None
@@ -1,17 +1,37 @@
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
-from docuisine.db.models import Recipe
+from docuisine.core.cache import Cache
+from docuisine.db.models import Ingredient, Recipe
+from docuisine.db.routing import replica_read
 from docuisine.utils.errors.recipe import RecipeExistsError, RecipeNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage, paginate
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
 
 class RecipeService:
-    def __init__(self, db_session: Session):
-        self.db_session: Session = db_session
+    SORT_COLUMNS = {"id": Recipe.id, "name": Recipe.name}
 
-    def create_recipe(
+    def __init__(self, db_session: AsyncSession, ingredient_cache: Optional[Cache] = None):
+        """
+        Initialize the RecipeService with a database session.
+
+        Parameters
+        ----------
+        db_session : AsyncSession
+            The SQLAlchemy asyncio database session for database operations.
+        ingredient_cache : Optional[Cache], optional
+            The read cache of `IngredientService`. Deleting a recipe clears the
+            ``recipe_id`` of the ingredients it produces, so it clears this cache
+            too, by default None.
+        """
+        self.db_session: AsyncSession = db_session
+        self.ingredient_cache: Optional[Cache] = ingredient_cache
+
+    async def create_recipe(
         self,
         user_id: int,
         name: str,
@@ -62,13 +82,16 @@ class RecipeService:
         )
         try:
             self.db_session.add(new_recipe)
-            self.db_session.commit()
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise RecipeExistsError(name)
         return new_recipe
 
-    def get_recipe(self, recipe_id: Optional[int] = None, name: Optional[str] = None) -> Recipe:
+    @replica_read
+    async def get_recipe(
+        self, recipe_id: Optional[int] = None, name: Optional[str] = None
+    ) -> Recipe:
         """
         Retrieve a recipe by ID or name.
 
@@ -96,9 +119,9 @@ class RecipeService:
         - If both are provided, `recipe_id` takes precedence.
         """
         if recipe_id is not None:
-            result = self._get_recipe_by_id(recipe_id=recipe_id)
+            result = await self._get_recipe_by_id(recipe_id=recipe_id)
         elif name is not None:
-            result = self._get_recipe_by_name(name=name)
+            result = await self._get_recipe_by_name(name=name)
         else:
             raise ValueError("Either recipe ID or name must be provided.")
 
@@ -111,27 +134,138 @@ class RecipeService:
 
         return result
 
-    def get_all_recipes(self) -> list[Recipe]:
-        """Retrieve all recipes from the database."""
-        return self.db_session.query(Recipe).all()
+    @replica_read
+    async def get_all_recipes(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[Recipe]:
+        """
+        Retrieve a page of recipes from the database.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of recipes to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"name"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
+
+        Returns
+        -------
+        KeysetPage[Recipe]
+            The `Recipe` instances of the page and the cursor of the next page.
+
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
+        """
+        return await paginate(
+            self.db_session,
+            select(Recipe),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+    @replica_read
+    async def stream_recipes(self) -> AsyncScalarResult[Recipe]:
+        """
+        Stream all recipes from the database through a server-side cursor.
+
+        Returns
+        -------
+        AsyncScalarResult[Recipe]
+            The `Recipe` instances ordered by ID, fetched in batches of
+            `STREAM_BATCH_SIZE` rows.
+
+        Notes
+        -----
+        - The session must stay open until the result is fully consumed.
+        """
+        return await self.db_session.stream_scalars(
+            select(Recipe).order_by(Recipe.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+    @replica_read
+    async def get_recipes_by_user(
+        self,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[Recipe]:
+        """
+        Retrieve a page of recipes created by a specific user.
+
+        Parameters
+        ----------
+        user_id : int
+            The ID of the user.
+        limit : int, optional
+            The maximum number of recipes to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"name"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
+
+        Returns
+        -------
+        KeysetPage[Recipe]
+            The `Recipe` instances created by the user and the cursor of the next page.
 
-    def get_recipes_by_user(self, user_id: int) -> list[Recipe]:
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
         """
-        Retrieve all recipes created by a specific user.
+        return await paginate(
+            self.db_session,
+            select(Recipe).filter_by(user_id=user_id),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+    async def is_owner(self, recipe_id: int, user_id: int) -> bool:
+        """
+        Check whether a recipe was created by a specific user.
 
         Parameters
         ----------
+        recipe_id : int
+            The unique ID of the recipe.
         user_id : int
             The ID of the user.
 
         Returns
         -------
-        list[Recipe]
-            A list of `Recipe` instances created by the user.
+        bool
+            `True` if the recipe exists and belongs to the user, otherwise `False`.
         """
-        return self.db_session.query(Recipe).filter_by(user_id=user_id).all()
+        owned = select(Recipe.id).filter_by(id=recipe_id, user_id=user_id).exists()
+        return bool(await self.db_session.scalar(select(owned)))
 
-    def update_recipe(
+    async def update_recipe(
         self,
         recipe_id: int,
         name: Optional[str] = None,
@@ -173,32 +307,38 @@ class RecipeService:
         RecipeExistsError
             If updating the name conflicts with an existing recipe.
         """
-        recipe = self._get_recipe_by_id(recipe_id)
-        if recipe is None:
-            raise RecipeNotFoundError(recipe_id=recipe_id)
-
+        values: dict[str, Any] = {}
         if name is not None:
-            recipe.name = name
+            values["name"] = name
         if cook_time_sec is not None:
-            recipe.cook_time_sec = cook_time_sec
+            values["cook_time_sec"] = cook_time_sec
         if prep_time_sec is not None:
-            recipe.prep_time_sec = prep_time_sec
+            values["prep_time_sec"] = prep_time_sec
         if non_blocking_time_sec is not None:
-            recipe.non_blocking_time_sec = non_blocking_time_sec
+            values["non_blocking_time_sec"] = non_blocking_time_sec
         if servings is not None:
-            recipe.servings = servings
+            values["servings"] = servings
         if description is not None:
-            recipe.description = description
+            values["description"] = description
 
         try:
-            self.db_session.commit()
+            if values:
+                recipe = await self._update_recipe_by_id(recipe_id, values)
+            else:
+                recipe = await self._get_recipe_by_id(recipe_id)
+            if recipe is None:
+                raise RecipeNotFoundError(recipe_id=recipe_id)
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
-            raise RecipeExistsError(name if name is not None else recipe.name)
+            await self.db_session.rollback()
+            if name is None:
+                # Only a rename can collide with another recipe's name.
+                raise
+            raise RecipeExistsError(name)
 
         return recipe
 
-    def delete_recipe(self, recipe_id: int) -> None:
+    async def delete_recipe(self, recipe_id: int) -> None:
         """
         Delete a recipe from the database by its unique ID.
 
@@ -211,14 +351,43 @@ class RecipeService:
         ------
         RecipeNotFoundError
             If no recipe is found with the given ID.
+
+        Notes
+        -----
+        - The ingredients the recipe produces are unlinked with an ``UPDATE``
+          rather than the database's ``ON DELETE SET NULL``, so their
+          ``updated_at`` (and ETag) changes with them.
+        - Like `invalidates_cache`, the ingredient cache's generation is bumped
+          before the write, so ingredient reads in flight cannot store rows that
+          still carry the deleted recipe's ID.
         """
-        recipe = self._get_recipe_by_id(recipe_id)
-        if recipe is None:
+        if self.ingredient_cache is not None:
+            await self.ingredient_cache.bump_generation()
+        await self._unlink_products(recipe_id)
+        if not await self._delete_recipe_by_id(recipe_id):
             raise RecipeNotFoundError(recipe_id=recipe_id)
-        self.db_session.delete(recipe)
-        self.db_session.commit()
+        await self.db_session.commit()
+        if self.ingredient_cache is not None:
+            await self.ingredient_cache.clear()
+
+    async def _unlink_products(self, recipe_id: int) -> None:
+        """
+        Clear the ``recipe_id`` of the ingredients produced by a recipe.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The unique ID of the recipe.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        await self.db_session.execute(
+            update(Ingredient).filter_by(recipe_id=recipe_id).values(recipe_id=None)
+        )
 
-    def _get_recipe_by_id(self, recipe_id: int) -> Optional[Recipe]:
+    async def _get_recipe_by_id(self, recipe_id: int) -> Optional[Recipe]:
         """
         Retrieve a recipe from the database by its unique ID.
 
@@ -236,9 +405,9 @@ class RecipeService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Recipe).filter_by(id=recipe_id).first()
+        return await self.db_session.scalar(select(Recipe).filter_by(id=recipe_id).limit(1))
 
-    def _get_recipe_by_name(self, name: str) -> Optional[Recipe]:
+    async def _get_recipe_by_name(self, name: str) -> Optional[Recipe]:
         """
         Retrieve a recipe from the database by its name.
 
@@ -256,4 +425,53 @@ class RecipeService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Recipe).filter_by(name=name).first()
+        return await self.db_session.scalar(select(Recipe).filter_by(name=name).limit(1))
+
+    async def _update_recipe_by_id(
+        self, recipe_id: int, values: dict[str, Any]
+    ) -> Optional[Recipe]:
+        """
+        Update a recipe by its unique ID with a single ``UPDATE ... RETURNING``.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The unique ID of the recipe to update.
+        values : dict[str, Any]
+            The new column values. Must not be empty.
+
+        Returns
+        -------
+        Optional[Recipe]
+            The updated `Recipe` instance if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            update(Recipe).filter_by(id=recipe_id).values(**values).returning(Recipe)
+        )
+
+    async def _delete_recipe_by_id(self, recipe_id: int) -> bool:
+        """
+        Delete a recipe by its unique ID with a single ``DELETE ... RETURNING``.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The unique ID of the recipe to delete.
+
+        Returns
+        -------
+        bool
+            Whether a recipe was deleted.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        deleted_id = await self.db_session.scalar(
+            delete(Recipe).filter_by(id=recipe_id).returning(Recipe.id)
+        )
+        return deleted_id is not None
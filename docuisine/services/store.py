@@ -1,17 +1,38 @@
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
+from docuisine.core.cache import Cache
+from docuisine.db.caching import cached_read, invalidates_cache
 from docuisine.db.models import Store
+from docuisine.db.routing import replica_read
 from docuisine.utils.errors.store import StoreExistsError, StoreNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage, paginate
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
 
 class StoreService:
-    def __init__(self, db_session: Session):
-        self.db_session: Session = db_session
+    SORT_COLUMNS = {"id": Store.id, "name": Store.name}
 
-    def create_store(
+    def __init__(self, db_session: AsyncSession, cache: Optional[Cache] = None):
+        """
+        Initialize the StoreService with a database session and an optional read cache.
+
+        Parameters
+        ----------
+        db_session : AsyncSession
+            The SQLAlchemy asyncio database session for database operations.
+        cache : Optional[Cache], optional
+            Cache of the stores read by `get_store` and `get_all_stores`, shared
+            between requests and cleared by every write, by default None (no caching).
+        """
+        self.db_session: AsyncSession = db_session
+        self.cache: Optional[Cache] = cache
+
+    @invalidates_cache
+    async def create_store(
         self,
         name: str,
         address: str,
@@ -62,13 +83,15 @@ class StoreService:
         )
         try:
             self.db_session.add(new_store)
-            self.db_session.commit()
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise StoreExistsError(name)
         return new_store
 
-    def get_store(self, store_id: Optional[int] = None, name: Optional[str] = None) -> Store:
+    @cached_read
+    @replica_read
+    async def get_store(self, store_id: Optional[int] = None, name: Optional[str] = None) -> Store:
         """
         Retrieve a store by ID or name.
 
@@ -96,9 +119,9 @@ class StoreService:
         - If both are provided, `store_id` takes precedence.
         """
         if store_id is not None:
-            result = self._get_store_by_id(store_id=store_id)
+            result = await self._get_store_by_id(store_id=store_id)
         elif name is not None:
-            result = self._get_store_by_name(name=name)
+            result = await self._get_store_by_name(name=name)
         else:
             raise ValueError("Either store ID or name must be provided.")
 
@@ -111,18 +134,73 @@ class StoreService:
 
         return result
 
-    def get_all_stores(self) -> list[Store]:
+    @cached_read
+    @replica_read
+    async def get_all_stores(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[Store]:
         """
-        Retrieve all stores from the database.
+        Retrieve a page of stores from the database.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of stores to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"name"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
 
         Returns
         -------
-        list[Store]
-            A list of all `Store` instances.
+        KeysetPage[Store]
+            The `Store` instances of the page and the cursor of the next page.
+
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
         """
-        return self.db_session.query(Store).all()
+        return await paginate(
+            self.db_session,
+            select(Store),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
 
-    def update_store(
+    @replica_read
+    async def stream_stores(self) -> AsyncScalarResult[Store]:
+        """
+        Stream all stores from the database through a server-side cursor.
+
+        Returns
+        -------
+        AsyncScalarResult[Store]
+            The `Store` instances ordered by ID, fetched in batches of
+            `STREAM_BATCH_SIZE` rows.
+
+        Notes
+        -----
+        - The session must stay open until the result is fully consumed.
+        """
+        return await self.db_session.stream_scalars(
+            select(Store).order_by(Store.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+    @invalidates_cache
+    async def update_store(
         self,
         store_id: int,
         name: Optional[str] = None,
@@ -167,34 +245,41 @@ class StoreService:
         StoreExistsError
             If updating the name conflicts with an existing store.
         """
-        store = self._get_store_by_id(store_id)
-        if store is None:
-            raise StoreNotFoundError(store_id=store_id)
-
+        values: dict[str, Any] = {}
         if name is not None:
-            store.name = name
+            values["name"] = name
         if address is not None:
-            store.address = address
+            values["address"] = address
         if longitude is not None:
-            store.longitude = longitude
+            values["longitude"] = longitude
         if latitude is not None:
-            store.latitude = latitude
+            values["latitude"] = latitude
         if phone is not None:
-            store.phone = phone
+            values["phone"] = phone
         if website is not None:
-            store.website = website
+            values["website"] = website
         if description is not None:
-            store.description = description
+            values["description"] = description
 
         try:
-            self.db_session.commit()
+            if values:
+                store = await self._update_store_by_id(store_id, values)
+            else:
+                store = await self._get_store_by_id(store_id)
+            if store is None:
+                raise StoreNotFoundError(store_id=store_id)
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
-            raise StoreExistsError(name if name is not None else store.name)
+            await self.db_session.rollback()
+            if name is None:
+                # Only a rename can collide with another store's name.
+                raise
+            raise StoreExistsError(name)
 
         return store
 
-    def delete_store(self, store_id: int) -> None:
+    @invalidates_cache
+    async def delete_store(self, store_id: int) -> None:
         """
         Delete a store from the database by its unique ID.
 
@@ -208,13 +293,11 @@ class StoreService:
         StoreNotFoundError
             If no store is found with the given ID.
         """
-        store = self._get_store_by_id(store_id)
-        if store is None:
+        if not await self._delete_store_by_id(store_id):
             raise StoreNotFoundError(store_id=store_id)
-        self.db_session.delete(store)
-        self.db_session.commit()
+        await self.db_session.commit()
 
-    def _get_store_by_id(self, store_id: int) -> Optional[Store]:
+    async def _get_store_by_id(self, store_id: int) -> Optional[Store]:
         """
         Retrieve a store from the database by its unique ID.
 
@@ -232,9 +315,9 @@ class StoreService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Store).filter_by(id=store_id).first()
+        return await self.db_session.scalar(select(Store).filter_by(id=store_id).limit(1))
 
-    def _get_store_by_name(self, name: str) -> Optional[Store]:
+    async def _get_store_by_name(self, name: str) -> Optional[Store]:
         """
         Retrieve a store from the database by its name.
 
@@ -252,4 +335,51 @@ class StoreService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Store).filter_by(name=name).first()
+        return await self.db_session.scalar(select(Store).filter_by(name=name).limit(1))
+
+    async def _update_store_by_id(self, store_id: int, values: dict[str, Any]) -> Optional[Store]:
+        """
+        Update a store by its unique ID with a single ``UPDATE ... RETURNING``.
+
+        Parameters
+        ----------
+        store_id : int
+            The unique ID of the store to update.
+        values : dict[str, Any]
+            The new column values. Must not be empty.
+
+        Returns
+        -------
+        Optional[Store]
+            The updated `Store` instance if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            update(Store).filter_by(id=store_id).values(**values).returning(Store)
+        )
+
+    async def _delete_store_by_id(self, store_id: int) -> bool:
+        """
+        Delete a store by its unique ID with a single ``DELETE ... RETURNING``.
+
+        Parameters
+        ----------
+        store_id : int
+            The unique ID of the store to delete.
+
+        Returns
+        -------
+        bool
+            Whether a store was deleted.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        deleted_id = await self.db_session.scalar(
+            delete(Store).filter_by(id=store_id).returning(Store.id)
+        )
+        return deleted_id is not None
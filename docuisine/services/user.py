@@ -1,37 +1,57 @@
 import datetime
-from typing import Optional, Union
+import time
+from typing import Any, Optional, Union
 
 import jwt
+from pydantic import ValidationError
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from docuisine.core.cache import Cache
+from docuisine.db.caching import forget_missing, load_unless_missing
 from docuisine.db.models import User
-from docuisine.schemas.auth import JWTConfig
+from docuisine.db.routing import replica_read
+from docuisine.schemas.auth import JWTConfig, Principal
 from docuisine.schemas.user import UserOut
 from docuisine.utils import errors
 from docuisine.utils.hashing import hash_in_sha256
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage, paginate
 
 
 class UserService:
+    SORT_COLUMNS = {"id": User.id, "username": User.username}
+
     def __init__(
         self,
-        db_session: Session,
+        db_session: AsyncSession,
         jwt_config: Optional[JWTConfig] = None,
+        principal_cache: Optional[Cache] = None,
+        not_found_cache: Optional[Cache] = None,
     ):
         """
         Initialize the UserService with a database session and optional JWT configuration.
 
         Parameters
         ----------
-        db_session : Session
-            The SQLAlchemy database session for database operations.
+        db_session : AsyncSession
+            The SQLAlchemy asyncio database session for database operations.
         jwt_config : Optional[JWTConfig], optional
             The JWT configuration for token generation and validation, by default None.
+        principal_cache : Optional[Cache], optional
+            Cache of authorized principals keyed by token digest, and of the users'
+            token versions, shared between requests, by default None (every token is
+            checked against the database).
+        not_found_cache : Optional[Cache], optional
+            Short-lived cache of usernames `get_user` did not find, so repeated lookups of
+            a missing username skip the database, by default None (no caching).
         """
-        self.db_session: Session = db_session
+        self.db_session: AsyncSession = db_session
         self.jwt_config = jwt_config
+        self.principal_cache = principal_cache
+        self.not_found_cache = not_found_cache
 
-    def create_user(self, username: str, password: str, email: Optional[str] = None) -> User:
+    async def create_user(self, username: str, password: str, email: Optional[str] = None) -> User:
         """
         Create a new user in the database with an encrypted password.
 
@@ -61,13 +81,17 @@ class UserService:
         new_user = User(username=username, password=encrypted_password, email=email)
         try:
             self.db_session.add(new_user)
-            self.db_session.commit()
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise errors.UserExistsError(username)
+        await forget_missing(self.not_found_cache, "users", username)
         return new_user
 
-    def get_user(self, user_id: Optional[int] = None, username: Optional[str] = None) -> User:
+    @replica_read
+    async def get_user(
+        self, user_id: Optional[int] = None, username: Optional[str] = None
+    ) -> User:
         """
         Retrieve a user from the database by ID or username.
 
@@ -95,9 +119,15 @@ class UserService:
         - If both `user_id` and `username` are provided, `user_id` takes precedence.
         """
         if user_id is not None:
-            result = self._get_user_by_id(user_id=user_id)
+            result = await self._get_user_by_id(user_id=user_id)
         elif username is not None:
-            result = self._get_user_by_username(username=username)
+            result = await load_unless_missing(
+                self.not_found_cache,
+                "users",
+                username,
+                self.db_session,
+                lambda: self._get_user_by_username(username=username),
+            )
         else:
             raise ValueError("Either user ID or username must be provided.")
 
@@ -110,18 +140,52 @@ class UserService:
 
         return result
 
-    def get_all_users(self) -> list[User]:
+    @replica_read
+    async def get_all_users(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> KeysetPage[User]:
         """
-        Retrieve all users from the database.
+        Retrieve a page of users from the database.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of users to return. Default is `DEFAULT_PAGE_SIZE`.
+        after : Optional[str], optional
+            The ``next`` cursor of the previous page. Default is None (first page).
+        sort : str, optional
+            The column to sort by, ``"id"`` or ``"username"``. Default is ``"id"``.
+        fields : Optional[tuple[str, ...]], optional
+            The columns to load, e.g. ``("id", "name")``. The others are left unloaded.
+            Default is None (every column).
 
         Returns
         -------
-        list[User]
-            A list of all `User` instances in the database.
+        KeysetPage[User]
+            The `User` instances of the page and the cursor of the next page.
+
+        Raises
+        ------
+        ValueError
+            If `sort` is not a sortable column.
+        InvalidCursorError
+            If `after` is not a valid cursor for `sort`.
         """
-        return self.db_session.query(User).all()
+        return await paginate(
+            self.db_session,
+            select(User),
+            self.SORT_COLUMNS,
+            sort=sort,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
 
-    def delete_user(self, user_id: int) -> None:
+    async def delete_user(self, user_id: int) -> None:
         """
         Delete a user from the database by their unique ID.
 
@@ -139,13 +203,12 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
-        if user is None:
+        if not await self._delete_user_by_id(user_id):
             raise errors.UserNotFoundError(user_id=user_id)
-        self.db_session.delete(user)
-        self.db_session.commit()
+        await self.db_session.commit()
+        await self._forget_principals()
 
-    def _get_user_by_id(self, user_id: int) -> Optional[User]:
+    async def _get_user_by_id(self, user_id: int) -> Optional[User]:
         """
         Retrieve a user from the database by their unique ID.
 
@@ -163,9 +226,9 @@ class UserService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(User).filter_by(id=user_id).first()
+        return await self.db_session.scalar(select(User).filter_by(id=user_id).limit(1))
 
-    def _get_user_by_username(self, username: str) -> Optional[User]:
+    async def _get_user_by_username(self, username: str) -> Optional[User]:
         """
         Retrieve a user from the database by their username.
         No business logic should be placed here.
@@ -184,9 +247,56 @@ class UserService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(User).filter_by(username=username).first()
+        return await self.db_session.scalar(select(User).filter_by(username=username).limit(1))
+
+    async def _update_user_by_id(self, user_id: int, values: dict[str, Any]) -> Optional[User]:
+        """
+        Update a user by their unique ID with a single ``UPDATE ... RETURNING``.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique ID of the user to update.
+        values : dict[str, Any]
+            The new column values. Must not be empty.
+
+        Returns
+        -------
+        Optional[User]
+            The updated `User` instance if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            update(User).filter_by(id=user_id).values(**values).returning(User)
+        )
+
+    async def _delete_user_by_id(self, user_id: int) -> bool:
+        """
+        Delete a user by their unique ID with a single ``DELETE ... RETURNING``.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique ID of the user to delete.
+
+        Returns
+        -------
+        bool
+            Whether a user was deleted.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        deleted_id = await self.db_session.scalar(
+            delete(User).filter_by(id=user_id).returning(User.id)
+        )
+        return deleted_id is not None
 
-    def update_user_email(self, user_id: int, new_email: str) -> User:
+    async def update_user_email(self, user_id: int, new_email: str) -> User:
         """
         Update the email address of an existing user.
 
@@ -213,18 +323,19 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
-        if user is None:
-            raise errors.UserNotFoundError(user_id=user_id)
-        user.email = new_email
         try:
-            self.db_session.commit()
+            user = await self._update_user_by_id(user_id, {"email": new_email})
+            if user is None:
+                raise errors.UserNotFoundError(user_id=user_id)
+            await self.db_session.commit()
         except IntegrityError:
-            self.db_session.rollback()
+            await self.db_session.rollback()
             raise errors.DuplicateEmailError(new_email)
         return user
 
-    def update_user_password(self, user_id: int, old_password: str, new_password: str) -> User:
+    async def update_user_password(
+        self, user_id: int, old_password: str, new_password: str
+    ) -> User:
         """
         Update the password of an existing user.
 
@@ -248,19 +359,22 @@ class UserService:
         Notes
         -----
         - The new password is encrypted using SHA-256 before storage.
+        - The user's token version is bumped, which revokes their existing tokens.
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
+        user = await self._get_user_by_id(user_id)
         if user is None:
             raise errors.UserNotFoundError(user_id=user_id)
         if not self._verify_password(old_password, user.password):
             raise errors.InvalidPasswordError("Old password does not match.")
         encrypted_password = hash_in_sha256(new_password)
         user.password = encrypted_password
-        self.db_session.commit()
+        user.token_version = User.token_version + 1
+        await self.db_session.commit()
+        await self._forget_principals()
         return user
 
-    def authenticate_user(
+    async def authenticate_user(
         self, password: str, id: Optional[int] = None, username: Optional[str] = None
     ) -> Union[User, bool]:
         """
@@ -293,7 +407,7 @@ class UserService:
         -----
         - The provided password is encrypted using SHA-256 for comparison.
         """
-        user = self.get_user(user_id=id, username=username)
+        user = await self.get_user(user_id=id, username=username)
         if not self._verify_password(password, user.password):
             raise errors.InvalidPasswordError
         return user
@@ -338,11 +452,22 @@ class UserService:
         ------
         ValueError
             If the JWT configuration is not set for the UserService.
+
+        Notes
+        -----
+        - Besides the ``sub`` username, the token carries the user's ``uid``,
+          ``role`` and token version ``ver``, so a stateless `authorize_user`
+          can build the principal without loading the user.
         """
 
         if self.jwt_config is None:
             raise ValueError("JWT configuration is not set for UserService.")
-        data = {"sub": user.username}
+        data: dict[str, Any] = {
+            "sub": user.username,
+            "uid": user.id,
+            "role": user.role,
+            "ver": user.token_version,
+        }
         if self.jwt_config.access_token_expire_minutes:
             expires_delta = datetime.timedelta(minutes=self.jwt_config.access_token_expire_minutes)
             data.update({"exp": datetime.datetime.now(datetime.timezone.utc) + expires_delta})
@@ -351,7 +476,7 @@ class UserService:
         )
         return token
 
-    def authorize_user(self, token: str) -> User:
+    async def authorize_user(self, token: str) -> Principal:
         """
         Authorize a user based on the provided JWT token.
 
@@ -362,8 +487,8 @@ class UserService:
 
         Returns
         -------
-        User
-            The authorized `User` instance.
+        Principal
+            The id, username and role of the authorized user.
 
         Raises
         ------
@@ -371,10 +496,30 @@ class UserService:
             If the JWT configuration is not set for the UserService.
         InvalidCredentialsError
             If the token is invalid.
+
+        Notes
+        -----
+        - With a `principal_cache`, a token seen before is answered from the cache
+          without decoding it or querying the database. Entries never outlive the
+          token's ``exp`` claim, and a principal looked up while its user was
+          changed is not cached.
+        - In stateless mode, the principal is built from the token's claims, and
+          only the user's current token version is looked up, from the
+          `principal_cache` when it holds it. Tokens without the ``ver`` claim
+          are still checked against the database.
+        - A token whose ``ver`` is not the user's current token version has been
+          revoked, e.g. by a password change.
         """
 
         if self.jwt_config is None:
             raise ValueError("JWT configuration is not set for UserService.")
+        token_digest = hash_in_sha256(token)
+        generation: Optional[int] = None
+        if self.principal_cache is not None:
+            principal = await self.principal_cache.get(token_digest)
+            if principal is not None:
+                return principal
+            generation = await self.principal_cache.generation()
         try:
             payload = jwt.decode(
                 token, self.jwt_config.secret_key, algorithms=[self.jwt_config.algorithm.value]
@@ -382,12 +527,96 @@ class UserService:
             username: str = payload.get("sub")
             if username is None:
                 raise errors.InvalidCredentialsError
-            user = self.get_user(username=username)
-        except (jwt.InvalidTokenError, errors.UserNotFoundError) as e:
+            if self.jwt_config.stateless and "ver" in payload:
+                principal = Principal(id=payload["uid"], username=username, role=payload["role"])
+                if await self._current_token_version(principal.id) != payload["ver"]:
+                    raise errors.InvalidCredentialsError
+                return principal
+            user = await self.get_user(username=username)
+            if "ver" in payload and payload["ver"] != user.token_version:
+                raise errors.InvalidCredentialsError
+        except (
+            jwt.InvalidTokenError,
+            KeyError,
+            ValidationError,
+            errors.UserNotFoundError,
+        ) as e:
             raise errors.InvalidCredentialsError from e
-        return user
+        principal = Principal.model_validate(user)
+        if self.principal_cache is not None and generation is not None:
+            expires_at = payload.get("exp")
+            ttl = None if expires_at is None else expires_at - time.time()
+            await self.principal_cache.set(token_digest, principal, ttl=ttl, generation=generation)
+        return principal
+
+    async def _current_token_version(self, user_id: int) -> Optional[int]:
+        """
+        Get the token version of a user, from the `principal_cache` when it holds it.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique ID of the user.
+
+        Returns
+        -------
+        Optional[int]
+            The user's token version, or ``None`` if the user does not exist.
+
+        Notes
+        -----
+        - Cached versions are dropped with the cached principals, by every change
+          that revokes tokens.
+        """
+        key = f"token_version:{user_id}"
+        if self.principal_cache is None:
+            return await self._get_token_version_by_id(user_id)
+        version = await self.principal_cache.get(key)
+        if version is not None:
+            return version
+        generation = await self.principal_cache.generation()
+        version = await self._get_token_version_by_id(user_id)
+        if version is not None and generation is not None:
+            await self.principal_cache.set(key, version, generation=generation)
+        return version
+
+    async def _get_token_version_by_id(self, user_id: int) -> Optional[int]:
+        """
+        Retrieve the token version of a user by their unique ID.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique ID of the user.
+
+        Returns
+        -------
+        Optional[int]
+            The user's token version if found, otherwise `None`.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        return await self.db_session.scalar(
+            select(User.token_version).filter_by(id=user_id).limit(1)
+        )
+
+    async def _forget_principals(self) -> None:
+        """
+        Drop every cached principal and token version, so all tokens are checked
+        against the database again.
+
+        Notes
+        -----
+        - The cache is keyed by token digest, so the principals of a single user
+          cannot be found without scanning it. Password changes and deletions
+          are rare enough to clear it entirely.
+        """
+        if self.principal_cache is not None:
+            await self.principal_cache.clear()
 
-    def update_user_img(self, user_id: int, img: str, preview_img: str) -> UserOut:
+    async def update_user_img(self, user_id: int, img: str, preview_img: str) -> UserOut:
         """
         Update the profile image and preview image of an existing user.
 
@@ -414,11 +643,9 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
+        user = await self._update_user_by_id(user_id, {"img": img, "preview_img": preview_img})
         if user is None:
             raise errors.UserNotFoundError(user_id=user_id)
-        user.img = img
-        user.preview_img = preview_img
-        self.db_session.commit()
+        await self.db_session.commit()
         user_out = UserOut.model_validate(user)
         return user_out
@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import threading
+import time
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing how well a cache is used.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from the cache.
+    misses : int
+        Lookups that found no valid entry, including expired ones.
+    evictions : int
+        Entries removed to make room for newer ones.
+    expirations : int
+        Entries found expired and removed by a lookup.
+    size : int
+        Number of entries currently stored.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-memory cache whose entries expire after a time-to-live.
+
+    When the cache is full, the least recently used entry is evicted.
+    The cache is safe to share between threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries. A size of 0 disables the cache.
+    ttl : float
+        The default number of seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get the value stored for ``key``.
+
+        Returns
+        -------
+        Optional[V]
+            The cached value, or ``None`` if the key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.misses += 1
+                self._stats.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` for ``key``.
+
+        Parameters
+        ----------
+        key : K
+            The cache key.
+        value : V
+            The value to cache.
+        ttl : Optional[float]
+            Seconds the entry stays valid. Default is the cache's ``ttl``.
+            Entries with a non-positive TTL are not stored.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def pop(self, key: K) -> None:
+        """Remove the entry for ``key`` if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache's counters."""
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
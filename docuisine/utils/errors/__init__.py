@@ -5,8 +5,10 @@ from .auth import (
     UnauthorizedError,
 )
 from .category import CategoryExistsError, CategoryNotFoundError
+from .fields import InvalidFieldsError
 from .image import UnsupportedImageFormatError
 from .ingredient import IngredientExistsError, IngredientNotFoundError
+from .pagination import InvalidCursorError
 from .recipe import RecipeExistsError, RecipeNotFoundError
 from .store import StoreExistsError, StoreNotFoundError
 from .user import DuplicateEmailError, UserExistsError, UserNotFoundError
@@ -24,6 +26,8 @@ __all__ = [
     "UnsupportedImageFormatError",
     "IngredientExistsError",
     "IngredientNotFoundError",
+    "InvalidCursorError",
+    "InvalidFieldsError",
     "StoreExistsError",
     "StoreNotFoundError",
     "RecipeExistsError",
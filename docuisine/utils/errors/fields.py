@@ -0,0 +1,11 @@
+from typing import Iterable
+
+
+class InvalidFieldsError(Exception):
+    """Exception raised when a sparse fieldset is empty or names unknown fields."""
+
+    def __init__(self, unknown: Iterable[str], allowed: Iterable[str]):
+        self.unknown = sorted(unknown)
+        problem = f"Unknown fields: {', '.join(self.unknown)}" if self.unknown else "No fields"
+        self.message = f"{problem}. Select one or more of: {', '.join(allowed)}."
+        super().__init__(self.message)
@@ -0,0 +1,6 @@
+class InvalidCursorError(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, message: str = "The pagination cursor is invalid."):
+        self.message = message
+        super().__init__(self.message)
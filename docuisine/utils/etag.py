@@ -0,0 +1,141 @@
+from datetime import timezone
+import hashlib
+from typing import Any, Iterable, Optional
+
+from fastapi import Response, status
+
+from docuisine.core.negotiation import JSON_MEDIA_TYPE, response_media_type
+from docuisine.utils.pagination import KeysetPage
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Compute a strong ETag from values identifying a representation.
+
+    Parameters
+    ----------
+    *parts : Any
+        Values whose ``repr`` changes whenever the representation changes.
+
+    Returns
+    -------
+    str
+        The quoted ETag, e.g. ``"3f5a..."``.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _version(entity: Any) -> tuple[Any, Any]:
+    updated_at = entity.updated_at
+    # Timestamps are in UTC, but SQLite reads them back without a time zone, so
+    # a value assigned in Python and the same value read back must hash alike.
+    if updated_at is not None and updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return entity.id, updated_at
+
+
+def entity_etag(entity: Any) -> str:
+    """
+    Compute the ETag of a single row from its type, ``id`` and ``updated_at``.
+
+    Parameters
+    ----------
+    entity : Any
+        A model instance with ``id`` and ``updated_at`` attributes.
+
+    Returns
+    -------
+    str
+        The quoted ETag.
+    """
+    return compute_etag(type(entity).__name__, _version(entity))
+
+
+def page_etag(page: KeysetPage[Any], fields: Optional[tuple[str, ...]] = None) -> str:
+    """
+    Compute the ETag of a page from the ``id`` and ``updated_at`` of its rows.
+
+    A row that is added, removed, reordered or updated changes the ETag, so it
+    does not depend on a table-wide version.
+
+    Parameters
+    ----------
+    page : KeysetPage[Any]
+        A page of model instances with ``id`` and ``updated_at`` attributes.
+    fields : Optional[tuple[str, ...]], optional
+        The sparse fieldset the page is rendered with, which gets its own ETag.
+        Default is None (every field).
+
+    Returns
+    -------
+    str
+        The quoted ETag.
+    """
+    item_type = type(page.items[0]).__name__ if page.items else None
+    versions = [_version(item) for item in page.items]
+    if fields is None:
+        return compute_etag(item_type, versions, page.next)
+    return compute_etag(item_type, versions, page.next, fields)
+
+
+def negotiated_etag(etag: str, media_type: Optional[str] = None) -> str:
+    """
+    Tag an ETag with the media type of the representation it is sent with.
+
+    A strong ETag must differ between representations of the same resource,
+    so a MessagePack body gets ``"<etag>-msgpack"`` and a JSON body keeps the
+    ETag. Routes compare ``If-None-Match`` against the tagged ETag.
+
+    Parameters
+    ----------
+    etag : str
+        The quoted ETag of the content, e.g. from `entity_etag`.
+    media_type : Optional[str], optional
+        The media type of the body. Default is None (the negotiated one).
+
+    Returns
+    -------
+    str
+        The quoted ETag of the representation.
+    """
+    media_type = media_type or response_media_type.get()
+    if media_type == JSON_MEDIA_TYPE:
+        return etag
+    return f'{etag[:-1]}-{media_type.rpartition("/")[2]}"'
+
+
+def _parse_etags(header: str) -> Iterable[str]:
+    for tag in header.split(","):
+        tag = tag.strip()
+        yield tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an ``If-None-Match`` header matches an ETag.
+
+    Uses the weak comparison required for ``If-None-Match``, so ``W/"x"`` matches ``"x"``.
+
+    Parameters
+    ----------
+    if_none_match : Optional[str]
+        The value of the request's ``If-None-Match`` header.
+    etag : str
+        The quoted ETag of the current representation.
+
+    Returns
+    -------
+    bool
+        Whether the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _parse_etags(if_none_match)
+
+
+def not_modified(etag: str) -> Response:
+    """Create an empty ``304 Not Modified`` response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
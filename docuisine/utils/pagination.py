@@ -0,0 +1,196 @@
+import base64
+import binascii
+from dataclasses import dataclass, field
+import json
+from typing import Any, Generic, Mapping, Optional, Sequence, TypeVar
+
+from sqlalchemy import BigInteger, Select, SmallInteger, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, load_only
+
+from docuisine.utils.errors import InvalidCursorError
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """
+    A page of rows and the cursor pointing after its last row.
+
+    Attributes
+    ----------
+    items : list[T]
+        The rows of the page, in sort order.
+    next : Optional[str]
+        Opaque cursor for the following page, ``None`` on the last page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next: Optional[str] = None
+
+
+def encode_cursor(sort: str, key: list[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+
+    Parameters
+    ----------
+    sort : str
+        The name of the column the page is sorted by.
+    key : list[Any]
+        The JSON serializable sort key values of the last row.
+
+    Returns
+    -------
+    str
+        A URL-safe base64 cursor.
+    """
+    payload = json.dumps({"sort": sort, "key": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> list[Any]:
+    """
+    Decode a cursor created by `encode_cursor`.
+
+    Parameters
+    ----------
+    cursor : str
+        The cursor received from the client.
+    sort : str
+        The name of the column the current request is sorted by.
+
+    Returns
+    -------
+    list[Any]
+        The sort key values of the last row of the previous page.
+
+    Raises
+    ------
+    InvalidCursorError
+        If the cursor is malformed or was issued for another sort column.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = payload["key"]
+        cursor_sort = payload["sort"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorError
+    if cursor_sort != sort or not isinstance(key, list):
+        raise InvalidCursorError("The pagination cursor does not match the requested sort order.")
+    return key
+
+
+def _fits_column(column: InstrumentedAttribute, value: Any) -> bool:
+    """
+    Check whether a cursor key value can be compared with a sort column.
+
+    Cursors come from clients, so a forged value of another type, an integer
+    out of the column's range or a string with a NUL character, which
+    PostgreSQL rejects, must not reach the database.
+    """
+    python_type = column.type.python_type
+    if python_type is int:
+        bits = 31
+        if isinstance(column.type, BigInteger):
+            bits = 63
+        elif isinstance(column.type, SmallInteger):
+            bits = 15
+        return (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and -(2**bits) <= value < 2**bits
+        )
+    if python_type is str:
+        return isinstance(value, str) and "\x00" not in value
+    return isinstance(value, python_type)
+
+
+def _load_columns(
+    id_column: InstrumentedAttribute,
+    sort_columns: list[InstrumentedAttribute],
+    fields: Sequence[str],
+) -> list[InstrumentedAttribute]:
+    mapper = id_column.property.parent
+    names = {*fields, "updated_at"}.intersection(mapper.column_attrs.keys())
+    return [*sort_columns, *(getattr(id_column.class_, name) for name in sorted(names))]
+
+
+async def paginate(
+    db_session: AsyncSession,
+    statement: Select,
+    sort_columns: Mapping[str, InstrumentedAttribute],
+    sort: str = "id",
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> KeysetPage:
+    """
+    Fetch one page of a select statement using keyset pagination.
+
+    Rows are ordered by ``(sort, id)`` and the page starts
+    strictly after the row encoded in ``after``, so the cost of a page
+    does not depend on how deep into the table it is.
+
+    Parameters
+    ----------
+    db_session : AsyncSession
+        The database session to execute the statement with.
+    statement : Select
+        A select statement of a single ORM entity, without ordering or limit.
+    sort_columns : Mapping[str, InstrumentedAttribute]
+        The columns clients may sort by, keyed by name. It must contain the
+        primary key under ``"id"``, which also breaks ties between equal
+        values. Column values must be JSON serializable.
+    sort : str, optional
+        The name of the column to sort by. Default is ``"id"``.
+    limit : int, optional
+        The maximum number of rows to return, capped at `MAX_PAGE_SIZE`.
+    after : Optional[str], optional
+        The ``next`` cursor of the previous page. Default is None (first page).
+    fields : Optional[Sequence[str]], optional
+        The names of the entity's columns to select. The sort columns and
+        ``updated_at``, which `page_etag` reads, are always selected, and names
+        that are not columns are ignored. Default is None (every column).
+
+    Returns
+    -------
+    KeysetPage
+        The rows of the page and the cursor of the next page.
+
+    Raises
+    ------
+    ValueError
+        If ``sort`` is not one of ``sort_columns``.
+    InvalidCursorError
+        If ``after`` is not a valid cursor for ``sort``, or its key values do not
+        match the types of the sort columns.
+    """
+    if sort not in sort_columns:
+        raise ValueError(f"Cannot sort by '{sort}'. Must be one of: {', '.join(sort_columns)}.")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    id_column = sort_columns["id"]
+    columns = [id_column] if sort == "id" else [sort_columns[sort], id_column]
+
+    if after is not None:
+        key = decode_cursor(after, sort)
+        if len(key) != len(columns) or not all(map(_fits_column, columns, key)):
+            raise InvalidCursorError
+        statement = statement.where(tuple_(*columns) > tuple_(*key))
+
+    if fields is not None:
+        statement = statement.options(load_only(*_load_columns(id_column, columns, fields)))
+
+    rows = list(await db_session.scalars(statement.order_by(*columns).limit(limit + 1)))
+    if len(rows) <= limit:
+        return KeysetPage(items=rows)
+
+    items = rows[:limit]
+    last = items[-1]
+    next_cursor = encode_cursor(sort, [getattr(last, column.key) for column in columns])
+    return KeysetPage(items=items, next=next_cursor)
@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+from docuisine.core.cache import Cache
+from docuisine.core.compression import allows_content_type, compress, negotiate_encoding
+from docuisine.core.config import get_settings
+from docuisine.core.negotiation import (
+    JSON_MEDIA_TYPE,
+    encode_model,
+    response_media_type,
+)
+from docuisine.utils.etag import etag_matches, negotiated_etag, not_modified
+
+
+class ModelResponse(Response):
+    """
+    JSON or MessagePack response for a validated model, encoded by compiled code.
+
+    Routes return it with the ``*Out`` model they validated themselves, so
+    FastAPI does not validate the model against ``response_model`` again and
+    then encode it. ``response_model`` stays declared for the OpenAPI schema.
+    Set the ``status_code`` here, because the route decorator's status code
+    does not apply to returned responses.
+
+    The media type defaults to the one the client negotiated with ``Accept``.
+    Routes pass the ETag of that representation (see `negotiated_etag`).
+    """
+
+    media_type = JSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        media_type = media_type or response_media_type.get()
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        return encode_model(content, self.media_type)
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """
+    A response body encoded once and served from the cache afterwards.
+
+    Attributes
+    ----------
+    etag : str
+        The quoted ETag of the identity-encoded body.
+    body : bytes
+        The JSON or MessagePack body.
+    compressed : dict[str, bytes]
+        The compressed bodies by content coding, in order of preference. Codings
+        that do not make the body smaller are left out.
+    media_type : str
+        The media type of the body.
+    """
+
+    etag: str
+    body: bytes
+    compressed: dict[str, bytes] = field(default_factory=dict)
+    media_type: str = JSON_MEDIA_TYPE
+
+    @classmethod
+    def encode(
+        cls,
+        etag: str,
+        content: BaseModel,
+        media_type: str = JSON_MEDIA_TYPE,
+        encodings: Sequence[str] = (),
+        min_size: int = 1024,
+    ) -> "EncodedResponse":
+        """
+        Encode a model and compress it in each of ``encodings``.
+
+        Parameters
+        ----------
+        etag : str
+            The quoted ETag of the content.
+        content : BaseModel
+            The model to encode.
+        media_type : str
+            `JSON_MEDIA_TYPE` or `MSGPACK_MEDIA_TYPE`. Default is JSON.
+        encodings : Sequence[str]
+            The content codings to compress the body in, in order of preference.
+            Default is none.
+        min_size : int
+            The smallest body in bytes worth compressing. Default is 1024.
+
+        Returns
+        -------
+        EncodedResponse
+            The encoded response.
+        """
+        body = encode_model(content, media_type)
+        compressed: dict[str, bytes] = {}
+        if len(body) >= min_size:
+            for encoding in encodings:
+                data = compress(body, encoding)
+                if len(data) < len(body):
+                    compressed[encoding] = data
+        return cls(
+            etag=negotiated_etag(etag, media_type),
+            body=body,
+            compressed=compressed,
+            media_type=media_type,
+        )
+
+
+async def cached_response(
+    cache: Optional[Cache],
+    key: str,
+    build: Callable[[], Awaitable[tuple[str, BaseModel]]],
+    if_none_match: Optional[str] = None,
+    accept_encoding: Optional[str] = None,
+) -> Response:
+    """
+    Serve a JSON or MessagePack response from a cache of encoded bodies.
+
+    On a miss, ``build`` loads the content and its ETag, and the body encoded
+    in the negotiated media type is cached under ``key``. A body of at least
+    ``COMPRESSION_MIN_SIZE`` bytes is cached compressed in each of the
+    ``COMPRESSION_ENCODINGS`` as well. Entries live in the service's cache, so
+    the writes that clear it also drop the stale bodies, and a body built while
+    a write was in flight is not stored. A hit neither queries the database
+    nor serializes or compresses anything.
+
+    Parameters
+    ----------
+    cache : Optional[Cache]
+        The cache of the service the content comes from. ``None`` disables caching.
+    key : str
+        Identifies the content, e.g. the route and its query parameters.
+    build : Callable[[], Awaitable[tuple[str, BaseModel]]]
+        Loads the ETag and the response model on a miss. Exceptions, such as an
+        ``HTTPException`` for invalid parameters, propagate unchanged.
+    if_none_match : Optional[str]
+        The request's ``If-None-Match`` header.
+    accept_encoding : Optional[str]
+        The request's ``Accept-Encoding`` header.
+
+    Returns
+    -------
+    Response
+        A ``304 Not Modified`` response if the client's copy is current,
+        otherwise the body, compressed in the coding the client prefers.
+    """
+    media_type = response_media_type.get()
+    key = f"response:{media_type}:{key}"
+    encoded: Optional[EncodedResponse] = None if cache is None else await cache.get(key)
+    if encoded is None:
+        settings = get_settings()
+        generation = None if cache is None else await cache.generation()
+        etag, content = await build()
+        encoded = EncodedResponse.encode(
+            etag,
+            content,
+            media_type,
+            encodings=(
+                settings.COMPRESSION_ENCODINGS
+                if allows_content_type(media_type, settings.COMPRESSION_CONTENT_TYPES)
+                else ()
+            ),
+            min_size=settings.COMPRESSION_MIN_SIZE,
+        )
+        if cache is not None and generation is not None:
+            await cache.set(key, encoded, generation=generation)
+
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = negotiate_encoding(accept_encoding, tuple(encoded.compressed))
+    if encoding is not None:
+        # A strong ETag must differ between content codings of the same resource.
+        etag = f'{encoded.etag[:-1]}-{encoding}"'
+        body = encoded.compressed[encoding]
+        headers["Content-Encoding"] = encoding
+    else:
+        etag = encoded.etag
+        body = encoded.body
+    if etag_matches(if_none_match, etag):
+        response = not_modified(etag)
+        response.headers["Vary"] = headers["Vary"]
+        return response
+    headers["ETag"] = etag
+    return Response(content=body, media_type=encoded.media_type, headers=headers)
@@ -0,0 +1,114 @@
+from functools import lru_cache
+from typing import Any, Iterable, Optional, TypeVar, cast
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from docuisine.utils.errors import InvalidFieldsError
+
+M = TypeVar("M", bound=BaseModel)
+
+SCHEMA_CACHE_SIZE = 256
+"""
+The most sparse schemas, and list adapters, kept at once. Clients choose the
+fieldsets, so the number of distinct selections must not grow memory unbounded.
+"""
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def list_adapter(schema: type[M]) -> TypeAdapter[list[M]]:
+    """Get the `TypeAdapter` of ``list[schema]``, built once per recently used schema and shared."""
+    return TypeAdapter(list[schema])  # ty: ignore[invalid-type-form]
+
+
+def _as_mapping(row: Any, fields: Any) -> Any:
+    # An ORM instance keeps its loaded column values in ``__dict__``. Reading
+    # that dict is several times faster than going through each instrumented
+    # attribute, but is only safe when every field is loaded: otherwise the
+    # instance itself is validated, so missing values are loaded, not defaulted.
+    values = getattr(row, "__dict__", None)
+    return values if values is not None and fields <= values.keys() else row
+
+
+def validate_list(schema: type[M], rows: Iterable[Any]) -> list[M]:
+    """
+    Validate a whole result set against an output schema in one pass.
+
+    Parameters
+    ----------
+    schema : type[M]
+        The output schema, e.g. ``RecipeOut``.
+    rows : Iterable[Any]
+        ORM instances, mappings or objects with the schema's attributes.
+
+    Returns
+    -------
+    list[M]
+        One validated ``schema`` instance per row, in order.
+    """
+    fields = schema.model_fields.keys()
+    return list_adapter(schema).validate_python(
+        [_as_mapping(row, fields) for row in rows], from_attributes=True
+    )
+
+
+def dump_list_json(schema: type[M], items: list[M]) -> bytes:
+    """Encode validated ``schema`` instances as a JSON array with the shared adapter."""
+    return list_adapter(schema).dump_json(items, by_alias=True)
+
+
+def select_fields(schema: type[BaseModel], fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """
+    Parse a ``fields`` query parameter into a sparse fieldset of a schema.
+
+    Parameters
+    ----------
+    schema : type[BaseModel]
+        The output schema the fields are selected from.
+    fields : Optional[str]
+        Comma-separated field names, e.g. ``"id,name"``.
+
+    Returns
+    -------
+    Optional[tuple[str, ...]]
+        The selected names in the schema's field order, so equivalent selections
+        share cache entries and ETags. ``None`` if ``fields`` is ``None`` or
+        selects every field.
+
+    Raises
+    ------
+    InvalidFieldsError
+        If a name is not a field of ``schema``, or no name is given.
+    """
+    if fields is None:
+        return None
+    names = {name.strip() for name in fields.split(",")} - {""}
+    unknown = names - schema.model_fields.keys()
+    if unknown or not names:
+        raise InvalidFieldsError(unknown, schema.model_fields)
+    if len(names) == len(schema.model_fields):
+        return None
+    return tuple(name for name in schema.model_fields if name in names)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def sparse_schema(schema: type[M], fields: Optional[tuple[str, ...]]) -> type[M]:
+    """
+    Get a copy of ``schema`` with only the fields returned by `select_fields`.
+
+    The copy keeps each field's type, constraints and alias, and is built once
+    per recently used selection. With ``fields=None`` it is ``schema`` itself.
+    """
+    if fields is None:
+        return schema
+    definitions: dict[str, Any] = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields
+    }
+    return cast(
+        type[M],
+        create_model(
+            schema.__name__,
+            __config__=ConfigDict(from_attributes=True),
+            __module__=schema.__module__,
+            **definitions,
+        ),
+    )
@@ -0,0 +1,46 @@
+from typing import AsyncIterator, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+
+from docuisine.utils.serialization import dump_list_json, validate_list
+
+T = TypeVar("T")
+
+STREAM_BATCH_SIZE = 500
+
+
+async def stream_json_array(
+    result: AsyncScalarResult[T], schema: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """
+    Serialize streamed ORM rows into a JSON array, one batch at a time.
+
+    Parameters
+    ----------
+    result : AsyncScalarResult[T]
+        The streamed rows, e.g. from ``AsyncSession.stream_scalars``. Rows are
+        read in partitions of the statement's ``yield_per`` size.
+    schema : type[BaseModel]
+        The output schema each row is validated against.
+
+    Yields
+    ------
+    bytes
+        Chunks that together form a JSON array of the serialized rows.
+
+    Notes
+    -----
+    Only one partition of rows and its serialized chunk are held in memory
+    at a time, so memory use does not grow with the number of rows.
+    """
+    yield b"["
+    separator = b""
+    async for partition in result.partitions():
+        if not partition:
+            continue
+        # The partition's array without its brackets, so partitions join into one array.
+        chunk = dump_list_json(schema, validate_list(schema, partition))[1:-1]
+        yield separator + chunk
+        separator = b","
+    yield b"]"
@@ -0,0 +1,168 @@
+"""
+Compare the CPU time per request of three ways to serve a list endpoint:
+
+- default: validate each row with ``model_validate`` and return the page, which
+  FastAPI validates against ``response_model`` and encodes.
+- fast: validate each row, and return a `ModelResponse` encoded by pydantic-core.
+- bulk: validate all rows in one pass with `validate_list`, and return a `ModelResponse`.
+
+Usage::
+
+    uv run python scripts/benchmarks/json_responses.py [--rows 100] [--requests 1000] [--rounds 5]
+
+The routes run against in-memory rows, so the numbers measure validation and
+encoding only, without the database.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import time
+from typing import Any, Callable
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from docuisine.db.models import Category, Recipe
+from docuisine.schemas.category import CategoryOut
+from docuisine.schemas.common import Page
+from docuisine.schemas.recipe import RecipeOut
+from docuisine.utils.responses import ModelResponse
+from docuisine.utils.serialization import validate_list
+
+VARIANTS = ("default", "fast", "bulk")
+
+
+def loaded(instance: Any, schema: type[BaseModel]) -> Any:
+    """Set the columns left unset, as on a row loaded from the database."""
+    for field in schema.model_fields:
+        if field not in instance.__dict__:
+            setattr(instance, field, None)
+    return instance
+
+
+def build_app(rows: int) -> FastAPI:
+    now = datetime.now()
+    datasets: dict[str, tuple[type[BaseModel], list[Any]]] = {
+        "categories": (
+            CategoryOut,
+            [
+                loaded(
+                    Category(
+                        id=i,
+                        name=f"Category {i}",
+                        description="Sweet dishes and treats",
+                        created_at=now,
+                        updated_at=now,
+                    ),
+                    CategoryOut,
+                )
+                for i in range(rows)
+            ],
+        ),
+        "recipes": (
+            RecipeOut,
+            [
+                loaded(
+                    Recipe(
+                        id=i,
+                        user_id=1,
+                        name=f"Recipe {i}",
+                        cook_time_sec=3600,
+                        prep_time_sec=1200,
+                        servings=4,
+                        description="Delicious chocolate cake",
+                    ),
+                    RecipeOut,
+                )
+                for i in range(rows)
+            ],
+        ),
+    }
+    app = FastAPI()
+    for name, (schema, items) in datasets.items():
+
+        def page(schema: type[BaseModel] = schema, items: list[Any] = items) -> BaseModel:
+            return Page[schema](items=[schema.model_validate(item) for item in items], next=None)
+
+        async def default(page: Callable[[], BaseModel] = page) -> BaseModel:
+            return page()
+
+        async def fast(page: Callable[[], BaseModel] = page) -> ModelResponse:
+            return ModelResponse(page())
+
+        def bulk_page(schema: type[BaseModel] = schema, items: list[Any] = items) -> BaseModel:
+            return Page[schema](items=validate_list(schema, items), next=None)
+
+        async def bulk(page: Callable[[], BaseModel] = bulk_page) -> ModelResponse:
+            return ModelResponse(page())
+
+        for variant, endpoint in zip(VARIANTS, (default, fast, bulk)):
+            app.get(f"/{variant}/{name}", response_model=Page[schema])(endpoint)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[-1]["body"]
+
+
+async def cpu_per_request(app: FastAPI, path: str, requests: int) -> float:
+    start = time.process_time()
+    for _ in range(requests):
+        await call(app, path)
+    return (time.process_time() - start) / requests * 1e6
+
+
+async def compare(app: FastAPI, name: str, requests: int, rounds: int) -> list[float]:
+    # Alternating rounds and keeping the fastest of each hides most scheduling noise.
+    timings: dict[str, list[float]] = {variant: [] for variant in VARIANTS}
+    for _ in range(rounds):
+        for variant in VARIANTS:
+            timings[variant].append(await cpu_per_request(app, f"/{variant}/{name}", requests))
+    return [min(timings[variant]) for variant in VARIANTS]
+
+
+async def main(rows: int, requests: int, rounds: int) -> None:
+    app = build_app(rows)
+    header = "".join(f"{variant + ' µs':>12}" for variant in VARIANTS)
+    print(f"{'endpoint':<12}{header}{'saved':>8}")
+    for name in ("categories", "recipes"):
+        bodies = [json.loads(await call(app, f"/{variant}/{name}")) for variant in VARIANTS]
+        assert all(body == bodies[0] for body in bodies), "Bodies differ"
+        timings = await compare(app, name, requests, rounds)
+        columns = "".join(f"{timing:>12.0f}" for timing in timings)
+        saved = (timings[0] - timings[-1]) / timings[0]
+        print(f"{name:<12}{columns}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100, help="Items per page")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per endpoint")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests, args.rounds))
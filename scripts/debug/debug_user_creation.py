@@ -1,14 +1,16 @@
+import asyncio
+
 from fastapi import HTTPException, status
 
+from docuisine.db.database import AsyncSessionLocal
 from docuisine.db.models import User
-from docuisine.dependencies.db import get_db_session
 from docuisine.dependencies.services import User_Service, get_user_service
 from docuisine.schemas.auth import Token
 from docuisine.schemas.enums import TokenType
 from docuisine.utils import errors
 
 
-def login(form_data: dict, user_service: User_Service) -> Token:
+async def login(form_data: dict, user_service: User_Service) -> Token:
     invalid_credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid username or password.",
@@ -16,7 +18,7 @@ def login(form_data: dict, user_service: User_Service) -> Token:
     )
 
     try:
-        user = user_service.authenticate_user(
+        user = await user_service.authenticate_user(
             username=form_data["username"], password=form_data["password"]
         )
     except errors.UserNotFoundError:
@@ -34,4 +36,11 @@ def login(form_data: dict, user_service: User_Service) -> Token:
     )
 
 
-login({"username": "alice", "password": "hashed_password_1P!"}, get_user_service(get_db_session()))
+async def main():
+    async with AsyncSessionLocal() as session:
+        await login(
+            {"username": "alice", "password": "hashed_password_1P!"}, get_user_service(session)
+        )
+
+
+asyncio.run(main())
@@ -1,14 +1,15 @@
-from sqlalchemy.orm import Session
+import asyncio
 
-from docuisine.db.database import SessionLocal
+from docuisine.db.database import AsyncSessionLocal
 from docuisine.services import UserService
 
-session: Session = SessionLocal()
 
-user_service = UserService(db_session=session)
+async def main():
+    async with AsyncSessionLocal() as session:
+        user_service = UserService(db_session=session)
 
-
-user = user_service._get_user_by_id(user_id=1)
-print(user.__dict__)
+        user = await user_service._get_user_by_id(user_id=1)
+        print(user.__dict__)
 
 
+asyncio.run(main())
@@ -1,6 +1,6 @@
 CREATE TABLE default_table (
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
 CREATE TABLE entity (
@@ -13,7 +13,8 @@ CREATE TABLE users (
     username TEXT UNIQUE NOT NULL,
     email TEXT UNIQUE,
     password TEXT NOT NULL,
-    role TEXT NOT NULL
+    role TEXT NOT NULL,
+    token_version INTEGER NOT NULL DEFAULT 1
 ) INHERITS (entity);
 
 
@@ -87,6 +88,15 @@ CREATE TABLE shelf (
 ) INHERITS (default_table);
 
 
+CREATE INDEX ix_recipes_user_id ON recipes (user_id);
+CREATE INDEX ix_recipes_name ON recipes (name);
+CREATE INDEX ix_ingredients_recipe_id ON ingredients (recipe_id);
+CREATE INDEX ix_recipe_ingredients_ingredient_id ON recipe_ingredients (ingredient_id);
+CREATE INDEX ix_recipe_categories_category_id ON recipe_categories (category_id);
+CREATE INDEX ix_stores_name ON stores (name);
+CREATE INDEX ix_shelf_ingredient_id ON shelf (ingredient_id);
+
+
 CREATE OR REPLACE FUNCTION set_updated_at()
 RETURNS TRIGGER AS $$
 BEGIN
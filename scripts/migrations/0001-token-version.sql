@@ -0,0 +1,6 @@
+-- Adds the per-user token version checked against the "ver" claim of access
+-- tokens. `create_all` does not add columns to existing tables, so databases
+-- created before it must run this once, e.g.
+--   psql "$DATABASE_URL" -f scripts/migrations/0001-token-version.sql
+-- Every existing token carries version 1, so they stay valid.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 1;
@@ -10,6 +10,17 @@ def test_create_user(client, setup_and_teardown):
     assert "id" in data
 
 
+def test_create_user_single_statement(client, setup_and_teardown):
+    """Test that the created user is returned without reloading it after the commit."""
+    user_data = {
+        "username": "returninguser",
+        "password": "789Password!",
+    }
+    response = client.post("/users/", json=user_data)
+    assert response.status_code == 201, response.text
+    assert response.headers["X-Query-Count"] == "1"
+
+
 def test_get_user(client, setup_and_teardown):
     # First, create a user to retrieve
     user_data = {
@@ -55,3 +66,66 @@ def test_create_user_with_email_success(client, setup_and_teardown):
     assert data["username"] == user_data["username"]
     assert data["email"] == user_data["email"]
     assert "id" in data
+
+
+def login(client, username: str, password: str) -> dict:
+    response = client.post("/auth/token", data={"username": username, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_update_user_email(client, setup_and_teardown):
+    user_data = {
+        "username": "emailuser",
+        "password": "789Password!",
+    }
+    created_user = client.post("/users/", json=user_data).json()
+    headers = login(client, **user_data)
+
+    response = client.put(
+        "/users/email",
+        json={"id": created_user["id"], "password": user_data["password"], "email": "e@mail.com"},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["email"] == "e@mail.com"
+    # One statement to authenticate and a single UPDATE ... RETURNING
+    assert response.headers["X-Query-Count"] == "2"
+
+
+def test_delete_user(client, setup_and_teardown):
+    user_data = {
+        "username": "deleteduser",
+        "password": "789Password!",
+    }
+    created_user = client.post("/users/", json=user_data).json()
+    headers = login(client, **user_data)
+
+    response = client.delete(f"/users/{created_user['id']}", headers=headers)
+    assert response.status_code == 200, response.text
+    # One statement to authenticate and a single DELETE ... RETURNING
+    assert response.headers["X-Query-Count"] == "2"
+    assert client.get(f"/users/{user_data['username']}").status_code == 404
+
+
+def test_update_password_revokes_tokens(client, setup_and_teardown):
+    user_data = {
+        "username": "passworduser",
+        "password": "789Password!",
+    }
+    created_user = client.post("/users/", json=user_data).json()
+    headers = login(client, **user_data)
+
+    response = client.put(
+        "/users/password",
+        json={
+            "id": created_user["id"],
+            "old_password": user_data["password"],
+            "new_password": "987Password!",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert client.delete(f"/users/{created_user['id']}", headers=headers).status_code == 401
+    new_headers = login(client, username=user_data["username"], password="987Password!")
+    assert client.delete(f"/users/{created_user['id']}", headers=new_headers).status_code == 200
@@ -1,29 +1,41 @@
+import asyncio
+
 from fastapi.testclient import TestClient
 import pytest
-from sqlalchemy import StaticPool, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from docuisine.db.models.base import Base
-from docuisine.dependencies.db import get_db_session
+from docuisine.db.profiling import install_query_counter
+from docuisine.dependencies.db import get_async_db_session
+from docuisine.dependencies.services import caches
 from docuisine.main import app
 
-DATABASE_URL = "sqlite:///:memory:"
+DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
+engine = create_async_engine(
     DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+install_query_counter(engine.sync_engine)
+TestingSessionLocal = async_sessionmaker(autoflush=False, bind=engine, expire_on_commit=False)
 
 
-def get_test_db():
-    db = TestingSessionLocal()
-    try:
+async def get_test_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-app.dependency_overrides[get_db_session] = get_test_db
+app.dependency_overrides[get_async_db_session] = get_test_db
+
+
+async def create_tables():
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def drop_tables():
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
 
 
 @pytest.fixture()
@@ -31,9 +43,11 @@ def setup_and_teardown():
     """Setup and teardown the database for tests."""
     # NOTE: A faster way to setup and teardown the database
     # for tests is by using rollbacks, without committing changes.
-    Base.metadata.create_all(bind=engine)
+    asyncio.run(create_tables())
     yield
-    Base.metadata.drop_all(bind=engine)
+    asyncio.run(drop_tables())
+    for cache in caches.values():
+        asyncio.run(cache.clear())
 
 
 @pytest.fixture(scope="module")
@@ -3,6 +3,8 @@ from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from docuisine.db.models import User
 from docuisine.dependencies.auth import get_client_user
@@ -13,16 +15,17 @@ from docuisine.schemas.enums import Role
 @pytest.fixture
 def db_session():
     """
-    Provide a mock database session for testing.
+    Provide a mock asyncio database session for testing.
     Used in unit tests for services by mocking the database session.
+
+    NOTES
+    -----
+    The mock is specced against `AsyncSession`, so awaitable methods such as
+    `commit`, `scalar` and `scalars` are `AsyncMock` instances. Its
+    `sync_session` is a plain `Session`, so reads never go to a replica.
     """
-    session = MagicMock()
-    session.query.return_value = session
-    session.filter_by.return_value = session
-    session.delete.return_value = session
-    session.commit.return_value = session
-    session.add.return_value = session
-    session.rollback.return_value = session
+    session = MagicMock(spec=AsyncSession)
+    session.sync_session = MagicMock(spec=Session)
     return session
 
 
@@ -0,0 +1,153 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from fakeredis import FakeAsyncRedis
+import pytest
+from redis.exceptions import ConnectionError
+
+from docuisine.core.cache import (
+    Cache,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    create_cache_backend,
+)
+from docuisine.db.models import Category
+from docuisine.utils.pagination import KeysetPage
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def redis_client():
+    """Provide an in-process stand-in for a Redis server."""
+    return FakeAsyncRedis()
+
+
+async def test_memory_namespaces_are_cleared_independently():
+    backend = MemoryCacheBackend()
+    categories = Cache(backend, "categories", maxsize=8, ttl=60)
+    stores = Cache(backend, "stores", maxsize=8, ttl=60)
+    await categories.set("a", 1)
+    await stores.set("a", 2)
+
+    await categories.clear()
+
+    assert await categories.get("a") is None
+    assert await stores.get("a") == 2
+
+
+async def test_memory_delete_keeps_other_keys():
+    cache = Cache(MemoryCacheBackend(), "not_found", maxsize=8, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    await cache.delete("a")
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
+
+
+async def test_memory_respects_maxsize():
+    cache = Cache(MemoryCacheBackend(), "categories", maxsize=1, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    assert await cache.get("a") is None
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.parametrize("maxsize, ttl", [(0, 60), (8, 0)])
+async def test_disabled_cache(maxsize: int, ttl: float):
+    cache = Cache(MemoryCacheBackend(), "categories", maxsize=maxsize, ttl=ttl)
+    await cache.set("a", 1)
+    assert await cache.get("a") is None
+
+
+async def test_memory_set_is_dropped_after_a_new_generation():
+    cache = Cache(MemoryCacheBackend(), "categories", maxsize=8, ttl=60)
+    generation = await cache.generation()
+    await cache.bump_generation()
+
+    await cache.set("a", 1, generation=generation)
+    await cache.set("b", 2, generation=await cache.generation())
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
+
+
+async def test_redis_entries_are_shared_between_workers(redis_client: FakeAsyncRedis):
+    first = Cache(RedisCacheBackend(redis_client), "categories", maxsize=8, ttl=60)
+    second = Cache(RedisCacheBackend(redis_client), "categories", maxsize=8, ttl=60)
+    page = KeysetPage(items=[Category(id=1, name="Korean")], next="cursor")
+
+    await first.set("page", page)
+    cached = await second.get("page")
+
+    assert cached.next == "cursor"
+    assert cached.items[0].name == "Korean"
+    assert second.stats().hits == 1
+
+    await second.clear()
+    assert await first.get("page") is None
+
+
+async def test_redis_clear_keeps_other_namespaces(redis_client: FakeAsyncRedis):
+    backend = RedisCacheBackend(redis_client)
+    categories = Cache(backend, "categories", maxsize=8, ttl=60)
+    stores = Cache(backend, "stores", maxsize=8, ttl=60)
+    await categories.set("a", 1)
+    await stores.set("a", 2)
+
+    await categories.clear()
+
+    assert await categories.get("a") is None
+    assert await stores.get("a") == 2
+
+
+async def test_redis_delete_is_shared_between_workers(redis_client: FakeAsyncRedis):
+    first = Cache(RedisCacheBackend(redis_client), "not_found", maxsize=8, ttl=60)
+    second = Cache(RedisCacheBackend(redis_client), "not_found", maxsize=8, ttl=60)
+    await first.set("a", 1)
+    await first.set("b", 2)
+
+    await second.delete("a")
+
+    assert await first.get("a") is None
+    assert await first.get("b") == 2
+
+
+async def test_redis_generation_is_shared_between_workers(redis_client: FakeAsyncRedis):
+    first = Cache(RedisCacheBackend(redis_client), "categories", maxsize=8, ttl=60)
+    second = Cache(RedisCacheBackend(redis_client), "categories", maxsize=8, ttl=60)
+    generation = await first.generation()
+
+    await second.clear()
+    await first.set("a", 1, generation=generation)
+    await first.set("b", 2, generation=await first.generation())
+
+    assert await second.generation() == generation + 1
+    assert await second.get("a") is None
+    assert await second.get("b") == 2
+
+
+async def test_redis_entries_expire(redis_client: FakeAsyncRedis):
+    cache = Cache(RedisCacheBackend(redis_client), "principals", maxsize=8, ttl=60)
+    await cache.set("a", 1, ttl=30)
+    assert 0 < await redis_client.pttl("docuisine:principals:a") <= 30_000
+
+
+async def test_redis_failures_are_misses():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=ConnectionError("down"))
+    client.set = AsyncMock(side_effect=ConnectionError("down"))
+    cache = Cache(RedisCacheBackend(client), "categories", maxsize=8, ttl=60)
+
+    await cache.set("a", 1)
+    assert await cache.get("a") is None
+    assert cache.stats().misses == 1
+
+
+def test_create_cache_backend():
+    assert isinstance(create_cache_backend("memory://"), MemoryCacheBackend)
+    assert isinstance(create_cache_backend("redis://localhost:6379/0"), RedisCacheBackend)
+    with pytest.raises(ValueError, match="Unsupported cache URL"):
+        create_cache_backend("memcached://localhost")
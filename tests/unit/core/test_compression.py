@@ -0,0 +1,126 @@
+import gzip
+import json
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+import httpx
+import pytest
+
+from docuisine.core.compression import CompressionMiddleware, negotiate_encoding
+
+pytestmark = pytest.mark.anyio
+
+ITEMS = [{"id": i, "name": f"Ingredient {i}"} for i in range(100)]
+
+
+def make_app(**options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items() -> Response:
+        return Response(json.dumps(ITEMS), media_type="application/json", headers={"ETag": '"1"'})
+
+    @app.get("/small")
+    async def small() -> dict:
+        return {"id": 1}
+
+    @app.get("/image")
+    async def image() -> Response:
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/precompressed")
+    async def precompressed() -> Response:
+        body = gzip.compress(json.dumps(ITEMS).encode())
+        return Response(body, media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for item in ITEMS:
+                yield json.dumps(item).encode() + b"\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(CompressionMiddleware, **options)  # type: ignore
+    return app
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("gzip", "gzip"),
+        ("gzip;q=0.5, br", "br"),
+        ("br;q=0.5, zstd;q=0.5", "zstd"),
+        ("*", "zstd"),
+        ("gzip;q=0, *;q=0.1", "zstd"),
+        ("identity", None),
+        ("deflate, gzip;q=invalid", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str):
+    assert negotiate_encoding(accept_encoding, ("zstd", "br", "gzip")) == expected
+
+
+async def test_compresses_json_responses():
+    async with client(make_app()) as c:
+        response = await c.get("/items", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"1"'
+    assert int(response.headers["Content-Length"]) < len(json.dumps(ITEMS))
+    assert response.json() == ITEMS
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [
+        ("/items", "identity"),
+        ("/small", "gzip"),
+        ("/image", "gzip"),
+        ("/precompressed", "gzip, br"),
+    ],
+)
+async def test_passes_through_other_responses(path: str, accept_encoding: str):
+    app = make_app(encodings=("br", "gzip"))
+    async with client(app) as c:
+        response = await c.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("Content-Encoding") == (
+        "gzip" if path == "/precompressed" else None
+    )
+    assert response.status_code == 200
+
+
+async def test_compresses_streamed_responses():
+    async with client(make_app(encodings=("gzip",))) as c:
+        response = await c.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert [json.loads(line) for line in response.text.splitlines()] == ITEMS
+
+
+@pytest.mark.parametrize("encoding, package", [("br", "brotli"), ("zstd", "zstandard")])
+async def test_optional_encodings(encoding: str, package: str):
+    pytest.importorskip(package)
+    app = make_app(encodings=("zstd", "br", "gzip"))
+    async with client(app) as c:
+        response = await c.get("/items", headers={"Accept-Encoding": f"gzip;q=0.5, {encoding}"})
+        streamed = await c.get("/stream", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert response.json() == ITEMS
+    assert streamed.headers["Content-Encoding"] == encoding
+    assert [json.loads(line) for line in streamed.text.splitlines()] == ITEMS
+
+
+def test_rejects_unknown_encodings():
+    with pytest.raises(ValueError):
+        CompressionMiddleware(FastAPI(), encodings=("deflate",))
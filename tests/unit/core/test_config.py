@@ -0,0 +1,70 @@
+from pydantic import ValidationError
+import pytest
+
+from docuisine.core import config
+from docuisine.core.config import Settings
+from docuisine.db.database import IS_PRODUCTION
+from docuisine.schemas.enums import JWTAlgorithm, Mode
+
+
+def test_settings_parse_environment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_PRE_PING", "off")
+    monkeypatch.setenv("JWT_STATELESS", "yes")
+    monkeypatch.setenv("READ_CACHE_TTL", "12.5")
+    monkeypatch.setenv("CACHE_INVALIDATION", " Postgres ")
+    monkeypatch.setenv("COMPRESSION_ENCODINGS", "br, GZIP,")
+
+    settings = Settings.from_env()
+
+    assert settings.MODE == Mode.DEVELOPMENT
+    assert settings.JWT_ALGORITHM == JWTAlgorithm.HS256
+    assert settings.DB_POOL_PRE_PING is False
+    assert settings.JWT_STATELESS is True
+    assert settings.READ_CACHE_TTL == 12.5
+    assert settings.CACHE_INVALIDATION == "postgres"
+    assert settings.COMPRESSION_ENCODINGS == ("br", "gzip")
+    assert settings.COMPRESSION_CONTENT_TYPES == (
+        "application/json",
+        "application/msgpack",
+        "text/*",
+    )
+    assert settings.jwt is settings.jwt
+    assert settings.jwt.stateless is True
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("DB_POOL_SIZE", "five"),
+        ("MODE", "staging"),
+        ("READ_CACHE_SIZE", "-1"),
+        ("COMPRESSION_ENCODINGS", "gzip,lzma"),
+    ],
+)
+def test_invalid_settings_fail(monkeypatch, name: str, value: str):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError, match=name):
+        Settings.from_env()
+
+
+def test_missing_required_setting_fails(monkeypatch):
+    monkeypatch.delenv("JWT_SECRET_KEY")
+    with pytest.raises(ValidationError, match="JWT_SECRET_KEY"):
+        Settings.from_env()
+
+
+def test_settings_are_immutable():
+    with pytest.raises(ValidationError):
+        config.settings.MODE = Mode.PRODUCTION
+
+
+def test_reload_settings(monkeypatch):
+    monkeypatch.setattr(config, "settings", config.settings)
+    monkeypatch.setenv("VERSION", "2.0.0")
+    monkeypatch.setenv("MODE", "production")
+
+    reloaded = config.reload_settings()
+
+    assert reloaded.VERSION == "2.0.0"
+    assert config.get_settings() is reloaded
+    assert IS_PRODUCTION()
@@ -0,0 +1,88 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from fakeredis import FakeAsyncRedis
+import pytest
+
+from docuisine.core.cache import Cache, MemoryCacheBackend, RedisCacheBackend
+from docuisine.core.invalidation import (
+    LocalInvalidationBus,
+    PostgresInvalidationBus,
+    create_invalidation_bus,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def worker_cache(bus, namespace: str = "categories") -> Cache:
+    """Create a cache with its own memory backend, as a separate worker would have."""
+    return Cache(MemoryCacheBackend(), namespace, maxsize=8, ttl=60, bus=bus)
+
+
+async def test_local_bus_evicts_other_caches():
+    bus = LocalInvalidationBus()
+    first, second = worker_cache(bus), worker_cache(bus)
+    stores = worker_cache(bus, "stores")
+    for cache in (first, second, stores):
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+    await first.delete("a")
+    assert await second.get("a") is None
+    assert await second.get("b") == 2
+
+    await first.clear()
+    assert await second.get("b") is None
+    assert await stores.get("a") == 1
+
+
+async def test_shared_backend_does_not_use_bus():
+    bus = LocalInvalidationBus()
+    cache = Cache(RedisCacheBackend(FakeAsyncRedis()), "categories", maxsize=8, ttl=60, bus=bus)
+    assert cache.bus is None
+
+
+async def test_postgres_bus_publishes_and_applies_notifications():
+    bus = PostgresInvalidationBus("postgresql://localhost/docuisine")
+    bus._publisher = MagicMock(is_closed=MagicMock(return_value=False), execute=AsyncMock())
+    first = worker_cache(bus)
+
+    await first.delete("a" * 10_000)
+    channel, payload = bus._publisher.execute.await_args.args[1:]
+    assert channel == "docuisine_cache"
+    # Too long for a notification, so the whole namespace is invalidated instead.
+    assert json.loads(payload) == {"origin": bus.origin, "namespace": "categories", "key": None}
+
+    other = PostgresInvalidationBus("postgresql://localhost/docuisine")
+    cache = worker_cache(other)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    other._on_notification(MagicMock(), 1, "docuisine_cache", payload.replace("null", '"a"'))
+    other._on_notification(MagicMock(), 1, "docuisine_cache", "not json")
+    await asyncio.sleep(0)
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
+
+
+async def test_postgres_bus_ignores_own_notifications():
+    bus = PostgresInvalidationBus("postgresql://localhost/docuisine")
+    cache = worker_cache(bus)
+    await cache.set("a", 1)
+
+    bus._on_notification(MagicMock(), 1, "docuisine_cache", bus._payload("categories", "a"))
+    await asyncio.sleep(0)
+
+    assert await cache.get("a") == 1
+
+
+def test_create_invalidation_bus():
+    assert isinstance(create_invalidation_bus("local", "sqlite:///test.db"), LocalInvalidationBus)
+    bus = create_invalidation_bus("postgres", "postgresql+psycopg2://u:p@localhost:5432/docuisine")
+    assert isinstance(bus, PostgresInvalidationBus)
+    assert bus.dsn == "postgresql://u:p@localhost:5432/docuisine"
+    with pytest.raises(ValueError, match="PostgreSQL"):
+        create_invalidation_bus("postgres", "sqlite:///test.db")
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_invalidation_bus("kafka", "sqlite:///test.db")
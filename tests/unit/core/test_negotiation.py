@@ -0,0 +1,95 @@
+from fastapi import FastAPI
+import httpx
+import pytest
+
+from docuisine.core.negotiation import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    ContentNegotiationMiddleware,
+    encode_model,
+    negotiate_media_type,
+)
+from docuisine.schemas.admin import CachesStats, CacheStats
+from docuisine.schemas.common import Page
+from docuisine.schemas.store import StoreOut
+from docuisine.utils.etag import negotiated_etag
+from docuisine.utils.responses import ModelResponse, cached_response
+
+ormsgpack = pytest.importorskip("ormsgpack")
+
+pytestmark = pytest.mark.anyio
+
+PAGE = Page[StoreOut](items=[StoreOut(id=1, name="Market", address="Main St")])
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/store")
+    async def store() -> ModelResponse:
+        return ModelResponse(PAGE.items[0], headers={"ETag": negotiated_etag('"1"')})
+
+    @app.get("/stores")
+    async def stores() -> ModelResponse:
+        async def build() -> tuple[str, Page[StoreOut]]:
+            return '"2"', PAGE
+
+        return await cached_response(None, "/stores", build)
+
+    @app.get("/text")
+    async def text() -> str:
+        return "Hello"
+
+    app.add_middleware(ContentNegotiationMiddleware)  # type: ignore
+    return app
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack, */*;q=0.1", MSGPACK_MEDIA_TYPE),
+        ("application/json, application/vnd.msgpack;q=0.5", JSON_MEDIA_TYPE),
+        ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept: str, expected: str):
+    assert negotiate_media_type(accept) == expected
+
+
+@pytest.mark.parametrize("path", ["/store", "/stores"])
+async def test_msgpack_responses(path: str):
+    async with client(make_app()) as c:
+        json_response = await c.get(path)
+        msgpack_response = await c.get(path, headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert json_response.headers["Content-Type"] == JSON_MEDIA_TYPE
+    assert msgpack_response.headers["Content-Type"] == MSGPACK_MEDIA_TYPE
+    for response in (json_response, msgpack_response):
+        assert "Accept" in response.headers["Vary"].split(", ")
+    assert ormsgpack.unpackb(msgpack_response.content) == json_response.json()
+    assert msgpack_response.headers["ETag"] != json_response.headers["ETag"]
+    assert msgpack_response.headers["ETag"].endswith('-msgpack"')
+
+
+async def test_other_responses_stay_json():
+    async with client(make_app()) as c:
+        response = await c.get("/text", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert response.headers["Content-Type"] == JSON_MEDIA_TYPE
+    assert response.json() == "Hello"
+
+
+def test_root_models_encode_their_root():
+    stats = CachesStats(
+        {"stores": CacheStats(hits=1, misses=0, evictions=0, expirations=0, size=1)}
+    )
+
+    assert ormsgpack.unpackb(encode_model(stats, MSGPACK_MEDIA_TYPE)) == stats.model_dump()
+    assert encode_model(stats) == stats.model_dump_json().encode()
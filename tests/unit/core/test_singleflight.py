@@ -0,0 +1,93 @@
+import asyncio
+
+from fastapi import FastAPI, Response
+import httpx
+import pytest
+
+from docuisine.core.singleflight import SingleFlightMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+def make_app(max_body_size: int = 1024) -> tuple[FastAPI, list[str]]:
+    app = FastAPI()
+    calls: list[str] = []
+
+    @app.get("/slow")
+    async def slow(q: str = "") -> dict:
+        calls.append(q)
+        await asyncio.sleep(0.05)
+        return {"q": q, "call": len(calls)}
+
+    @app.get("/cookie")
+    async def cookie(response: Response) -> dict:
+        calls.append("cookie")
+        await asyncio.sleep(0.05)
+        response.set_cookie("session", "abc")
+        return {}
+
+    @app.get("/fail")
+    async def fail() -> dict:
+        calls.append("fail")
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    app.add_middleware(SingleFlightMiddleware, max_body_size=max_body_size)  # type: ignore
+    return app, calls
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def test_identical_requests_are_coalesced():
+    app, calls = make_app()
+    async with client(app) as c:
+        responses = await asyncio.gather(*(c.get("/slow?q=a") for _ in range(5)))
+
+    assert calls == ["a"]
+    assert {response.text for response in responses} == {'{"q":"a","call":1}'}
+    assert all(response.status_code == 200 for response in responses)
+
+
+async def test_different_requests_are_not_coalesced():
+    app, calls = make_app()
+    async with client(app) as c:
+        await asyncio.gather(
+            c.get("/slow?q=a"),
+            c.get("/slow?q=b"),
+            c.get("/slow?q=a", headers={"Authorization": "Bearer other"}),
+        )
+
+    assert sorted(calls) == ["a", "a", "b"]
+
+
+async def test_primary_reads_are_not_coalesced_with_replica_reads():
+    app, calls = make_app()
+    async with client(app) as c:
+        await asyncio.gather(
+            c.get("/slow?q=a"),
+            c.get("/slow?q=a", headers={"X-Read-Primary": "true"}),
+        )
+
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.parametrize("path, max_body_size", [("/slow", 1), ("/cookie", 1024), ("/slow", 0)])
+async def test_unshareable_responses_run_again(path: str, max_body_size: int):
+    app, calls = make_app(max_body_size)
+    async with client(app) as c:
+        responses = await asyncio.gather(c.get(path), c.get(path))
+
+    assert len(calls) == 2
+    assert all(response.status_code == 200 for response in responses)
+
+
+async def test_failed_leader_lets_followers_run():
+    app, calls = make_app()
+    async with client(app) as c:
+        responses = await asyncio.gather(c.get("/fail"), c.get("/fail"))
+
+    assert calls == ["fail", "fail"]
+    assert all(response.status_code == 500 for response in responses)
@@ -0,0 +1,99 @@
+import logging
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, create_engine
+
+from docuisine.db.indexes import audit_indexes, log_index_audit
+from docuisine.db.models import Base
+
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+
+def test_models_declare_lookup_indexes():
+    """Test that lookup columns and reverse association columns are indexed."""
+    indexed = {
+        (table.name, column.name)
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        for column in index.columns
+    }
+    assert ("recipes", "user_id") in indexed
+    assert ("recipes", "name") in indexed
+    assert ("stores", "name") in indexed
+    assert ("ingredients", "recipe_id") in indexed
+    assert ("recipe_ingredients", "ingredient_id") in indexed
+    assert ("recipe_categories", "category_id") in indexed
+    assert ("shelves", "ingredient_id") in indexed
+
+
+def test_audit_created_schema(engine):
+    """Test that a schema created from the models has no audit findings."""
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        audit = audit_indexes(connection, Base.metadata)
+    assert audit.ok
+    assert audit.missing_columns == []
+    assert audit.missing_indexes == []
+    assert audit.unindexed_foreign_keys == []
+
+
+def test_audit_missing_tables_are_skipped(engine):
+    """Test that tables which do not exist yet are not reported."""
+    with engine.connect() as connection:
+        assert audit_indexes(connection, Base.metadata).ok
+
+
+def test_audit_missing_index(engine):
+    """Test that declared indexes dropped from the database are reported."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_recipes_user_id")
+        audit = audit_indexes(connection, Base.metadata)
+    assert audit.missing_indexes == ["recipes.ix_recipes_user_id"]
+    assert audit.unindexed_foreign_keys == ["recipes(user_id)"]
+
+
+def test_audit_missing_column(engine, caplog: pytest.LogCaptureFixture):
+    """Test that a declared column missing from an existing table is logged as an error."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE users DROP COLUMN token_version")
+        with caplog.at_level(logging.WARNING, logger="docuisine.db.indexes"):
+            audit = log_index_audit(connection, Base.metadata)
+    assert audit.missing_columns == ["users.token_version"]
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+    assert "scripts/migrations" in caplog.text
+
+
+def test_audit_composite_key_covers_leading_column(engine):
+    """Test that only the leading columns of a composite key count as indexed."""
+    metadata = MetaData()
+    Table("parents", metadata, Column("id", Integer, primary_key=True))
+    Table(
+        "children",
+        metadata,
+        Column("left_id", ForeignKey("parents.id"), primary_key=True),
+        Column("right_id", ForeignKey("parents.id"), primary_key=True),
+    )
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        audit = audit_indexes(connection, metadata)
+    assert audit.missing_indexes == []
+    assert audit.unindexed_foreign_keys == ["children(right_id)"]
+
+
+def test_log_index_audit(engine, caplog: pytest.LogCaptureFixture):
+    """Test that every finding is logged as a warning."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_stores_name")
+        connection.exec_driver_sql("DROP INDEX ix_shelves_ingredient_id")
+        with caplog.at_level(logging.WARNING, logger="docuisine.db.indexes"):
+            audit = log_index_audit(connection, Base.metadata)
+    assert not audit.ok
+    assert len(caplog.records) == 3
+    assert "shelves(ingredient_id)" in caplog.text
+    assert "stores.ix_stores_name" in caplog.text
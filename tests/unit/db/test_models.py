@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import create_engine, delete, event, func, select
+from sqlalchemy.orm import Session
+
+from docuisine.db.models import (
+    Base,
+    Category,
+    Ingredient,
+    Recipe,
+    RecipeCategory,
+    RecipeIngredient,
+    RecipeStep,
+    Shelf,
+    Store,
+    User,
+)
+
+
+@pytest.fixture
+def session():
+    """Provide a session on an in-memory database that enforces foreign keys."""
+    engine = create_engine("sqlite://")
+    event.listen(
+        engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON")
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                User(id=1, username="cook", password="pw"),
+                Recipe(id=1, user_id=1, name="Bread"),
+                Category(id=1, name="Baking"),
+                Ingredient(id=1, name="Flour"),
+                Ingredient(id=2, name="Croutons", recipe_id=1),
+                Store(id=1, name="Mill", address="1 Mill Rd"),
+            ]
+        )
+        session.flush()
+        session.add_all(
+            [
+                RecipeStep(recipe_id=1, step_number=1, description="Knead"),
+                RecipeStep(recipe_id=1, step_number=2, description="Bake"),
+                RecipeIngredient(
+                    recipe_id=1, ingredient_id=1, amount_grams=500, amount_readable="500g"
+                ),
+                RecipeCategory(recipe_id=1, category_id=1),
+                Shelf(store_id=1, ingredient_id=1, quantity=3),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+def count(session: Session, model) -> int:
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def test_delete_recipe_cascades(session: Session):
+    """Test that deleting a recipe removes its children in the database."""
+    session.execute(delete(Recipe).filter_by(id=1))
+
+    assert count(session, RecipeStep) == 0
+    assert count(session, RecipeIngredient) == 0
+    assert count(session, RecipeCategory) == 0
+    assert session.scalar(select(Ingredient.recipe_id).filter_by(id=2)) is None
+
+
+@pytest.mark.parametrize(
+    "model, remaining",
+    [
+        (Ingredient, {RecipeIngredient: 0, Shelf: 0, RecipeCategory: 1}),
+        (Category, {RecipeCategory: 0, RecipeIngredient: 1}),
+        (Store, {Shelf: 0, RecipeIngredient: 1}),
+    ],
+)
+def test_delete_cascades_association_rows(session: Session, model, remaining: dict):
+    """Test that deleting an ingredient, category or store removes its association rows."""
+    session.execute(delete(model).filter_by(id=1))
+
+    assert {association: count(session, association) for association in remaining} == remaining
+
+
+def test_session_delete_does_not_load_children(session: Session):
+    """Test that deleting a loaded recipe leaves its children to the database."""
+    recipe = session.get(Recipe, 1)
+    session.delete(recipe)
+    session.commit()
+
+    assert "steps" not in recipe.__dict__
+    assert count(session, RecipeStep) == 0
@@ -0,0 +1,58 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import StaticPool
+
+from docuisine.db.pool import TimedQueuePool, get_pool_stats
+
+
+@pytest.fixture
+def pool():
+    """Provide a single-connection pool that times out almost immediately."""
+    return TimedQueuePool(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.01
+    )
+
+
+def test_pool_stats_idle(pool: TimedQueuePool):
+    connection = pool.connect()
+    connection.close()
+
+    stats = get_pool_stats(pool)
+    assert stats["pool_class"] == "TimedQueuePool"
+    assert stats["size"] == 1
+    assert stats["max_overflow"] == 0
+    assert stats["checked_out"] == 0
+    assert stats["idle"] == 1
+    assert stats["overflow"] == 0
+    assert stats["waits"] == 0
+
+
+def test_pool_stats_checked_out(pool: TimedQueuePool):
+    connection = pool.connect()
+
+    stats = get_pool_stats(pool)
+    assert stats["checked_out"] == 1
+    assert stats["idle"] == 0
+    connection.close()
+
+
+def test_pool_stats_timeout(pool: TimedQueuePool):
+    connection = pool.connect()
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+    connection.close()
+
+    stats = get_pool_stats(pool)
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_time_total"] >= 0.01
+    assert stats["wait_time_max"] == stats["wait_time_total"]
+
+
+def test_pool_stats_untracked_pool():
+    stats = get_pool_stats(StaticPool(lambda: sqlite3.connect(":memory:")))
+    assert stats["pool_class"] == "StaticPool"
+    assert stats["checked_out"] is None
+    assert stats["waits"] is None
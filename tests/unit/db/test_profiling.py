@@ -0,0 +1,91 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import StaticPool, create_engine, text
+
+from docuisine.db.profiling import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryCounterMiddleware,
+    QueryStats,
+    get_current_stats,
+    install_query_counter,
+    start_tracking,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    install_query_counter(engine)
+    return engine
+
+
+def make_client(engine, expose_headers: bool = True) -> TestClient:
+    """Create a client for an app whose only route runs one statement per ``n``."""
+    app = FastAPI()
+    app.add_middleware(
+        QueryCounterMiddleware,  # type: ignore
+        max_queries=3,
+        repeat_threshold=2,
+        expose_headers=expose_headers,
+    )
+
+    @app.get("/items")
+    def get_items(n: int = 1):
+        with engine.connect() as connection:
+            for i in range(n):
+                connection.execute(text("SELECT :i"), {"i": i})
+        return {}
+
+    return TestClient(app)
+
+
+def test_query_stats_repeated():
+    stats = QueryStats()
+    stats.statements.update({"SELECT 1": 3, "SELECT 2": 1})
+    assert stats.repeated(2) == {"SELECT 1": 3}
+
+
+def test_install_query_counter_once(engine):
+    """Test that installing the counter twice does not double count."""
+    install_query_counter(engine)
+    stats = start_tracking()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert get_current_stats() is stats
+    assert stats.count == 1
+    assert stats.duration > 0
+    assert stats.statements == {"SELECT 1": 1}
+
+
+def test_middleware_headers(engine):
+    response = make_client(engine).get("/items", params={"n": 2})
+    assert response.headers[QUERY_COUNT_HEADER] == "2"
+    assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+
+def test_middleware_without_headers(engine):
+    response = make_client(engine, expose_headers=False).get("/items")
+    assert QUERY_COUNT_HEADER not in response.headers
+    assert QUERY_TIME_HEADER not in response.headers
+
+
+def test_middleware_logs_slow_requests(engine, caplog: pytest.LogCaptureFixture):
+    """Test that too many statements and repeated statement shapes are logged."""
+    with caplog.at_level(logging.WARNING, logger="docuisine.db.profiling"):
+        make_client(engine).get("/items", params={"n": 4})
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert messages[0].startswith("GET /items issued 4 SQL statements in ")
+    assert messages[1] == (
+        "GET /items executed the same statement 4 times, likely an N+1 query: SELECT ?"
+    )
+
+
+def test_middleware_quiet_requests(engine, caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.WARNING, logger="docuisine.db.profiling"):
+        make_client(engine).get("/items")
+    assert caplog.records == []
@@ -0,0 +1,103 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy import Engine, StaticPool, create_engine, insert, select, update
+from sqlalchemy.orm import Session
+
+from docuisine.db.models import Category
+from docuisine.db.routing import HAS_WRITTEN, RoutingSession, replica_read, use_primary
+from docuisine.dependencies.db import get_async_db_session
+
+pytestmark = pytest.mark.anyio
+
+
+def make_engine(category_name: str) -> Engine:
+    """Create an in-memory database holding a single category."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Category.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Category).values(id=1, name=category_name))
+    return engine
+
+
+@pytest.fixture
+def session():
+    primary = make_engine("primary")
+    replica = make_engine("replica")
+
+    class ReplicaSession(RoutingSession):
+        pass
+
+    ReplicaSession.replica = replica
+    with ReplicaSession(bind=primary) as session:
+        yield session
+
+
+class FakeService:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    @replica_read
+    async def get_name(self) -> Optional[str]:
+        return self.read_name()
+
+    def read_name(self) -> Optional[str]:
+        return self.db_session.scalar(select(Category.name).filter_by(id=1))
+
+
+async def test_reads_use_primary_by_default(session: Session):
+    assert FakeService(session).read_name() == "primary"
+
+
+async def test_replica_read(session: Session):
+    service = FakeService(session)
+    assert await service.get_name() == "replica"
+    # The flag is reset once the decorated method returns
+    assert service.read_name() == "primary"
+
+
+async def test_replica_read_after_write(session: Session):
+    session.add(Category(id=2, name="new"))
+    session.flush()
+
+    assert session.info[HAS_WRITTEN] is True
+    assert await FakeService(session).get_name() == "primary"
+
+
+async def test_replica_read_after_update_statement(session: Session):
+    session.execute(update(Category).filter_by(id=1).values(name="renamed"))
+
+    assert session.info[HAS_WRITTEN] is True
+    assert await FakeService(session).get_name() == "renamed"
+
+
+async def test_flush_during_replica_read_uses_primary(session: Session):
+    class WritingService(FakeService):
+        @replica_read
+        async def add_and_get_name(self) -> Optional[str]:
+            self.db_session.add(Category(id=2, name="new"))
+            self.db_session.flush()
+            return self.read_name()
+
+    assert await WritingService(session).add_and_get_name() == "primary"
+    # The row was inserted into the primary, which the session now reads from
+    assert session.scalar(select(Category.name).filter_by(id=2)) == "new"
+
+
+async def test_replica_read_after_use_primary(session: Session):
+    use_primary(session)
+    assert await FakeService(session).get_name() == "primary"
+
+
+async def test_no_replica_configured():
+    with RoutingSession(bind=make_engine("primary")) as session:
+        assert await FakeService(session).get_name() == "primary"
+
+
+@pytest.mark.parametrize("read_primary", [False, True])
+async def test_read_primary_header(read_primary: bool):
+    sessions = get_async_db_session(x_read_primary=read_primary)
+    db = await anext(sessions)
+
+    assert db.info.get(HAS_WRITTEN, False) is read_primary
+    await sessions.aclose()
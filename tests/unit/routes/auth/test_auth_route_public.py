@@ -7,6 +7,7 @@ import pytest
 from docuisine.db.models import User
 from docuisine.dependencies import services
 from docuisine.schemas import Role
+from docuisine.services import UserService
 from docuisine.utils import errors
 
 from . import params as p
@@ -25,7 +26,7 @@ class TestPOST:
         create_client: Callable[[Role], TestClient],
     ):
         ## Setup
-        mock_user_service = MagicMock()
+        mock_user_service = MagicMock(spec=UserService)
 
         match scenario:
             case "success_auth":
@@ -42,11 +42,13 @@ GET_BY_ID_RESPONSE = {
 GET_NOT_FOUND_RESPONSE = {"detail": "Category with ID 999 not found."}
 
 
+GET_ALL_CATEGORIES_PAGE_RESPONSE = {"items": GET_ALL_CATEGORIES_RESPONSE, "next": None}
+
 GET_PARAMETERS = [
     # scenario, role, expected_status, expected_response
-    ("get_all", Role.PUBLIC, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
-    ("get_all", Role.USER, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
-    ("get_all", Role.ADMIN, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
+    ("get_all", Role.PUBLIC, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
+    ("get_all", Role.USER, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
+    ("get_all", Role.ADMIN, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
     ("get_by_id", Role.PUBLIC, status.HTTP_200_OK, GET_BY_ID_RESPONSE),
     ("get_by_id", Role.USER, status.HTTP_200_OK, GET_BY_ID_RESPONSE),
     ("get_by_id", Role.ADMIN, status.HTTP_200_OK, GET_BY_ID_RESPONSE),
@@ -146,7 +148,7 @@ PUT_PARAMETERS = [
         Role.ADMIN,
         status.HTTP_409_CONFLICT,
         {"detail": "Category with name 'Dessert' already exists."},
-    )
+    ),
 ]
 
 # ---------------- DELETE PARAMETERS ----------------
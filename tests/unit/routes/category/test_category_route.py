@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Callable
 from unittest.mock import MagicMock
 
@@ -8,7 +9,9 @@ from docuisine.db.models import Category
 from docuisine.dependencies.services import get_category_service, get_image_service
 from docuisine.schemas.enums import Role
 from docuisine.schemas.image import ImageSet
+from docuisine.services import CategoryService
 from docuisine.utils import errors
+from docuisine.utils.pagination import MAX_PAGE_SIZE, KeysetPage
 
 from . import params as p
 
@@ -28,12 +31,13 @@ class TestGET:
         """Test getting categories."""
 
         def mock_category_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=CategoryService)
+            mock.cache = None  # No response cache
             match scenario:
                 case "get_all":
-                    mock.get_all_categories.return_value = [
-                        Category(**cat) for cat in p.GET_ALL_CATEGORIES_RESPONSE
-                    ]
+                    mock.get_all_categories.return_value = KeysetPage(
+                        items=[Category(**cat) for cat in p.GET_ALL_CATEGORIES_RESPONSE]
+                    )
                 case "get_by_id":
                     mock.get_category.return_value = Category(**p.GET_BY_ID_RESPONSE)
                 case "get_not_found":
@@ -54,6 +58,124 @@ class TestGET:
         assert response.json() == expected_response
 
 
+def test_get_categories_invalid_cursor(create_client: Callable[[Role], TestClient]):
+    """Test that an invalid pagination cursor is rejected."""
+    mock = MagicMock(spec=CategoryService)
+    mock.cache = None  # No response cache
+    mock.get_all_categories.side_effect = errors.InvalidCursorError
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: mock  # type: ignore
+
+    response = client.get("/categories/", params={"after": "garbage"})
+    assert response.status_code == 400, response.text
+    assert response.json() == {"detail": "The pagination cursor is invalid."}
+
+
+def test_get_categories_sparse_fields(create_client: Callable[[Role], TestClient]):
+    """Test that only the selected fields are loaded and returned."""
+    mock = MagicMock(spec=CategoryService)
+    mock.cache = None  # No response cache
+    mock.get_all_categories.return_value = KeysetPage(items=[Category(id=1, name="Dessert")])
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: mock  # type: ignore
+
+    response = client.get("/categories/", params={"fields": "name,id"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"items": [{"id": 1, "name": "Dessert"}], "next": None}
+    assert mock.get_all_categories.await_args.kwargs["fields"] == ("id", "name")
+
+    response = client.get("/categories/", params={"fields": "id,secret"})
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"].startswith("Unknown fields: secret.")
+
+
+def test_get_categories_msgpack(create_client: Callable[[Role], TestClient]):
+    """Test that a client accepting MessagePack gets the same page in MessagePack."""
+    ormsgpack = pytest.importorskip("ormsgpack")
+    mock = MagicMock(spec=CategoryService)
+    mock.cache = None  # No response cache
+    mock.get_all_categories.return_value = KeysetPage(
+        items=[Category(**cat) for cat in p.GET_ALL_CATEGORIES_RESPONSE]
+    )
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: mock  # type: ignore
+
+    response = client.get("/categories/", headers={"Accept": "application/msgpack"})
+    assert response.status_code == 200, response.text
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert ormsgpack.unpackb(response.content) == {
+        "items": p.GET_ALL_CATEGORIES_RESPONSE,
+        "next": None,
+    }
+
+
+@pytest.mark.parametrize("path", ["/categories/", "/categories/1"])
+def test_get_categories_conditional(path: str, create_client: Callable[[Role], TestClient]):
+    """Test that a request with a current ETag gets an empty 304 response."""
+    category = Category(**p.GET_BY_ID_RESPONSE, updated_at=datetime(2025, 1, 1))
+    mock = MagicMock(spec=CategoryService)
+    mock.cache = None  # No response cache
+    mock.get_all_categories.return_value = KeysetPage(items=[category])
+    mock.get_category.return_value = category
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: mock  # type: ignore
+
+    response = client.get(path)
+    etag = response.headers["ETag"]
+    assert response.status_code == 200, response.text
+
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    category.updated_at = datetime(2025, 1, 2)
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("path", ["/categories/", "/categories/1"])
+def test_get_categories_conditional_msgpack(
+    path: str, create_client: Callable[[Role], TestClient]
+):
+    """Test that the ETag of the JSON representation does not validate a MessagePack one."""
+    pytest.importorskip("ormsgpack")
+    category = Category(**p.GET_BY_ID_RESPONSE, updated_at=datetime(2025, 1, 1))
+    mock = MagicMock(spec=CategoryService)
+    mock.cache = None  # No response cache
+    mock.get_all_categories.return_value = KeysetPage(items=[category])
+    mock.get_category.return_value = category
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: mock  # type: ignore
+
+    json_etag = client.get(path).headers["ETag"]
+    msgpack = {"Accept": "application/msgpack"}
+    response = client.get(path, headers={**msgpack, "If-None-Match": json_etag})
+    assert response.status_code == 200, response.text
+    msgpack_etag = response.headers["ETag"]
+    assert msgpack_etag != json_etag
+
+    response = client.get(path, headers={**msgpack, "If-None-Match": msgpack_etag})
+    assert response.status_code == 304, response.text
+
+
+def test_get_categories_page_size_limit(create_client: Callable[[Role], TestClient]):
+    """Test that page sizes above the maximum are rejected."""
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[get_category_service] = lambda: MagicMock(  # type: ignore
+        spec=CategoryService
+    )
+
+    response = client.get("/categories/", params={"limit": MAX_PAGE_SIZE + 1})
+    assert response.status_code == 422, response.text
+
+
 @pytest.mark.parametrize(
     "scenario, client_name, expected_status, expected_response", p.POST_PARAMETERS
 )
@@ -69,7 +191,7 @@ class TestPOST:
         """Test creating a category (success or conflict)."""
 
         ## Setup
-        mock_category_service = MagicMock()
+        mock_category_service = MagicMock(spec=CategoryService)
         mock_image_service = MagicMock()
 
         match scenario:
@@ -136,7 +258,7 @@ class TestPUT:
     ):
         """Test updating a category successfully."""
 
-        mock_category_service = MagicMock()
+        mock_category_service = MagicMock(spec=CategoryService)
         match scenario:
             case "update_not_found":
                 mock_category_service.update_category.side_effect = errors.CategoryNotFoundError(
@@ -193,7 +315,7 @@ class TestDELETE:
     ):
         """Test deleting a category successfully."""
 
-        mock_category_service = MagicMock()
+        mock_category_service = MagicMock(spec=CategoryService)
         match scenario:
             case "delete_not_found":
                 mock_category_service.delete_category.side_effect = errors.CategoryNotFoundError(
@@ -16,11 +16,13 @@ GET_INGREDIENT_BY_ID_RESPONSE = {
 GET_INGREDIENT_NOT_FOUND_RESPONSE = {"detail": "Ingredient with ID 999 not found."}
 
 # Parametrization for GET tests
+GET_INGREDIENTS_PAGE_RESPONSE = {"items": GET_INGREDIENTS_RESPONSE, "next": None}
+
 GET_PARAMETERS = [
     # scenario, client_name, expected_status, expected_response
-    ("get_all", "public", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
     ("get_by_id", "public", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
     ("get_by_id", "user", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
     ("get_by_id", "admin", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
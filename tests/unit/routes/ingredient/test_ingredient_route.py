@@ -8,7 +8,9 @@ import pytest
 from docuisine.db.models import Ingredient
 from docuisine.dependencies.services import get_ingredient_service
 from docuisine.schemas import Role
+from docuisine.services import IngredientService
 from docuisine.utils import errors
+from docuisine.utils.pagination import KeysetPage
 
 from . import params as p
 
@@ -28,11 +30,12 @@ class TestGET:
         """Test GET routes for all scenarios (all ingredients, by ID, not found)."""
 
         def mock_ingredient_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=IngredientService)
+            mock.cache = None  # No response cache
             if scenario == "get_all":
-                mock.get_all_ingredients.return_value = [
-                    Ingredient(**ing) for ing in p.GET_INGREDIENTS_RESPONSE
-                ]
+                mock.get_all_ingredients.return_value = KeysetPage(
+                    items=[Ingredient(**ing) for ing in p.GET_INGREDIENTS_RESPONSE]
+                )
             elif scenario == "get_by_id":
                 mock.get_ingredient.return_value = Ingredient(**p.GET_INGREDIENT_BY_ID_RESPONSE)
             elif scenario == "get_not_found":
@@ -71,7 +74,7 @@ class TestPOST:
 
         ## Setup
         def mock_ingredient_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=IngredientService)
             match expected_status:
                 case status.HTTP_201_CREATED:
                     mock.create_ingredient.return_value = Ingredient(**post_response)
@@ -108,7 +111,7 @@ class TestPUT:
         """Test updating ingredients with various scenarios."""
 
         def mock_ingredient_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=IngredientService)
             if scenario in ["update_full", "update_partial", "update_recipe_id"]:
                 mock.update_ingredient.return_value = Ingredient(**expected_response)
             elif scenario == "not_found":
@@ -144,7 +147,7 @@ class TestDELETE:
         """Test deleting ingredients with various scenarios."""
 
         def mock_ingredient_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=IngredientService)
             if scenario == "delete_success":
                 mock.delete_ingredient.return_value = None
             elif scenario == "delete_not_found":
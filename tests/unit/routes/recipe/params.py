@@ -52,10 +52,12 @@ GET_RECIPE_NOT_FOUND_RESPONSE = {"detail": "Recipe with ID 999 not found."}
 
 # Parametrization for GET tests
 # scenario, client_name, expected_status, expected_response
+GET_ALL_RECIPES_PAGE_RESPONSE = {"items": GET_ALL_RECIPES_RESPONSE, "next": None}
+
 GET_PARAMETERS = [
-    ("get_all", "public", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
     ("get_by_id", "public", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
     ("get_by_id", "user", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
     ("get_by_id", "admin", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
@@ -8,7 +8,9 @@ import pytest
 from docuisine.db.models import Recipe
 from docuisine.dependencies.services import get_recipe_service
 from docuisine.schemas import Role
+from docuisine.services import RecipeService
 from docuisine.utils import errors
+from docuisine.utils.pagination import KeysetPage
 
 from . import params as p
 
@@ -28,11 +30,11 @@ class TestGET:
         """Test GET routes for all scenarios (all recipes, by ID, not found)."""
 
         def mock_recipe_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=RecipeService)
             if scenario == "get_all":
-                mock.get_all_recipes.return_value = [
-                    Recipe(**recipe) for recipe in p.GET_ALL_RECIPES_RESPONSE
-                ]
+                mock.get_all_recipes.return_value = KeysetPage(
+                    items=[Recipe(**recipe) for recipe in p.GET_ALL_RECIPES_RESPONSE]
+                )
             elif scenario == "get_by_id":
                 mock.get_recipe.return_value = Recipe(**p.GET_RECIPE_BY_ID_RESPONSE)
             elif scenario == "get_not_found":
@@ -68,7 +70,7 @@ class TestPOST:
         """Test creating a new recipe."""
 
         def mock_recipe_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=RecipeService)
             match expected_status:
                 case status.HTTP_201_CREATED:
                     mock.create_recipe.return_value = Recipe(**expected_response)
@@ -111,7 +113,7 @@ class TestPUT:
         """Test updating recipes with various scenarios."""
 
         def mock_recipe_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=RecipeService)
             if scenario in ["update_full", "update_partial"]:
                 mock.update_recipe.return_value = Recipe(**expected_response)
             elif scenario == "not_found":
@@ -145,7 +147,7 @@ class TestDELETE:
         """Test deleting recipes with various scenarios."""
 
         def mock_recipe_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=RecipeService)
             if scenario == "delete_success":
                 mock.delete_recipe.return_value = None
             elif scenario == "delete_not_found":
@@ -8,7 +8,9 @@ import pytest
 from docuisine.db.models import Store
 from docuisine.dependencies.services import get_store_service
 from docuisine.schemas import Role
+from docuisine.services import StoreService
 from docuisine.utils import errors
+from docuisine.utils.pagination import KeysetPage
 
 from . import params as p
 
@@ -28,11 +30,12 @@ class TestGET:
         """Test GET routes for all scenarios (all stores, by ID, not found)."""
 
         def mock_store_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=StoreService)
+            mock.cache = None  # No response cache
             if scenario == "get_all":
-                mock.get_all_stores.return_value = [
-                    Store(**store) for store in p.GET_ALL_STORES_RESPONSE
-                ]
+                mock.get_all_stores.return_value = KeysetPage(
+                    items=[Store(**store) for store in p.GET_ALL_STORES_RESPONSE]
+                )
             elif scenario == "get_by_id":
                 mock.get_store.return_value = Store(**p.GET_STORE_BY_ID_RESPONSE)
             elif scenario == "get_not_found":
@@ -53,6 +56,32 @@ class TestGET:
         assert response.json() == expected_response
 
 
+class FakeStreamResult:
+    """Stand-in for the `AsyncScalarResult` returned by `StoreService.stream_stores`."""
+
+    def __init__(self, stores: list[Store]):
+        self.stores = stores
+
+    async def partitions(self):
+        yield self.stores
+
+
+@pytest.mark.parametrize("client_name", ["public", "user", "admin"])
+def test_stream_stores(client_name: str, create_client: Callable[[str], TestClient]):
+    """Test streaming every store as one JSON array."""
+    mock = MagicMock(spec=StoreService)
+    mock.stream_stores.return_value = FakeStreamResult(
+        [Store(**store) for store in p.GET_ALL_STORES_RESPONSE]
+    )
+    client = create_client(client_name)
+    client.app.dependency_overrides[get_store_service] = lambda: mock  # type: ignore
+
+    response = client.get("/stores/stream")
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == p.GET_ALL_STORES_RESPONSE
+
+
 class TestPOST:
     @pytest.mark.parametrize(
         "client_name, expected_status, expected_response",
@@ -68,7 +97,7 @@ class TestPOST:
         """Test creating a new store."""
 
         def mock_store_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=StoreService)
             match expected_status:
                 case status.HTTP_201_CREATED:
                     mock.create_store.return_value = Store(**expected_response)
@@ -108,7 +137,7 @@ class TestPUT:
         """Test updating stores with various scenarios."""
 
         def mock_store_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=StoreService)
             if scenario in ["update_full", "update_partial"]:
                 mock.update_store.return_value = Store(**expected_response)
             elif scenario == "not_found":
@@ -142,7 +171,7 @@ class TestDELETE:
         """Test deleting stores with various scenarios."""
 
         def mock_store_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=StoreService)
             if scenario == "delete_success":
                 mock.delete_store.return_value = None
             elif scenario == "delete_not_found":
@@ -45,10 +45,12 @@ GET_USER_NOT_FOUND_RESPONSE = {"detail": "User with ID 999 not found."}
 
 # Parametrization for GET tests
 # scenario, client_name, expected_status, expected_response
+GET_ALL_USERS_PAGE_RESPONSE = {"items": GET_ALL_USERS_RESPONSE, "next": None}
+
 GET_PARAMETERS = [
-    ("get_all", "public", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
     ("get_not_found", "public", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
     ("get_not_found", "user", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
     ("get_not_found", "admin", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
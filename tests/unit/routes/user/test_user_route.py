@@ -8,7 +8,9 @@ import pytest
 from docuisine.db.models import User
 from docuisine.dependencies.services import get_user_service
 from docuisine.schemas import Role
+from docuisine.services import UserService
 from docuisine.utils import errors
+from docuisine.utils.pagination import KeysetPage
 
 from . import params as p
 
@@ -28,11 +30,11 @@ class TestGET:
         """Test GET routes for all scenarios (all users, not found)."""
 
         def mock_user_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=UserService)
             if scenario == "get_all":
-                mock.get_all_users.return_value = [
-                    User(**user) for user in p.GET_ALL_USERS_RESPONSE
-                ]
+                mock.get_all_users.return_value = KeysetPage(
+                    items=[User(**user) for user in p.GET_ALL_USERS_RESPONSE]
+                )
             elif scenario == "get_not_found":
                 mock.get_user.side_effect = errors.UserNotFoundError(user_id=999)
             elif scenario == "get_existing":
@@ -70,7 +72,7 @@ class TestPOST:
         """Test creating a new user."""
 
         def mock_user_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=UserService)
             match expected_status:
                 case status.HTTP_201_CREATED:
                     mock.create_user.return_value = User(**expected_response)
@@ -109,7 +111,7 @@ class TestPUT:
         """Test updating users with various scenarios."""
 
         def mock_user_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=UserService)
             if scenario == "update_password_success":
                 mock.update_user_password.return_value = User(**expected_response)
             elif scenario == "update_password_not_found":
@@ -153,7 +155,7 @@ class TestDELETE:
         """Test deleting users with various scenarios."""
 
         def mock_user_service():
-            mock = MagicMock()
+            mock = MagicMock(spec=UserService)
             if scenario == "delete_success":
                 mock.delete_user.return_value = None
             elif scenario == "delete_not_found":
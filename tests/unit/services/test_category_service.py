@@ -1,32 +1,37 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import delete, inspect, select, update
 from sqlalchemy.exc import IntegrityError
 
+from docuisine.core.cache import Cache, MemoryCacheBackend
 from docuisine.db.models import Category
+from docuisine.db.routing import USE_REPLICA, RoutingSession
 from docuisine.services import CategoryService
 from docuisine.utils.errors import CategoryExistsError, CategoryNotFoundError
 
+pytestmark = pytest.mark.anyio
 
-def test_create_category(db_session: MagicMock):
+
+async def test_create_category(db_session: MagicMock):
     """Test creating a new category."""
     service = CategoryService(db_session)
-    category: Category = service.create_category(name="Dessert", description="Sweet treats")
+    category: Category = await service.create_category(name="Dessert", description="Sweet treats")
 
     assert category.name == "Dessert"
     assert category.description == "Sweet treats"
 
 
-def test_create_category_without_description(db_session: MagicMock):
+async def test_create_category_without_description(db_session: MagicMock):
     """Test creating a category without a description."""
     service = CategoryService(db_session)
-    category: Category = service.create_category(name="Vegetarian")
+    category: Category = await service.create_category(name="Vegetarian")
 
     assert category.name == "Vegetarian"
     assert category.description is None
 
 
-def test_create_category_duplicate_name_raises_error(db_session: MagicMock):
+async def test_create_category_duplicate_name_raises_error(db_session: MagicMock):
     """Test that creating a category with duplicate name raises CategoryExistsError."""
     service = CategoryService(db_session)
     db_session.commit.side_effect = IntegrityError(
@@ -36,219 +41,380 @@ def test_create_category_duplicate_name_raises_error(db_session: MagicMock):
     )
 
     with pytest.raises(CategoryExistsError) as exc_info:
-        service.create_category(name="Dessert")
+        await service.create_category(name="Dessert")
 
     assert "Dessert" in str(exc_info.value)
 
 
-def test_get_category_by_id(db_session: MagicMock, monkeypatch):
+async def test_get_category_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving a category by ID."""
     service = CategoryService(db_session)
     example_category = Category(id=1, name="Korean", description="Korean cuisine")
     monkeypatch.setattr(
         service,
         "_get_category_by_id",
-        lambda category_id: example_category,
+        AsyncMock(return_value=example_category),
     )
 
-    retrieved_category: Category = service.get_category(category_id=example_category.id)
+    retrieved_category: Category = await service.get_category(category_id=example_category.id)
 
     # assert retrieved_category.id == example_category.id
     assert retrieved_category.name == "Korean"
     # assert retrieved_category.description == "Korean cuisine"
 
 
-def test_get_category_by_name(db_session: MagicMock, monkeypatch):
+async def test_get_category_by_name(db_session: MagicMock, monkeypatch):
     """Test retrieving a category by name."""
     service = CategoryService(db_session)
     created_category = Category(id=1, name="Italian")
     monkeypatch.setattr(
         service,
         "_get_category_by_name",
-        lambda name: created_category,
+        AsyncMock(return_value=created_category),
     )
 
-    retrieved_category: Category = service.get_category(name="Italian")
+    retrieved_category: Category = await service.get_category(name="Italian")
 
     assert retrieved_category.id == created_category.id
     assert retrieved_category.name == "Italian"
 
 
-def test_get_category_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_category_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent category by ID raises CategoryNotFoundError."""
     service = CategoryService(db_session)
     monkeypatch.setattr(
         service,
         "_get_category_by_id",
-        lambda category_id: None,
+        AsyncMock(return_value=None),
     )
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
-        service.get_category(category_id=999)
+        await service.get_category(category_id=999)
 
     assert "999" in str(exc_info.value)
 
 
-def test_get_category_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_category_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent category by name raises CategoryNotFoundError."""
     service = CategoryService(db_session)
     monkeypatch.setattr(
         service,
         "_get_category_by_name",
-        lambda name: None,
+        AsyncMock(return_value=None),
     )
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
-        service.get_category(name="NonExistent")
+        await service.get_category(name="NonExistent")
 
     assert "NonExistent" in str(exc_info.value)
 
 
-def test_get_category_without_params_raises_error(db_session: MagicMock):
+async def test_missing_category_name_is_cached_until_inserted(db_session: MagicMock, monkeypatch):
+    """Test that a missing name skips the database until a create or rename inserts it."""
+    not_found_cache = Cache(MemoryCacheBackend(), "not_found", maxsize=8, ttl=30)
+    service = CategoryService(db_session, not_found_cache=not_found_cache)
+    get_mock = AsyncMock(return_value=None)
+    monkeypatch.setattr(service, "_get_category_by_name", get_mock)
+    monkeypatch.setattr(
+        service, "_update_category_by_id", AsyncMock(return_value=Category(id=1, name="Thai"))
+    )
+
+    for _ in range(2):
+        for name in ("Thai", "Greek"):
+            with pytest.raises(CategoryNotFoundError):
+                await service.get_category(name=name)
+    assert get_mock.await_count == 2
+
+    await service.update_category(1, name="Thai")
+    await service.create_category(name="Greek")
+    for name in ("Thai", "Greek"):
+        with pytest.raises(CategoryNotFoundError):
+            await service.get_category(name=name)
+    assert get_mock.await_count == 4
+
+
+async def test_missing_category_name_not_cached_during_insert(db_session: MagicMock, monkeypatch):
+    """Test that a miss read while the name was being inserted is not cached."""
+    not_found_cache = Cache(MemoryCacheBackend(), "not_found", maxsize=8, ttl=30)
+    service = CategoryService(db_session, not_found_cache=not_found_cache)
+
+    async def get_during_create(name: str):
+        # The create commits after the lookup and before its miss is cached.
+        await service.create_category(name=name)
+        return None
+
+    monkeypatch.setattr(service, "_get_category_by_name", get_during_create)
+    with pytest.raises(CategoryNotFoundError):
+        await service.get_category(name="Thai")
+
+    assert not_found_cache.stats().size == 0
+
+
+async def test_missing_category_name_on_replica_is_confirmed_on_primary(
+    db_session: MagicMock, monkeypatch
+):
+    """Test that a name missing from the replica is looked up on the primary before caching."""
+    db_session.sync_session = MagicMock(spec=RoutingSession, replica=MagicMock(), info={})
+    db_session.info = db_session.sync_session.info
+    not_found_cache = Cache(MemoryCacheBackend(), "not_found", maxsize=8, ttl=30)
+    service = CategoryService(db_session, not_found_cache=not_found_cache)
+    reads_replica: list[bool] = []
+
+    async def get_from_lagging_replica(name: str):
+        reads_replica.append(db_session.info[USE_REPLICA])
+        return None if db_session.info[USE_REPLICA] else Category(id=1, name=name)
+
+    monkeypatch.setattr(service, "_get_category_by_name", get_from_lagging_replica)
+
+    assert (await service.get_category(name="Thai")).id == 1
+    assert reads_replica == [True, False]
+    assert not_found_cache.stats().size == 0
+
+
+async def test_get_category_without_params_raises_error(db_session: MagicMock):
     """Test that calling get_category without parameters raises ValueError."""
     service = CategoryService(db_session)
 
     with pytest.raises(ValueError) as exc_info:
-        service.get_category()
+        await service.get_category()
 
     assert "Either category ID or name must be provided" in str(exc_info.value)
 
 
-def test_get_all_categories(db_session: MagicMock):
+async def test_get_all_categories(db_session: MagicMock):
     """Test retrieving all categories."""
     service = CategoryService(db_session)
     cat1 = Category(id=1, name="Mexican")
     cat2 = Category(id=2, name="Japanese")
     cat3 = Category(id=3, name="Indian")
-    db_session.query.return_value.all.return_value = [cat1, cat2, cat3]
+    db_session.scalars.return_value = [cat1, cat2, cat3]
 
-    all_categories = service.get_all_categories()
+    all_categories = await service.get_all_categories()
 
-    assert len(all_categories) == 3
-    category_names = {cat.name for cat in all_categories}
+    assert len(all_categories.items) == 3
+    category_names = {cat.name for cat in all_categories.items}
     assert category_names == {"Mexican", "Japanese", "Indian"}
+    assert all_categories.next is None
+
+
+async def test_get_category_cached(db_session: MagicMock, monkeypatch):
+    """Test that a cached category is read from the database once and copied for every hit."""
+    service = CategoryService(
+        db_session, cache=Cache(MemoryCacheBackend(), "categories", maxsize=8, ttl=60)
+    )
+    example_category = Category(id=1, name="Korean")
+    get_mock = AsyncMock(return_value=example_category)
+    monkeypatch.setattr(service, "_get_category_by_id", get_mock)
+
+    first = await service.get_category(category_id=1)
+    first.name = "Changed by the first request"
+    second = await service.get_category(category_id=1)
+    third = await service.get_category(category_id=1)
+
+    assert first is example_category
+    assert second is not third
+    assert (second.id, second.name) == (third.id, third.name) == (1, "Korean")
+    assert inspect(second).detached
+    get_mock.assert_awaited_once_with(category_id=1)
+
+
+async def test_read_during_write_is_not_cached(db_session: MagicMock, monkeypatch):
+    """Test that a read that started before a write does not cache what it read."""
+    cache = Cache(MemoryCacheBackend(), "categories", maxsize=8, ttl=60)
+    service = CategoryService(db_session, cache=cache)
+
+    async def read_while_written(category_id: int) -> Category:
+        await service.create_category(name="Dessert")
+        return Category(id=category_id, name="Korean")
+
+    monkeypatch.setattr(service, "_get_category_by_id", read_while_written)
+    await service.get_category(category_id=1)
+
+    assert cache.stats().size == 0
+
+
+async def test_get_all_categories_cached_per_arguments(db_session: MagicMock):
+    """Test that pages are cached per limit, cursor and sort column."""
+    service = CategoryService(
+        db_session, cache=Cache(MemoryCacheBackend(), "categories", maxsize=8, ttl=60)
+    )
+    db_session.scalars.return_value = [Category(id=1, name="Mexican")]
+
+    await service.get_all_categories()
+    await service.get_all_categories()
+    await service.get_all_categories(sort="name")
+
+    assert db_session.scalars.await_count == 2
+
+
+async def test_category_writes_clear_cache(db_session: MagicMock, monkeypatch):
+    """Test that a successful write clears the cache and a failed one keeps it."""
+    cache = Cache(MemoryCacheBackend(), "categories", maxsize=8, ttl=60)
+    service = CategoryService(db_session, cache=cache)
+    monkeypatch.setattr(service, "_delete_category_by_id", AsyncMock(return_value=False))
+    await cache.set("key", Category(id=1, name="Korean"))
 
+    with pytest.raises(CategoryNotFoundError):
+        await service.delete_category(1)
+    assert cache.stats().size == 1
 
-def test_update_category_name(db_session: MagicMock, monkeypatch):
+    await service.create_category(name="Dessert")
+    assert cache.stats().size == 0
+
+
+async def test_update_category_name(db_session: MagicMock, monkeypatch):
     """Test updating a category's name."""
     service = CategoryService(db_session)
-    category: Category = Category(id=1, name="Deserts", description="Sweet dishes")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: category,
-    )
+    category: Category = Category(id=1, name="Desserts", description="Sweet dishes")
+    update_mock = AsyncMock(return_value=category)
+    monkeypatch.setattr(service, "_update_category_by_id", update_mock)
 
-    updated_category: Category = service.update_category(category.id, name="Desserts")
+    updated_category: Category = await service.update_category(category.id, name="Desserts")
 
+    update_mock.assert_awaited_once_with(1, {"name": "Desserts"})
     db_session.commit.assert_called_once()
-    assert updated_category.id == category.id
-    assert updated_category.name == "Desserts"
-    assert updated_category.description == category.description
+    assert updated_category is category
 
 
-def test_update_category_description(db_session: MagicMock, monkeypatch):
+async def test_update_category_description(db_session: MagicMock, monkeypatch):
     """Test updating a category's description."""
     service = CategoryService(db_session)
-    category: Category = Category(id=1, name="Vegan", description="No animal products")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: category,
-    )
+    category: Category = Category(id=1, name="Vegan", description="Plant-based dishes")
+    update_mock = AsyncMock(return_value=category)
+    monkeypatch.setattr(service, "_update_category_by_id", update_mock)
 
-    updated_category: Category = service.update_category(
+    updated_category: Category = await service.update_category(
         category.id, description="Plant-based dishes"
     )
 
+    update_mock.assert_awaited_once_with(1, {"description": "Plant-based dishes"})
     db_session.commit.assert_called_once()
-    assert updated_category.id == category.id
     assert updated_category.name == "Vegan"
     assert updated_category.description == "Plant-based dishes"
 
 
-def test_update_category_both_fields(db_session: MagicMock, monkeypatch):
+async def test_update_category_both_fields(db_session: MagicMock, monkeypatch):
     """Test updating both name and description of a category."""
     service = CategoryService(db_session)
-    example_category: Category = Category(id=1, name="QuickMeals", description="Fast recipes")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: example_category,
+    example_category: Category = Category(
+        id=1, name="Quick & Easy", description="Fast and simple meals"
     )
+    update_mock = AsyncMock(return_value=example_category)
+    monkeypatch.setattr(service, "_update_category_by_id", update_mock)
 
-    updated_category = service.update_category(
+    updated_category = await service.update_category(
         example_category.id, name="Quick & Easy", description="Fast and simple meals"
     )
+    update_mock.assert_awaited_once_with(
+        1, {"name": "Quick & Easy", "description": "Fast and simple meals"}
+    )
     db_session.commit.assert_called_once()
-    assert updated_category.id == example_category.id
-    assert updated_category.name == "Quick & Easy"
-    assert updated_category.description == "Fast and simple meals"
+    assert updated_category is example_category
+
+
+async def test_update_category_no_fields(db_session: MagicMock, monkeypatch):
+    """Test that an update without changes returns the category without an UPDATE."""
+    service = CategoryService(db_session)
+    example_category: Category = Category(id=1, name="Korean")
+    update_mock = AsyncMock()
+    monkeypatch.setattr(service, "_update_category_by_id", update_mock)
+    monkeypatch.setattr(service, "_get_category_by_id", AsyncMock(return_value=example_category))
 
+    assert await service.update_category(1) is example_category
+    update_mock.assert_not_awaited()
 
-def test_update_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
+
+async def test_update_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that updating a non-existent category raises CategoryNotFoundError."""
     service = CategoryService(db_session)
-    monkeypatch.setattr(service, "_get_category_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_update_category_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
-        service.update_category(999, name="NewName")
+        await service.update_category(999, name="NewName")
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
 
 
-def test_update_category_duplicate_name_raises_error(db_session: MagicMock):
+async def test_update_category_duplicate_name_raises_error(db_session: MagicMock):
     """Test that updating to a duplicate name raises CategoryExistsError."""
     service = CategoryService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
+    db_session.scalar.side_effect = IntegrityError(
         statement=None,
         params=None,
         orig=Exception(),
     )
     with pytest.raises(CategoryExistsError) as exc_info:
-        service.update_category(1, name="Breakfast")
+        await service.update_category(1, name="Breakfast")
 
+    db_session.rollback.assert_called_once()
     assert "Breakfast" in str(exc_info.value)
 
 
-def test_delete_category(db_session: MagicMock, monkeypatch):
+async def test_delete_category(db_session: MagicMock, monkeypatch):
     """Test deleting a category."""
     service = CategoryService(db_session)
-    example_category = Category(id=1, name="ToDelete", description="To be deleted")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda id: example_category,
-    )
-    service.delete_category(example_category.id)
-    db_session.delete.assert_called_once_with(example_category)
+    delete_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(service, "_delete_category_by_id", delete_mock)
+    await service.delete_category(1)
+    delete_mock.assert_awaited_once_with(1)
     db_session.commit.assert_called_once()
 
 
-def test_delete_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_delete_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that deleting a non-existent category raises CategoryNotFoundError."""
     service = CategoryService(db_session)
-    monkeypatch.setattr(service, "_get_category_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_delete_category_by_id", AsyncMock(return_value=False))
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
-        service.delete_category(999)
+        await service.delete_category(999)
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
+
+
+async def test_update_category_by_id_primitive(db_session: MagicMock):
+    """Test that a category is updated with a single UPDATE ... RETURNING statement."""
+    service = CategoryService(db_session)
+    example_category = Category(id=1, name="Italian")
+    db_session.scalar.return_value = example_category
+
+    result = await service._update_category_by_id(1, {"name": "Italian"})
+
+    assert result == example_category
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(
+        update(Category).filter_by(id=1).values(name="Italian").returning(Category)
+    )
+
+
+@pytest.mark.parametrize("deleted_id, expected", [(1, True), (None, False)])
+async def test_delete_category_by_id_primitive(
+    db_session: MagicMock, deleted_id: int | None, expected: bool
+):
+    """Test that a category is deleted with a single DELETE ... RETURNING statement."""
+    service = CategoryService(db_session)
+    db_session.scalar.return_value = deleted_id
+
+    assert await service._delete_category_by_id(1) is expected
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(delete(Category).filter_by(id=1).returning(Category.id))
 
 
-def test_get_category_by_name_primitive(db_session: MagicMock):
+async def test_get_category_by_name_primitive(db_session: MagicMock):
     """
     Test retrieving a category by name by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = CategoryService(db_session)
     example_category = Category(id=1, name="Italian", description="Italian cuisine")
-    db_session.first.return_value = example_category
+    db_session.scalar.return_value = example_category
 
-    result = service._get_category_by_name(name="Italian")
+    result = await service._get_category_by_name(name="Italian")
 
     assert result == example_category
-    db_session.query.assert_called_once_with(Category)
-    db_session.filter_by.assert_called_with(name="Italian")
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Category).filter_by(name="Italian").limit(1))
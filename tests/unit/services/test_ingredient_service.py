@@ -1,17 +1,22 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from docuisine.db.models import Ingredient
 from docuisine.services import IngredientService
 from docuisine.utils.errors import IngredientExistsError, IngredientNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
+pytestmark = pytest.mark.anyio
 
-def test_create_ingredient(db_session: MagicMock):
+
+async def test_create_ingredient(db_session: MagicMock):
     """Test creating a new ingredient."""
     service = IngredientService(db_session)
-    ingredient: Ingredient = service.create_ingredient(name="Sugar", description="Sweetener")
+    ingredient: Ingredient = await service.create_ingredient(name="Sugar", description="Sweetener")
 
     assert ingredient.name == "Sugar"
     assert ingredient.description == "Sweetener"
@@ -19,10 +24,10 @@ def test_create_ingredient(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_ingredient_without_description(db_session: MagicMock):
+async def test_create_ingredient_without_description(db_session: MagicMock):
     """Test creating an ingredient without a description."""
     service = IngredientService(db_session)
-    ingredient: Ingredient = service.create_ingredient(name="Salt")
+    ingredient: Ingredient = await service.create_ingredient(name="Salt")
 
     assert ingredient.name == "Salt"
     assert ingredient.description is None
@@ -30,7 +35,7 @@ def test_create_ingredient_without_description(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_ingredient_duplicate_name_raises_error(db_session: MagicMock):
+async def test_create_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     """Test that creating an ingredient with duplicate name raises IngredientExistsError."""
     service = IngredientService(db_session)
     db_session.commit.side_effect = IntegrityError(
@@ -40,7 +45,7 @@ def test_create_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     )
 
     with pytest.raises(IngredientExistsError) as exc_info:
-        service.create_ingredient(name="Sugar")
+        await service.create_ingredient(name="Sugar")
 
     assert "Sugar" in str(exc_info.value)
     db_session.add.assert_called_once()
@@ -48,221 +53,240 @@ def test_create_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_get_ingredient_by_id(db_session: MagicMock, monkeypatch):
+async def test_get_ingredient_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving an ingredient by ID."""
     service = IngredientService(db_session)
     example_ingredient = Ingredient(id=1, name="Flour", description="All-purpose")
     monkeypatch.setattr(
         service,
         "_get_ingredient_by_id",
-        lambda ingredient_id: example_ingredient,
+        AsyncMock(return_value=example_ingredient),
     )
 
-    retrieved: Ingredient = service.get_ingredient(ingredient_id=example_ingredient.id)
+    retrieved: Ingredient = await service.get_ingredient(ingredient_id=example_ingredient.id)
 
     assert retrieved.name == "Flour"
 
 
-def test_get_ingredient_by_name(db_session: MagicMock, monkeypatch):
+async def test_get_ingredient_by_name(db_session: MagicMock, monkeypatch):
     """Test retrieving an ingredient by name."""
     service = IngredientService(db_session)
     created = Ingredient(id=1, name="Butter")
     monkeypatch.setattr(
         service,
         "_get_ingredient_by_name",
-        lambda name: created,
+        AsyncMock(return_value=created),
     )
 
-    retrieved: Ingredient = service.get_ingredient(name="Butter")
+    retrieved: Ingredient = await service.get_ingredient(name="Butter")
 
     assert retrieved.id == created.id
     assert retrieved.name == "Butter"
 
 
-def test_get_ingredient_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_ingredient_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent ingredient by ID raises IngredientNotFoundError."""
     service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda ingredient_id: None)
+    monkeypatch.setattr(service, "_get_ingredient_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
-        service.get_ingredient(ingredient_id=999)
+        await service.get_ingredient(ingredient_id=999)
 
     assert "999" in str(exc_info.value)
 
 
-def test_get_ingredient_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_ingredient_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent ingredient by name raises IngredientNotFoundError."""
     service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_name", lambda name: None)
+    monkeypatch.setattr(service, "_get_ingredient_by_name", AsyncMock(return_value=None))
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
-        service.get_ingredient(name="NonExistent")
+        await service.get_ingredient(name="NonExistent")
 
     assert "NonExistent" in str(exc_info.value)
 
 
-def test_get_ingredient_without_params_raises_error(db_session: MagicMock):
+async def test_get_ingredient_without_params_raises_error(db_session: MagicMock):
     """Test that calling get_ingredient without parameters raises ValueError."""
     service = IngredientService(db_session)
 
     with pytest.raises(ValueError) as exc_info:
-        service.get_ingredient()
+        await service.get_ingredient()
 
     assert "Either ingredient ID or name must be provided" in str(exc_info.value)
 
 
-def test_get_all_ingredients(db_session: MagicMock):
+async def test_get_all_ingredients(db_session: MagicMock):
     """Test retrieving all ingredients."""
     service = IngredientService(db_session)
     ing1 = Ingredient(id=1, name="Milk")
     ing2 = Ingredient(id=2, name="Eggs")
     ing3 = Ingredient(id=3, name="Yeast")
-    db_session.query.return_value.all.return_value = [ing1, ing2, ing3]
+    db_session.scalars.return_value = [ing1, ing2, ing3]
 
-    all_ingredients = service.get_all_ingredients()
+    all_ingredients = await service.get_all_ingredients()
 
-    assert len(all_ingredients) == 3
-    ingredient_names = {ing.name for ing in all_ingredients}
+    assert len(all_ingredients.items) == 3
+    ingredient_names = {ing.name for ing in all_ingredients.items}
     assert ingredient_names == {"Milk", "Eggs", "Yeast"}
-    db_session.query.assert_called_once_with(Ingredient)
-    db_session.query.return_value.all.assert_called_once()
+    db_session.scalars.assert_awaited_once()
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Ingredient).order_by(Ingredient.id).limit(DEFAULT_PAGE_SIZE + 1)
+    )
+
+
+async def test_stream_ingredients(db_session: MagicMock):
+    """Test streaming all ingredients in batches."""
+    service = IngredientService(db_session)
 
+    result = await service.stream_ingredients()
 
-def test_update_ingredient_name(db_session: MagicMock, monkeypatch):
+    assert result is db_session.stream_scalars.return_value
+    statement = db_session.stream_scalars.await_args.args[0]
+    assert statement.compare(select(Ingredient).order_by(Ingredient.id))
+    assert statement.get_execution_options()["yield_per"] == STREAM_BATCH_SIZE
+
+
+async def test_update_ingredient_name(db_session: MagicMock, monkeypatch):
     """Test updating an ingredient's name."""
     service = IngredientService(db_session)
-    ingredient: Ingredient = Ingredient(id=1, name="Suagar", description="Sweetener")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    ingredient: Ingredient = Ingredient(id=1, name="Sugar", description="Sweetener")
+    update_mock = AsyncMock(return_value=ingredient)
+    monkeypatch.setattr(service, "_update_ingredient_by_id", update_mock)
 
-    updated: Ingredient = service.update_ingredient(ingredient.id, name="Sugar")
+    updated: Ingredient = await service.update_ingredient(ingredient.id, name="Sugar")
 
+    update_mock.assert_awaited_once_with(1, {"name": "Sugar"})
     db_session.commit.assert_called_once()
-    assert updated.id == ingredient.id
-    assert updated.name == "Sugar"
-    assert updated.description == ingredient.description
+    assert updated is ingredient
 
 
-def test_update_ingredient_description(db_session: MagicMock, monkeypatch):
+async def test_update_ingredient_description(db_session: MagicMock, monkeypatch):
     """Test updating an ingredient's description."""
     service = IngredientService(db_session)
-    ingredient: Ingredient = Ingredient(id=1, name="Salt", description="Old desc")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    ingredient: Ingredient = Ingredient(id=1, name="Salt", description="New desc")
+    update_mock = AsyncMock(return_value=ingredient)
+    monkeypatch.setattr(service, "_update_ingredient_by_id", update_mock)
 
-    updated: Ingredient = service.update_ingredient(ingredient.id, description="New desc")
+    updated: Ingredient = await service.update_ingredient(ingredient.id, description="New desc")
 
+    update_mock.assert_awaited_once_with(1, {"description": "New desc"})
     db_session.commit.assert_called_once()
-    assert updated.id == ingredient.id
     assert updated.name == "Salt"
     assert updated.description == "New desc"
 
 
-def test_update_ingredient_recipe_id(db_session: MagicMock, monkeypatch):
+async def test_update_ingredient_recipe_id(db_session: MagicMock, monkeypatch):
     """Test updating an ingredient's recipe_id."""
     service = IngredientService(db_session)
-    ingredient: Ingredient = Ingredient(id=1, name="Butter", description=None, recipe_id=None)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    ingredient: Ingredient = Ingredient(id=1, name="Butter", description=None, recipe_id=42)
+    update_mock = AsyncMock(return_value=ingredient)
+    monkeypatch.setattr(service, "_update_ingredient_by_id", update_mock)
 
-    updated: Ingredient = service.update_ingredient(ingredient.id, recipe_id=42)
+    updated: Ingredient = await service.update_ingredient(ingredient.id, recipe_id=42)
 
+    update_mock.assert_awaited_once_with(1, {"recipe_id": 42})
     db_session.commit.assert_called_once()
-    assert updated.id == ingredient.id
     assert updated.recipe_id == 42
 
 
-def test_update_ingredient_both_fields(db_session: MagicMock, monkeypatch):
+async def test_update_ingredient_both_fields(db_session: MagicMock, monkeypatch):
     """Test updating multiple fields of an ingredient."""
     service = IngredientService(db_session)
-    example: Ingredient = Ingredient(id=1, name="Flour", description="All-purpose", recipe_id=None)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: example)
+    example: Ingredient = Ingredient(id=1, name="00 Flour", description="Fine milled", recipe_id=7)
+    update_mock = AsyncMock(return_value=example)
+    monkeypatch.setattr(service, "_update_ingredient_by_id", update_mock)
 
-    updated = service.update_ingredient(
+    updated = await service.update_ingredient(
         example.id, name="00 Flour", description="Fine milled", recipe_id=7
     )
+    update_mock.assert_awaited_once_with(
+        1, {"name": "00 Flour", "description": "Fine milled", "recipe_id": 7}
+    )
     db_session.commit.assert_called_once()
-    assert updated.id == example.id
-    assert updated.name == "00 Flour"
-    assert updated.description == "Fine milled"
-    assert updated.recipe_id == 7
+    assert updated is example
 
 
-def test_update_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_update_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that updating a non-existent ingredient raises IngredientNotFoundError."""
     service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_update_ingredient_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
-        service.update_ingredient(999, name="NewName")
+        await service.update_ingredient(999, name="NewName")
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
 
 
-def test_update_ingredient_duplicate_name_raises_error(db_session: MagicMock):
+async def test_update_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     """Test that updating to a duplicate name raises IngredientExistsError."""
     service = IngredientService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
+    db_session.scalar.side_effect = IntegrityError(
         statement=None,
         params=None,
         orig=Exception(),
     )
     with pytest.raises(IngredientExistsError) as exc_info:
-        service.update_ingredient(1, name="Salt")
+        await service.update_ingredient(1, name="Salt")
 
     assert "Salt" in str(exc_info.value)
-    db_session.commit.assert_called_once()
+    db_session.commit.assert_not_called()
     db_session.rollback.assert_called_once()
 
 
-def test_delete_ingredient(db_session: MagicMock, monkeypatch):
+async def test_delete_ingredient(db_session: MagicMock, monkeypatch):
     """Test deleting an ingredient."""
     service = IngredientService(db_session)
-    example = Ingredient(id=1, name="ToDelete", description="To be deleted")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda id: example)
-    service.delete_ingredient(example.id)
-    db_session.delete.assert_called_once_with(example)
+    delete_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(service, "_delete_ingredient_by_id", delete_mock)
+    await service.delete_ingredient(1)
+    delete_mock.assert_awaited_once_with(1)
     db_session.commit.assert_called_once()
 
 
-def test_delete_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_delete_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that deleting a non-existent ingredient raises IngredientNotFoundError."""
     service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_delete_ingredient_by_id", AsyncMock(return_value=False))
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
-        service.delete_ingredient(999)
+        await service.delete_ingredient(999)
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
 
 
-def test_get_ingredient_by_name_primitive(db_session: MagicMock):
+async def test_get_ingredient_by_name_primitive(db_session: MagicMock):
     """
     Test retrieving an ingredient by name by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = IngredientService(db_session)
     example_ingredient = Ingredient(id=1, name="Sugar", description="Sweetener")
-    db_session.first.return_value = example_ingredient
+    db_session.scalar.return_value = example_ingredient
 
-    result = service._get_ingredient_by_name(name="Sugar")
+    result = await service._get_ingredient_by_name(name="Sugar")
 
     assert result == example_ingredient
-    db_session.query.assert_called_once_with(Ingredient)
-    db_session.filter_by.assert_called_with(name="Sugar")
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Ingredient).filter_by(name="Sugar").limit(1))
 
 
-def test_get_ingredient_by_id_primitive(db_session: MagicMock):
+async def test_get_ingredient_by_id_primitive(db_session: MagicMock):
     """
     Test retrieving an ingredient by ID by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = IngredientService(db_session)
     example_ingredient = Ingredient(id=1, name="Salt", description="Mineral")
-    db_session.first.return_value = example_ingredient
+    db_session.scalar.return_value = example_ingredient
 
-    result = service._get_ingredient_by_id(ingredient_id=1)
+    result = await service._get_ingredient_by_id(ingredient_id=1)
 
     assert result == example_ingredient
-    db_session.query.assert_called_once_with(Ingredient)
-    db_session.filter_by.assert_called_with(id=1)
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Ingredient).filter_by(id=1).limit(1))
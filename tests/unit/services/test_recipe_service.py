@@ -1,17 +1,34 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 
-from docuisine.db.models import Recipe
+from docuisine.core.cache import Cache, MemoryCacheBackend
+from docuisine.db.models import Ingredient, Recipe
 from docuisine.services import RecipeService
 from docuisine.utils.errors import RecipeExistsError, RecipeNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
+pytestmark = pytest.mark.anyio
 
-def test_create_recipe(db_session: MagicMock):
+
+def returning(recipe: Recipe) -> AsyncMock:
+    """Mock an ``UPDATE ... RETURNING`` that applies the new values to ``recipe``."""
+
+    async def update(recipe_id: int, values: dict) -> Recipe:
+        for column, value in values.items():
+            setattr(recipe, column, value)
+        return recipe
+
+    return AsyncMock(side_effect=update)
+
+
+async def test_create_recipe(db_session: MagicMock):
     """Test creating a new recipe."""
     service = RecipeService(db_session)
-    recipe: Recipe = service.create_recipe(
+    recipe: Recipe = await service.create_recipe(
         user_id=1,
         name="Chocolate Cake",
         cook_time_sec=3600,
@@ -32,10 +49,10 @@ def test_create_recipe(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_recipe_minimal_fields(db_session: MagicMock):
+async def test_create_recipe_minimal_fields(db_session: MagicMock):
     """Test creating a recipe with only required fields."""
     service = RecipeService(db_session)
-    recipe: Recipe = service.create_recipe(user_id=1, name="Simple Recipe")
+    recipe: Recipe = await service.create_recipe(user_id=1, name="Simple Recipe")
 
     assert recipe.user_id == 1
     assert recipe.name == "Simple Recipe"
@@ -48,7 +65,7 @@ def test_create_recipe_minimal_fields(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_recipe_duplicate_name_raises_error(db_session: MagicMock):
+async def test_create_recipe_duplicate_name_raises_error(db_session: MagicMock):
     """Test that creating a recipe with duplicate name raises RecipeExistsError."""
     service = RecipeService(db_session)
     db_session.commit.side_effect = IntegrityError(
@@ -58,7 +75,7 @@ def test_create_recipe_duplicate_name_raises_error(db_session: MagicMock):
     )
 
     with pytest.raises(RecipeExistsError) as exc_info:
-        service.create_recipe(user_id=1, name="Duplicate Recipe")
+        await service.create_recipe(user_id=1, name="Duplicate Recipe")
 
     assert "Duplicate Recipe" in str(exc_info.value)
     db_session.add.assert_called_once()
@@ -66,7 +83,7 @@ def test_create_recipe_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_get_recipe_by_id(db_session: MagicMock, monkeypatch):
+async def test_get_recipe_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving a recipe by ID."""
     service = RecipeService(db_session)
     example_recipe = Recipe(
@@ -75,102 +92,135 @@ def test_get_recipe_by_id(db_session: MagicMock, monkeypatch):
     monkeypatch.setattr(
         service,
         "_get_recipe_by_id",
-        lambda recipe_id: example_recipe,
+        AsyncMock(return_value=example_recipe),
     )
 
-    retrieved: Recipe = service.get_recipe(recipe_id=example_recipe.id)
+    retrieved: Recipe = await service.get_recipe(recipe_id=example_recipe.id)
 
     assert retrieved.name == "Pasta Carbonara"
     assert retrieved.description == "Classic Italian pasta"
 
 
-def test_get_recipe_by_name(db_session: MagicMock, monkeypatch):
+async def test_get_recipe_by_name(db_session: MagicMock, monkeypatch):
     """Test retrieving a recipe by name."""
     service = RecipeService(db_session)
     created = Recipe(id=1, user_id=1, name="Pizza Margherita")
     monkeypatch.setattr(
         service,
         "_get_recipe_by_name",
-        lambda name: created,
+        AsyncMock(return_value=created),
     )
 
-    retrieved: Recipe = service.get_recipe(name="Pizza Margherita")
+    retrieved: Recipe = await service.get_recipe(name="Pizza Margherita")
 
     assert retrieved.id == created.id
     assert retrieved.name == "Pizza Margherita"
 
 
-def test_get_recipe_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_recipe_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent recipe by ID raises RecipeNotFoundError."""
     service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda recipe_id: None)
+    monkeypatch.setattr(service, "_get_recipe_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
-        service.get_recipe(recipe_id=999)
+        await service.get_recipe(recipe_id=999)
 
     assert "999" in str(exc_info.value)
 
 
-def test_get_recipe_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_recipe_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent recipe by name raises RecipeNotFoundError."""
     service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_name", lambda name: None)
+    monkeypatch.setattr(service, "_get_recipe_by_name", AsyncMock(return_value=None))
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
-        service.get_recipe(name="NonExistent")
+        await service.get_recipe(name="NonExistent")
 
     assert "NonExistent" in str(exc_info.value)
 
 
-def test_get_recipe_without_params_raises_error(db_session: MagicMock):
+async def test_get_recipe_without_params_raises_error(db_session: MagicMock):
     """Test that calling get_recipe without parameters raises ValueError."""
     service = RecipeService(db_session)
 
     with pytest.raises(ValueError) as exc_info:
-        service.get_recipe()
+        await service.get_recipe()
 
     assert "Either recipe ID or name must be provided" in str(exc_info.value)
 
 
-def test_get_all_recipes(db_session: MagicMock):
+async def test_get_all_recipes(db_session: MagicMock):
     """Test retrieving all recipes."""
     service = RecipeService(db_session)
     recipe1 = Recipe(id=1, user_id=1, name="Recipe A")
     recipe2 = Recipe(id=2, user_id=1, name="Recipe B")
     recipe3 = Recipe(id=3, user_id=2, name="Recipe C")
-    db_session.query.return_value.all.return_value = [recipe1, recipe2, recipe3]
+    db_session.scalars.return_value = [recipe1, recipe2, recipe3]
 
-    all_recipes = service.get_all_recipes()
+    all_recipes = await service.get_all_recipes()
 
-    assert len(all_recipes) == 3
-    recipe_names = {recipe.name for recipe in all_recipes}
+    assert len(all_recipes.items) == 3
+    recipe_names = {recipe.name for recipe in all_recipes.items}
     assert recipe_names == {"Recipe A", "Recipe B", "Recipe C"}
-    db_session.query.assert_called_once_with(Recipe)
-    db_session.query.return_value.all.assert_called_once()
+    db_session.scalars.assert_awaited_once()
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Recipe).order_by(Recipe.id).limit(DEFAULT_PAGE_SIZE + 1)
+    )
 
 
-def test_get_recipes_by_user(db_session: MagicMock):
+async def test_get_recipes_by_user(db_session: MagicMock):
     """Test retrieving recipes by user ID."""
     service = RecipeService(db_session)
     recipe1 = Recipe(id=1, user_id=5, name="User5 Recipe A")
     recipe2 = Recipe(id=2, user_id=5, name="User5 Recipe B")
-    db_session.query.return_value.filter_by.return_value.all.return_value = [recipe1, recipe2]
+    db_session.scalars.return_value = [recipe1, recipe2]
+
+    user_recipes = await service.get_recipes_by_user(user_id=5)
+
+    assert len(user_recipes.items) == 2
+    assert all(recipe.user_id == 5 for recipe in user_recipes.items)
+    db_session.scalars.assert_awaited_once()
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Recipe).filter_by(user_id=5).order_by(Recipe.id).limit(DEFAULT_PAGE_SIZE + 1)
+    )
+
+
+async def test_is_owner(db_session: MagicMock):
+    """Test checking recipe ownership for the recipe's creator."""
+    service = RecipeService(db_session)
+    db_session.scalar.return_value = True
+
+    assert await service.is_owner(recipe_id=1, user_id=5) is True
+    db_session.scalar.assert_awaited_once()
+
+
+async def test_is_owner_other_user(db_session: MagicMock):
+    """Test checking recipe ownership for a user that did not create the recipe."""
+    service = RecipeService(db_session)
+    db_session.scalar.return_value = False
 
-    user_recipes = service.get_recipes_by_user(user_id=5)
+    assert await service.is_owner(recipe_id=1, user_id=6) is False
 
-    assert len(user_recipes) == 2
-    assert all(recipe.user_id == 5 for recipe in user_recipes)
-    db_session.query.assert_called_once_with(Recipe)
-    db_session.query.return_value.filter_by.assert_called_once_with(user_id=5)
+
+async def test_stream_recipes(db_session: MagicMock):
+    """Test streaming all recipes in batches."""
+    service = RecipeService(db_session)
+
+    result = await service.stream_recipes()
+
+    assert result is db_session.stream_scalars.return_value
+    statement = db_session.stream_scalars.await_args.args[0]
+    assert statement.compare(select(Recipe).order_by(Recipe.id))
+    assert statement.get_execution_options()["yield_per"] == STREAM_BATCH_SIZE
 
 
-def test_update_recipe_name(db_session: MagicMock, monkeypatch):
+async def test_update_recipe_name(db_session: MagicMock, monkeypatch):
     """Test updating a recipe's name."""
     service = RecipeService(db_session)
     recipe: Recipe = Recipe(id=1, user_id=1, name="Old Name", description="Some description")
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    monkeypatch.setattr(service, "_update_recipe_by_id", returning(recipe))
 
-    updated: Recipe = service.update_recipe(recipe.id, name="New Name")
+    updated: Recipe = await service.update_recipe(recipe.id, name="New Name")
 
     db_session.commit.assert_called_once()
     assert updated.id == recipe.id
@@ -178,7 +228,7 @@ def test_update_recipe_name(db_session: MagicMock, monkeypatch):
     assert updated.description == "Some description"
 
 
-def test_update_recipe_times(db_session: MagicMock, monkeypatch):
+async def test_update_recipe_times(db_session: MagicMock, monkeypatch):
     """Test updating a recipe's time fields."""
     service = RecipeService(db_session)
     recipe: Recipe = Recipe(
@@ -189,9 +239,9 @@ def test_update_recipe_times(db_session: MagicMock, monkeypatch):
         prep_time_sec=None,
         non_blocking_time_sec=None,
     )
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    monkeypatch.setattr(service, "_update_recipe_by_id", returning(recipe))
 
-    updated: Recipe = service.update_recipe(
+    updated: Recipe = await service.update_recipe(
         recipe.id, cook_time_sec=1800, prep_time_sec=600, non_blocking_time_sec=300
     )
 
@@ -201,13 +251,13 @@ def test_update_recipe_times(db_session: MagicMock, monkeypatch):
     assert updated.non_blocking_time_sec == 300
 
 
-def test_update_recipe_servings_and_description(db_session: MagicMock, monkeypatch):
+async def test_update_recipe_servings_and_description(db_session: MagicMock, monkeypatch):
     """Test updating a recipe's servings and description."""
     service = RecipeService(db_session)
     recipe: Recipe = Recipe(id=1, user_id=1, name="Recipe", servings=None, description=None)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    monkeypatch.setattr(service, "_update_recipe_by_id", returning(recipe))
 
-    updated: Recipe = service.update_recipe(
+    updated: Recipe = await service.update_recipe(
         recipe.id, servings=4, description="Updated description"
     )
 
@@ -216,7 +266,7 @@ def test_update_recipe_servings_and_description(db_session: MagicMock, monkeypat
     assert updated.description == "Updated description"
 
 
-def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
+async def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
     """Test updating multiple fields of a recipe."""
     service = RecipeService(db_session)
     example: Recipe = Recipe(
@@ -228,9 +278,9 @@ def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
         servings=None,
         description=None,
     )
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: example)
+    monkeypatch.setattr(service, "_update_recipe_by_id", returning(example))
 
-    updated = service.update_recipe(
+    updated = await service.update_recipe(
         example.id,
         name="Updated Recipe",
         cook_time_sec=2400,
@@ -248,86 +298,121 @@ def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
     assert updated.description == "Fully updated"
 
 
-def test_update_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_update_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that updating a non-existent recipe raises RecipeNotFoundError."""
     service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_update_recipe_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
-        service.update_recipe(999, name="NewName")
+        await service.update_recipe(999, name="NewName")
 
     assert "999" in str(exc_info.value)
 
 
-def test_update_recipe_duplicate_name_raises_error(db_session: MagicMock):
+async def test_update_recipe_duplicate_name_raises_error(db_session: MagicMock):
     """Test that updating to a duplicate name raises RecipeExistsError."""
     service = RecipeService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
+    db_session.scalar.side_effect = IntegrityError(
         statement=None,
         params=None,
         orig=Exception(),
     )
     with pytest.raises(RecipeExistsError) as exc_info:
-        service.update_recipe(1, name="Existing Recipe")
+        await service.update_recipe(1, name="Existing Recipe")
 
     assert "Existing Recipe" in str(exc_info.value)
-    db_session.commit.assert_called_once()
+    db_session.commit.assert_not_called()
     db_session.rollback.assert_called_once()
 
 
-def test_delete_recipe(db_session: MagicMock, monkeypatch):
+async def test_delete_recipe(db_session: MagicMock, monkeypatch):
     """Test deleting a recipe."""
     service = RecipeService(db_session)
-    example = Recipe(id=1, user_id=1, name="ToDelete")
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda id: example)
+    delete_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(service, "_delete_recipe_by_id", delete_mock)
 
-    service.delete_recipe(example.id)
+    await service.delete_recipe(1)
 
-    db_session.delete.assert_called_once_with(example)
+    delete_mock.assert_awaited_once_with(1)
+    statement = db_session.execute.call_args.args[0]
+    assert statement.compare(update(Ingredient).filter_by(recipe_id=1).values(recipe_id=None))
     db_session.commit.assert_called_once()
 
 
-def test_delete_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_delete_recipe_clears_ingredient_cache(db_session: MagicMock, monkeypatch):
+    """Test that deleting a recipe clears the cached ingredients it produced."""
+    ingredient_cache = Cache(MemoryCacheBackend(), "ingredients", maxsize=8, ttl=60)
+    await ingredient_cache.set("key", Ingredient(id=1, name="Dough", recipe_id=1))
+    service = RecipeService(db_session, ingredient_cache=ingredient_cache)
+    monkeypatch.setattr(service, "_delete_recipe_by_id", AsyncMock(return_value=True))
+
+    await service.delete_recipe(1)
+
+    assert ingredient_cache.stats().size == 0
+
+
+async def test_delete_recipe_bumps_ingredient_generation_before_write(
+    db_session: MagicMock, monkeypatch
+):
+    """Test that an ingredient read started before the unlink cannot store its rows."""
+    ingredient_cache = Cache(MemoryCacheBackend(), "ingredients", maxsize=8, ttl=60)
+    read_generation = await ingredient_cache.generation()
+    service = RecipeService(db_session, ingredient_cache=ingredient_cache)
+    generations = []
+
+    async def unlink_products(recipe_id: int) -> None:
+        generations.append(await ingredient_cache.generation())
+
+    monkeypatch.setattr(service, "_unlink_products", unlink_products)
+    monkeypatch.setattr(service, "_delete_recipe_by_id", AsyncMock(return_value=True))
+
+    await service.delete_recipe(1)
+
+    assert generations[0] != read_generation
+
+
+async def test_delete_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that deleting a non-existent recipe raises RecipeNotFoundError."""
     service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_delete_recipe_by_id", AsyncMock(return_value=False))
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
-        service.delete_recipe(999)
+        await service.delete_recipe(999)
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
 
 
-def test_get_recipe_by_id_primitive(db_session: MagicMock):
+async def test_get_recipe_by_id_primitive(db_session: MagicMock):
     """
     Test retrieving a recipe by ID by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = RecipeService(db_session)
     example_recipe = Recipe(id=1, user_id=1, name="Test Recipe")
-    db_session.first.return_value = example_recipe
+    db_session.scalar.return_value = example_recipe
 
-    result = service._get_recipe_by_id(recipe_id=1)
+    result = await service._get_recipe_by_id(recipe_id=1)
 
     assert result == example_recipe
-    db_session.query.assert_called_once_with(Recipe)
-    db_session.filter_by.assert_called_with(id=1)
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Recipe).filter_by(id=1).limit(1))
 
 
-def test_get_recipe_by_name_primitive(db_session: MagicMock):
+async def test_get_recipe_by_name_primitive(db_session: MagicMock):
     """
     Test retrieving a recipe by name by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = RecipeService(db_session)
     example_recipe = Recipe(id=1, user_id=1, name="Test Recipe")
-    db_session.first.return_value = example_recipe
+    db_session.scalar.return_value = example_recipe
 
-    result = service._get_recipe_by_name(name="Test Recipe")
+    result = await service._get_recipe_by_name(name="Test Recipe")
 
     assert result == example_recipe
-    db_session.query.assert_called_once_with(Recipe)
-    db_session.filter_by.assert_called_with(name="Test Recipe")
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Recipe).filter_by(name="Test Recipe").limit(1))
@@ -1,17 +1,33 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from docuisine.db.models import Store
 from docuisine.services import StoreService
 from docuisine.utils.errors import StoreExistsError, StoreNotFoundError
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE
+from docuisine.utils.streaming import STREAM_BATCH_SIZE
 
+pytestmark = pytest.mark.anyio
 
-def test_create_store(db_session: MagicMock):
+
+def returning(store: Store) -> AsyncMock:
+    """Mock an ``UPDATE ... RETURNING`` that applies the new values to ``store``."""
+
+    async def update(store_id: int, values: dict) -> Store:
+        for column, value in values.items():
+            setattr(store, column, value)
+        return store
+
+    return AsyncMock(side_effect=update)
+
+
+async def test_create_store(db_session: MagicMock):
     """Test creating a new store."""
     service = StoreService(db_session)
-    store: Store = service.create_store(
+    store: Store = await service.create_store(
         name="Grocery Mart",
         address="123 Main St",
         longitude=-122.4194,
@@ -32,10 +48,10 @@ def test_create_store(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_store_minimal_fields(db_session: MagicMock):
+async def test_create_store_minimal_fields(db_session: MagicMock):
     """Test creating a store with only required fields."""
     service = StoreService(db_session)
-    store: Store = service.create_store(name="Corner Shop", address="456 Elm St")
+    store: Store = await service.create_store(name="Corner Shop", address="456 Elm St")
 
     assert store.name == "Corner Shop"
     assert store.address == "456 Elm St"
@@ -48,7 +64,7 @@ def test_create_store_minimal_fields(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_store_duplicate_name_raises_error(db_session: MagicMock):
+async def test_create_store_duplicate_name_raises_error(db_session: MagicMock):
     """Test that creating a store with duplicate name raises StoreExistsError."""
     service = StoreService(db_session)
     db_session.commit.side_effect = IntegrityError(
@@ -58,7 +74,7 @@ def test_create_store_duplicate_name_raises_error(db_session: MagicMock):
     )
 
     with pytest.raises(StoreExistsError) as exc_info:
-        service.create_store(name="Duplicate Store", address="789 Oak Ave")
+        await service.create_store(name="Duplicate Store", address="789 Oak Ave")
 
     assert "Duplicate Store" in str(exc_info.value)
     db_session.add.assert_called_once()
@@ -66,7 +82,7 @@ def test_create_store_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_get_store_by_id(db_session: MagicMock, monkeypatch):
+async def test_get_store_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving a store by ID."""
     service = StoreService(db_session)
     example_store = Store(
@@ -75,87 +91,101 @@ def test_get_store_by_id(db_session: MagicMock, monkeypatch):
     monkeypatch.setattr(
         service,
         "_get_store_by_id",
-        lambda store_id: example_store,
+        AsyncMock(return_value=example_store),
     )
 
-    retrieved: Store = service.get_store(store_id=example_store.id)
+    retrieved: Store = await service.get_store(store_id=example_store.id)
 
     assert retrieved.name == "Supermarket"
     assert retrieved.address == "999 Broadway"
 
 
-def test_get_store_by_name(db_session: MagicMock, monkeypatch):
+async def test_get_store_by_name(db_session: MagicMock, monkeypatch):
     """Test retrieving a store by name."""
     service = StoreService(db_session)
     created = Store(id=1, name="Farmers Market", address="111 Park Ln")
     monkeypatch.setattr(
         service,
         "_get_store_by_name",
-        lambda name: created,
+        AsyncMock(return_value=created),
     )
 
-    retrieved: Store = service.get_store(name="Farmers Market")
+    retrieved: Store = await service.get_store(name="Farmers Market")
 
     assert retrieved.id == created.id
     assert retrieved.name == "Farmers Market"
 
 
-def test_get_store_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_store_not_found_by_id_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent store by ID raises StoreNotFoundError."""
     service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda store_id: None)
+    monkeypatch.setattr(service, "_get_store_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(StoreNotFoundError) as exc_info:
-        service.get_store(store_id=999)
+        await service.get_store(store_id=999)
 
     assert "999" in str(exc_info.value)
 
 
-def test_get_store_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
+async def test_get_store_not_found_by_name_raises_error(db_session: MagicMock, monkeypatch):
     """Test that getting a non-existent store by name raises StoreNotFoundError."""
     service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_name", lambda name: None)
+    monkeypatch.setattr(service, "_get_store_by_name", AsyncMock(return_value=None))
 
     with pytest.raises(StoreNotFoundError) as exc_info:
-        service.get_store(name="NonExistent")
+        await service.get_store(name="NonExistent")
 
     assert "NonExistent" in str(exc_info.value)
 
 
-def test_get_store_without_params_raises_error(db_session: MagicMock):
+async def test_get_store_without_params_raises_error(db_session: MagicMock):
     """Test that calling get_store without parameters raises ValueError."""
     service = StoreService(db_session)
 
     with pytest.raises(ValueError) as exc_info:
-        service.get_store()
+        await service.get_store()
 
     assert "Either store ID or name must be provided" in str(exc_info.value)
 
 
-def test_get_all_stores(db_session: MagicMock):
+async def test_get_all_stores(db_session: MagicMock):
     """Test retrieving all stores."""
     service = StoreService(db_session)
     store1 = Store(id=1, name="Store A", address="100 First St")
     store2 = Store(id=2, name="Store B", address="200 Second St")
     store3 = Store(id=3, name="Store C", address="300 Third St")
-    db_session.query.return_value.all.return_value = [store1, store2, store3]
+    db_session.scalars.return_value = [store1, store2, store3]
 
-    all_stores = service.get_all_stores()
+    all_stores = await service.get_all_stores()
 
-    assert len(all_stores) == 3
-    store_names = {store.name for store in all_stores}
+    assert len(all_stores.items) == 3
+    store_names = {store.name for store in all_stores.items}
     assert store_names == {"Store A", "Store B", "Store C"}
-    db_session.query.assert_called_once_with(Store)
-    db_session.query.return_value.all.assert_called_once()
+    db_session.scalars.assert_awaited_once()
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Store).order_by(Store.id).limit(DEFAULT_PAGE_SIZE + 1)
+    )
 
 
-def test_update_store_name(db_session: MagicMock, monkeypatch):
+async def test_stream_stores(db_session: MagicMock):
+    """Test streaming all stores in batches."""
+    service = StoreService(db_session)
+
+    result = await service.stream_stores()
+
+    assert result is db_session.stream_scalars.return_value
+    statement = db_session.stream_scalars.await_args.args[0]
+    assert statement.compare(select(Store).order_by(Store.id))
+    assert statement.get_execution_options()["yield_per"] == STREAM_BATCH_SIZE
+
+
+async def test_update_store_name(db_session: MagicMock, monkeypatch):
     """Test updating a store's name."""
     service = StoreService(db_session)
     store: Store = Store(id=1, name="Old Name", address="555 Main St")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    monkeypatch.setattr(service, "_update_store_by_id", returning(store))
 
-    updated: Store = service.update_store(store.id, name="New Name")
+    updated: Store = await service.update_store(store.id, name="New Name")
 
     db_session.commit.assert_called_once()
     assert updated.id == store.id
@@ -163,33 +193,33 @@ def test_update_store_name(db_session: MagicMock, monkeypatch):
     assert updated.address == "555 Main St"
 
 
-def test_update_store_address(db_session: MagicMock, monkeypatch):
+async def test_update_store_address(db_session: MagicMock, monkeypatch):
     """Test updating a store's address."""
     service = StoreService(db_session)
     store: Store = Store(id=1, name="Shop", address="Old Address")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    monkeypatch.setattr(service, "_update_store_by_id", returning(store))
 
-    updated: Store = service.update_store(store.id, address="New Address")
+    updated: Store = await service.update_store(store.id, address="New Address")
 
     db_session.commit.assert_called_once()
     assert updated.name == "Shop"
     assert updated.address == "New Address"
 
 
-def test_update_store_coordinates(db_session: MagicMock, monkeypatch):
+async def test_update_store_coordinates(db_session: MagicMock, monkeypatch):
     """Test updating a store's coordinates."""
     service = StoreService(db_session)
     store: Store = Store(id=1, name="Store", address="123 St", longitude=None, latitude=None)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    monkeypatch.setattr(service, "_update_store_by_id", returning(store))
 
-    updated: Store = service.update_store(store.id, longitude=-118.2437, latitude=34.0522)
+    updated: Store = await service.update_store(store.id, longitude=-118.2437, latitude=34.0522)
 
     db_session.commit.assert_called_once()
     assert updated.longitude == -118.2437
     assert updated.latitude == 34.0522
 
 
-def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
+async def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
     """Test updating multiple fields of a store."""
     service = StoreService(db_session)
     example: Store = Store(
@@ -200,9 +230,9 @@ def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
         website=None,
         description=None,
     )
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: example)
+    monkeypatch.setattr(service, "_update_store_by_id", returning(example))
 
-    updated = service.update_store(
+    updated = await service.update_store(
         example.id,
         name="Updated Store",
         address="Updated Address",
@@ -220,86 +250,87 @@ def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
     assert updated.description == "Updated description"
 
 
-def test_update_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_update_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that updating a non-existent store raises StoreNotFoundError."""
     service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_update_store_by_id", AsyncMock(return_value=None))
 
     with pytest.raises(StoreNotFoundError) as exc_info:
-        service.update_store(999, name="NewName")
+        await service.update_store(999, name="NewName")
 
     assert "999" in str(exc_info.value)
 
 
-def test_update_store_duplicate_name_raises_error(db_session: MagicMock):
+async def test_update_store_duplicate_name_raises_error(db_session: MagicMock):
     """Test that updating to a duplicate name raises StoreExistsError."""
     service = StoreService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
+    db_session.scalar.side_effect = IntegrityError(
         statement=None,
         params=None,
         orig=Exception(),
     )
     with pytest.raises(StoreExistsError) as exc_info:
-        service.update_store(1, name="Existing Store")
+        await service.update_store(1, name="Existing Store")
 
     assert "Existing Store" in str(exc_info.value)
-    db_session.commit.assert_called_once()
+    db_session.commit.assert_not_called()
     db_session.rollback.assert_called_once()
 
 
-def test_delete_store(db_session: MagicMock, monkeypatch):
+async def test_delete_store(db_session: MagicMock, monkeypatch):
     """Test deleting a store."""
     service = StoreService(db_session)
-    example = Store(id=1, name="ToDelete", address="Delete St")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda id: example)
+    delete_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(service, "_delete_store_by_id", delete_mock)
 
-    service.delete_store(example.id)
+    await service.delete_store(1)
 
-    db_session.delete.assert_called_once_with(example)
+    delete_mock.assert_awaited_once_with(1)
     db_session.commit.assert_called_once()
 
 
-def test_delete_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
+async def test_delete_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
     """Test that deleting a non-existent store raises StoreNotFoundError."""
     service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: None)
+    monkeypatch.setattr(service, "_delete_store_by_id", AsyncMock(return_value=False))
 
     with pytest.raises(StoreNotFoundError) as exc_info:
-        service.delete_store(999)
+        await service.delete_store(999)
 
     assert "999" in str(exc_info.value)
+    db_session.commit.assert_not_called()
 
 
-def test_get_store_by_id_primitive(db_session: MagicMock):
+async def test_get_store_by_id_primitive(db_session: MagicMock):
     """
     Test retrieving a store by ID by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = StoreService(db_session)
     example_store = Store(id=1, name="Test Store", address="Test Address")
-    db_session.first.return_value = example_store
+    db_session.scalar.return_value = example_store
 
-    result = service._get_store_by_id(store_id=1)
+    result = await service._get_store_by_id(store_id=1)
 
     assert result == example_store
-    db_session.query.assert_called_once_with(Store)
-    db_session.filter_by.assert_called_with(id=1)
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Store).filter_by(id=1).limit(1))
 
 
-def test_get_store_by_name_primitive(db_session: MagicMock):
+async def test_get_store_by_name_primitive(db_session: MagicMock):
     """
     Test retrieving a store by name by testing correct
     calling procedure of primitive SQLAlchemy methods.
     """
     service = StoreService(db_session)
     example_store = Store(id=1, name="Test Store", address="Test Address")
-    db_session.first.return_value = example_store
+    db_session.scalar.return_value = example_store
 
-    result = service._get_store_by_name(name="Test Store")
+    result = await service._get_store_by_name(name="Test Store")
 
     assert result == example_store
-    db_session.query.assert_called_once_with(Store)
-    db_session.filter_by.assert_called_with(name="Test Store")
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(Store).filter_by(name="Test Store").limit(1))
@@ -1,14 +1,21 @@
 import time
-from unittest.mock import MagicMock
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
 
+import jwt
 import pytest
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 
+from docuisine.core.cache import Cache, MemoryCacheBackend
 from docuisine.db.models import User
-from docuisine.schemas.auth import JWTConfig
-from docuisine.schemas.enums import JWTAlgorithm
+from docuisine.schemas.auth import JWTConfig, Principal
+from docuisine.schemas.enums import JWTAlgorithm, Role
 from docuisine.services import UserService
 from docuisine.utils import errors
+from docuisine.utils.pagination import DEFAULT_PAGE_SIZE
+
+pytestmark = pytest.mark.anyio
 
 
 @pytest.fixture(autouse=True)
@@ -20,11 +27,11 @@ def mock_hash(monkeypatch):
     )
 
 
-def test_create_user_success(db_session: MagicMock):
+async def test_create_user_success(db_session: MagicMock):
     """Test that creating a user works correctly."""
     service = UserService(db_session)
 
-    user = service.create_user("alice", "password123")
+    user = await service.create_user("alice", "password123")
 
     assert isinstance(user, User)
     assert user.username == "alice"
@@ -34,7 +41,7 @@ def test_create_user_success(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_create_user_duplicate_raises(db_session: MagicMock):
+async def test_create_user_duplicate_raises(db_session: MagicMock):
     """Test that creating a user with a duplicate username raises UserExistsError."""
     db_session.commit.side_effect = IntegrityError(
         statement=None,
@@ -45,21 +52,21 @@ def test_create_user_duplicate_raises(db_session: MagicMock):
     service = UserService(db_session)
 
     with pytest.raises(errors.UserExistsError) as exc:
-        service.create_user("alice", "password123")
+        await service.create_user("alice", "password123")
 
     assert "alice" in str(exc.value)
     db_session.rollback.assert_called_once()
 
 
-def test_get_user_no_args_raises(db_session: MagicMock):
+async def test_get_user_no_args_raises(db_session: MagicMock):
     """Test that get_user raises ValueError when no arguments are provided."""
     service = UserService(db_session)
 
     with pytest.raises(ValueError, match="Either user ID or username must be provided."):
-        service.get_user()
+        await service.get_user()
 
 
-def test_get_user_by_id(db_session: MagicMock):
+async def test_get_user_by_id(db_session: MagicMock):
     """
     Test getting a user by ID works correctly.
     By assuming we called the correct SQLAlchemy methods.
@@ -67,18 +74,18 @@ def test_get_user_by_id(db_session: MagicMock):
     We are testing if we call their methods correctly.
     """
     user = User(id=1, username="alice", password="pw")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = user
 
     service = UserService(db_session)
-    result = service._get_user_by_id(user_id=1)
+    result = await service._get_user_by_id(user_id=1)
 
-    db_session.query.assert_called_once_with(User)
-    db_session.filter_by.assert_called_with(id=1)
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(User).filter_by(id=1).limit(1))
     assert result is user
 
 
-def test_get_user_by_username(db_session: MagicMock):
+async def test_get_user_by_username(db_session: MagicMock):
     """
     Test getting a user by username works correctly.
     By assuming we called the correct SQLAlchemy methods.
@@ -86,55 +93,76 @@ def test_get_user_by_username(db_session: MagicMock):
     We are testing if we call their methods correctly.
     """
     user = User(id=1, username="alice", password="pw")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = user
 
     service = UserService(db_session)
-    result = service._get_user_by_username(username="alice")
+    result = await service._get_user_by_username(username="alice")
 
-    db_session.query.assert_called_once_with(User)
-    db_session.filter_by.assert_called_with(username="alice")
-    db_session.first.assert_called_once()
+    db_session.scalar.assert_awaited_once()
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(select(User).filter_by(username="alice").limit(1))
     assert result is user
 
 
-def test_get_user_not_found_by_id(db_session: MagicMock):
+async def test_get_user_not_found_by_id(db_session: MagicMock):
     """Test that getting a non-existent user by ID raises UserNotFoundError."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.get_user(user_id=999)
+        await service.get_user(user_id=999)
 
 
-def test_get_user_not_found_by_username(db_session: MagicMock):
+async def test_get_user_not_found_by_username(db_session: MagicMock):
     """Test that getting a non-existent user by username raises UserNotFoundError."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.get_user(username="nonexistent")
+        await service.get_user(username="nonexistent")
+
+
+async def test_missing_username_is_cached_until_created(db_session: MagicMock):
+    """Test that a missing username is looked up once until a user with that name is created."""
+    db_session.scalar.return_value = None
+    service = UserService(
+        db_session,
+        not_found_cache=Cache(MemoryCacheBackend(), "not_found", maxsize=8, ttl=30),
+    )
+
+    for _ in range(3):
+        with pytest.raises(errors.UserNotFoundError):
+            await service.get_user(username="alice")
+    db_session.scalar.assert_awaited_once()
 
+    await service.create_user("alice", "password123")
+    db_session.scalar.return_value = User(id=1, username="alice", password="pw")
+    assert (await service.get_user(username="alice")).id == 1
 
-def test_get_all_users(db_session: MagicMock):
+
+async def test_get_all_users(db_session: MagicMock):
     """Test that getting all users works correctly."""
     users = [
         User(id=1, username="alice", password="pw"),
         User(id=2, username="bob", password="pw"),
     ]
-    db_session.all.return_value = users
+    db_session.scalars.return_value = users
 
     service = UserService(db_session)
-    result = service.get_all_users()
+    result = await service.get_all_users()
 
-    assert result == users
-    db_session.query.assert_called_once_with(User)
+    assert result.items == users
+    assert result.next is None
+    assert db_session.scalars.await_args.args[0].compare(
+        select(User).order_by(User.id).limit(DEFAULT_PAGE_SIZE + 1)
+    )
 
 
-def test_create_user_with_email(db_session: MagicMock):
+async def test_create_user_with_email(db_session: MagicMock):
     """Test that creating a user with an email works correctly."""
     service = UserService(db_session)
 
-    user = service.create_user("alice", "password123", email="alice@example.com")
+    user = await service.create_user("alice", "password123", email="alice@example.com")
 
     assert isinstance(user, User)
     assert user.username == "alice"
@@ -145,55 +173,59 @@ def test_create_user_with_email(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_delete_user_success(db_session: MagicMock):
+async def test_delete_user_success(db_session: MagicMock):
     """Test that deleting an existing user works correctly."""
-    user = User(id=1, username="alice", password="pw")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = 1
 
     service = UserService(db_session)
-    service.delete_user(user_id=1)
+    await service.delete_user(user_id=1)
 
-    db_session.delete.assert_called_once_with(user)
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(delete(User).filter_by(id=1).returning(User.id))
     db_session.commit.assert_called_once()
 
 
-def test_delete_user_not_found(db_session: MagicMock):
+async def test_delete_user_not_found(db_session: MagicMock):
     """Test that deleting a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.delete_user(user_id=999)
+        await service.delete_user(user_id=999)
 
 
-def test_update_email_success(db_session: MagicMock):
+async def test_update_email_success(db_session: MagicMock):
     """Test that updating a user's email works correctly."""
-    user = User(id=1, username="alice", password="pw", email="old@example.com")
-    db_session.first.return_value = user
+    user = User(id=1, username="alice", password="pw", email="new@example.com")
+    db_session.scalar.return_value = user
 
     service = UserService(db_session)
-    updated_user = service.update_user_email(user_id=1, new_email="new@example.com")
+    updated_user = await service.update_user_email(user_id=1, new_email="new@example.com")
 
-    assert updated_user.email == "new@example.com"
+    assert updated_user is user
+    statement = db_session.scalar.await_args.args[0]
+    assert statement.compare(
+        update(User).filter_by(id=1).values(email="new@example.com").returning(User)
+    )
     db_session.commit.assert_called_once()
 
 
-def test_update_email_user_not_found(db_session: MagicMock):
+async def test_update_email_user_not_found(db_session: MagicMock):
     """Test that updating a user's email for a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.update_user_email(user_id=999, new_email="new@example.com")
+        await service.update_user_email(user_id=999, new_email="new@example.com")
 
 
-def test_update_password_success(db_session: MagicMock):
+async def test_update_password_success(db_session: MagicMock):
     """Test that updating a user's password works correctly."""
     user = User(id=1, username="alice", password="hashed::oldpassword123")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = user
 
     service = UserService(db_session)
-    updated_user = service.update_user_password(
+    updated_user = await service.update_user_password(
         user_id=1, old_password="oldpassword123", new_password="newpassword123"
     )
 
@@ -201,18 +233,18 @@ def test_update_password_success(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_update_password_user_not_found(db_session: MagicMock):
+async def test_update_password_user_not_found(db_session: MagicMock):
     """Test that updating a user's password for a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.update_user_password(
+        await service.update_user_password(
             user_id=999, old_password="oldpassword123", new_password="newpassword123"
         )
 
 
-def test_update_user_duplicate_email_raises(db_session: MagicMock):
+async def test_update_user_duplicate_email_raises(db_session: MagicMock):
     """Test that updating a user's email to one that already exists raises DuplicateEmailError."""
     db_session.commit.side_effect = IntegrityError(
         statement=None,
@@ -223,32 +255,32 @@ def test_update_user_duplicate_email_raises(db_session: MagicMock):
     service = UserService(db_session)
 
     with pytest.raises(errors.DuplicateEmailError) as exc:
-        service.update_user_email(user_id=1, new_email="example@mail.com")
+        await service.update_user_email(user_id=1, new_email="example@mail.com")
 
     db_session.commit.assert_called_once()
     db_session.rollback.assert_called_once()
     assert "example@mail.com" in str(exc.value)
 
 
-def test_authenticate_user_success(db_session: MagicMock, monkeypatch):
+async def test_authenticate_user_success(db_session: MagicMock, monkeypatch):
     """Test that authenticating a user with correct credentials works correctly."""
     user = User(id=1, username="alice", password="hashed::password123")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = user
     monkeypatch.setattr(
         "docuisine.services.user.UserService._verify_password",
         lambda self, plain_password, hashed_password: True,
     )
 
     service = UserService(db_session)
-    result = service.authenticate_user(username="alice", password="password123")
+    result = await service.authenticate_user(username="alice", password="password123")
 
     assert result is user
 
 
-def test_authenticate_user_wrong_password(db_session: MagicMock, monkeypatch):
+async def test_authenticate_user_wrong_password(db_session: MagicMock, monkeypatch):
     """Test that authenticating a user with incorrect password returns False."""
     user = User(id=1, username="alice", password="hashed::password123")
-    db_session.first.return_value = user
+    db_session.scalar.return_value = user
     monkeypatch.setattr(
         "docuisine.services.user.UserService._verify_password",
         lambda self, plain_password, hashed_password: False,
@@ -256,33 +288,34 @@ def test_authenticate_user_wrong_password(db_session: MagicMock, monkeypatch):
 
     service = UserService(db_session)
     with pytest.raises(errors.InvalidPasswordError):
-        service.authenticate_user(username="alice", password="wrongpassword")
+        await service.authenticate_user(username="alice", password="wrongpassword")
 
 
-def test_authenticate_user_not_found(db_session: MagicMock):
+async def test_authenticate_user_not_found(db_session: MagicMock):
     """Test that authenticating a non-existent user returns False."""
-    db_session.first.return_value = None
+    db_session.scalar.return_value = None
 
     service = UserService(db_session)
 
     with pytest.raises(errors.UserNotFoundError):
-        service.authenticate_user(username="nonexistent", password="password123")
+        await service.authenticate_user(username="nonexistent", password="password123")
 
 
-def test_verify_password(db_session: MagicMock, monkeypatch):
+async def test_verify_password(db_session: MagicMock, monkeypatch):
     """Test that the password verification method works correctly."""
     service = UserService(db_session)
     monkeypatch.setattr(
         "docuisine.services.user.UserService._verify_password",
-        lambda self, plain_password, hashed_password: f"hashed::{plain_password}"
-        == hashed_password,
+        lambda self, plain_password, hashed_password: (
+            f"hashed::{plain_password}" == hashed_password
+        ),
     )
 
     assert service._verify_password("password123", "hashed::password123") is True
     assert service._verify_password("wrongpassword", "hashed::password123") is False
 
 
-def test_create_access_token(db_session: MagicMock):
+async def test_create_access_token(db_session: MagicMock):
     """Test that creating an access token returns a non-empty string."""
     jwt_config = JWTConfig(
         secret_key="testsecret",
@@ -296,7 +329,7 @@ def test_create_access_token(db_session: MagicMock):
     assert len(token) > 0
 
 
-def test_create_access_token_different_tokens(db_session: MagicMock):
+async def test_create_access_token_different_tokens(db_session: MagicMock):
     """Test that creating access tokens at different times produces different tokens."""
 
     jwt_config = JWTConfig(
@@ -312,7 +345,7 @@ def test_create_access_token_different_tokens(db_session: MagicMock):
     assert token1 != token2
 
 
-def test_create_access_token_no_jwt_config(db_session: MagicMock):
+async def test_create_access_token_no_jwt_config(db_session: MagicMock):
     """Test that creating an access token without JWT config raises ValueError."""
     service = UserService(db_session, jwt_config=None)
     user = User(id=1, username="alice", password="pw")
@@ -321,7 +354,7 @@ def test_create_access_token_no_jwt_config(db_session: MagicMock):
         service.create_access_token(user)
 
 
-def test_authorize_user_success(db_session: MagicMock, monkeypatch):
+async def test_authorize_user_success(db_session: MagicMock, monkeypatch):
     """Test that authorizing a user with a valid token works correctly."""
     jwt_config = JWTConfig(
         secret_key="testsecret",
@@ -335,18 +368,101 @@ def test_authorize_user_success(db_session: MagicMock, monkeypatch):
     )
     monkeypatch.setattr(
         "docuisine.services.user.UserService.get_user",
-        lambda user_id, username: User(id=1, username="alice", password="pw"),
+        AsyncMock(return_value=User(id=1, username="alice", password="pw", role=Role.USER)),
     )
 
     service = UserService(db_session, jwt_config=jwt_config)
     token = "validtoken"
-    result = service.authorize_user(token)
+    result = await service.authorize_user(token)
     assert result.username == "alice"
-    assert isinstance(result, User)
+    assert isinstance(result, Principal)
     assert result.id == 1
 
 
-def test_authorize_user_invalid_token(db_session: MagicMock, monkeypatch):
+async def test_authorize_user_cached(db_session: MagicMock, monkeypatch):
+    """Test that a cached token is authorized without decoding it or querying the database."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    mock_decode = MagicMock(return_value={"sub": "alice", "exp": time.time() + 60})
+    mock_get_user = AsyncMock(
+        return_value=User(id=1, username="alice", password="pw", role=Role.USER)
+    )
+    monkeypatch.setattr("docuisine.services.user.jwt.decode", mock_decode)
+    monkeypatch.setattr("docuisine.services.user.UserService.get_user", mock_get_user)
+    cache = Cache(MemoryCacheBackend(), "principals", maxsize=8, ttl=60)
+
+    service = UserService(db_session, jwt_config=jwt_config, principal_cache=cache)
+    first = await service.authorize_user("validtoken")
+    second = await service.authorize_user("validtoken")
+
+    assert first == second == Principal(id=1, username="alice", role=Role.USER)
+    mock_decode.assert_called_once()
+    mock_get_user.assert_awaited_once()
+
+
+async def test_authorize_user_cache_respects_expiry(db_session: MagicMock, monkeypatch):
+    """Test that a token is not cached past its expiry."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    monkeypatch.setattr(
+        "docuisine.services.user.jwt.decode",
+        lambda token, key, algorithms: {"sub": "alice", "exp": time.time() - 1},
+    )
+    monkeypatch.setattr(
+        "docuisine.services.user.UserService.get_user",
+        AsyncMock(return_value=User(id=1, username="alice", password="pw", role=Role.USER)),
+    )
+    cache = Cache(MemoryCacheBackend(), "principals", maxsize=8, ttl=60)
+
+    service = UserService(db_session, jwt_config=jwt_config, principal_cache=cache)
+    await service.authorize_user("validtoken")
+
+    assert cache.stats().size == 0
+
+
+async def test_authorize_user_not_cached_during_user_change(db_session: MagicMock, monkeypatch):
+    """Test that a principal looked up while its user was changed is not cached."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    cache = Cache(MemoryCacheBackend(), "principals", maxsize=8, ttl=60)
+    service = UserService(db_session, jwt_config=jwt_config, principal_cache=cache)
+
+    async def get_user_during_password_change(self, **kwargs) -> User:
+        # The password change commits and clears the cache after the user was read.
+        await cache.clear()
+        return User(id=1, username="alice", password="pw", role=Role.USER)
+
+    monkeypatch.setattr(
+        "docuisine.services.user.jwt.decode",
+        lambda token, key, algorithms: {"sub": "alice", "exp": time.time() + 60},
+    )
+    monkeypatch.setattr(
+        "docuisine.services.user.UserService.get_user", get_user_during_password_change
+    )
+    await service.authorize_user("validtoken")
+
+    assert cache.stats().size == 0
+
+
+@pytest.mark.parametrize("mutation", ["delete", "password"])
+async def test_user_changes_invalidate_principal_cache(
+    db_session: MagicMock, monkeypatch, mutation: str
+):
+    """Test that deleting a user or changing their password drops the cached principals."""
+    cache = Cache(MemoryCacheBackend(), "principals", maxsize=8, ttl=60)
+    await cache.set("alice-token", Principal(id=1, username="alice", role=Role.USER))
+    await cache.set("bob-token", Principal(id=2, username="bob", role=Role.USER))
+    service = UserService(db_session, principal_cache=cache)
+
+    if mutation == "delete":
+        db_session.scalar.return_value = 1
+        await service.delete_user(user_id=1)
+    else:
+        db_session.scalar.return_value = User(id=1, username="alice", password="hashed::old")
+        await service.update_user_password(1, old_password="old", new_password="new")
+
+    assert await cache.get("alice-token") is None
+    assert await cache.get("bob-token") is None
+
+
+async def test_authorize_user_invalid_token(db_session: MagicMock, monkeypatch):
     """Test that authorizing a user with an invalid token raises InvalidCredentialsError."""
     jwt_config = JWTConfig(
         secret_key="testsecret",
@@ -362,4 +478,107 @@ def test_authorize_user_invalid_token(db_session: MagicMock, monkeypatch):
     service = UserService(db_session, jwt_config=jwt_config)
 
     with pytest.raises(errors.InvalidCredentialsError):
-        service.authorize_user("invalidtoken")
+        await service.authorize_user("invalidtoken")
+
+
+async def test_authorize_user_stateless(db_session: MagicMock, monkeypatch):
+    """Test that a stateless service trusts the token's claims, only checking its version."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256, stateless=True)
+    mock_get_user = AsyncMock()
+    monkeypatch.setattr("docuisine.services.user.UserService.get_user", mock_get_user)
+    service = UserService(db_session, jwt_config=jwt_config)
+    get_version = AsyncMock(return_value=3)
+    monkeypatch.setattr(service, "_get_token_version_by_id", get_version)
+
+    token = service.create_access_token(
+        User(id=7, username="alice", password="pw", role=Role.ADMIN, token_version=3)
+    )
+    principal = await service.authorize_user(token)
+
+    assert principal == Principal(id=7, username="alice", role=Role.ADMIN)
+    mock_get_user.assert_not_awaited()
+    get_version.assert_awaited_once_with(7)
+
+
+@pytest.mark.parametrize("current_version", [4, None])
+async def test_authorize_user_stateless_revoked_token(
+    db_session: MagicMock, monkeypatch, current_version: Optional[int]
+):
+    """Test that a stateless token of an older token version or a deleted user is rejected."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256, stateless=True)
+    service = UserService(db_session, jwt_config=jwt_config)
+    monkeypatch.setattr(
+        service, "_get_token_version_by_id", AsyncMock(return_value=current_version)
+    )
+
+    token = service.create_access_token(
+        User(id=7, username="alice", password="pw", role=Role.USER, token_version=3)
+    )
+    with pytest.raises(errors.InvalidCredentialsError):
+        await service.authorize_user(token)
+
+
+async def test_authorize_user_stateless_caches_token_version(db_session: MagicMock, monkeypatch):
+    """Test that the token version is cached until a password change clears the cache."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256, stateless=True)
+    cache = Cache(MemoryCacheBackend(), "principals", maxsize=8, ttl=60)
+    service = UserService(db_session, jwt_config=jwt_config, principal_cache=cache)
+    get_version = AsyncMock(return_value=1)
+    monkeypatch.setattr(service, "_get_token_version_by_id", get_version)
+    token = service.create_access_token(
+        User(id=7, username="alice", password="pw", role=Role.USER, token_version=1)
+    )
+
+    await service.authorize_user(token)
+    await service.authorize_user(token)
+    get_version.assert_awaited_once()
+
+    db_session.scalar.return_value = User(id=7, username="alice", password="hashed::old")
+    await service.update_user_password(7, old_password="old", new_password="new")
+    get_version.return_value = 2
+    with pytest.raises(errors.InvalidCredentialsError):
+        await service.authorize_user(token)
+
+
+async def test_authorize_user_revoked_token(db_session: MagicMock, monkeypatch):
+    """Test that a token of an older token version is rejected after the database lookup."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    user = User(id=1, username="alice", password="pw", role=Role.USER, token_version=1)
+    monkeypatch.setattr(
+        "docuisine.services.user.UserService.get_user", AsyncMock(return_value=user)
+    )
+    service = UserService(db_session, jwt_config=jwt_config)
+    token = service.create_access_token(user)
+    assert await service.authorize_user(token) == Principal(id=1, username="alice", role="user")
+
+    user.token_version = 2
+    with pytest.raises(errors.InvalidCredentialsError):
+        await service.authorize_user(token)
+
+
+async def test_authorize_user_stateless_legacy_token(db_session: MagicMock, monkeypatch):
+    """Test that a stateless service still looks up tokens without the versioned claims."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256, stateless=True)
+    mock_get_user = AsyncMock(
+        return_value=User(id=1, username="alice", password="pw", role=Role.USER)
+    )
+    monkeypatch.setattr("docuisine.services.user.UserService.get_user", mock_get_user)
+    service = UserService(db_session, jwt_config=jwt_config)
+
+    token = jwt.encode({"sub": "alice"}, "testsecret", algorithm="HS256")
+    principal = await service.authorize_user(token)
+
+    assert principal == Principal(id=1, username="alice", role=Role.USER)
+    mock_get_user.assert_awaited_once_with(username="alice")
+
+
+@pytest.mark.parametrize(
+    "claims", [{"sub": "alice", "ver": 1}, {"sub": "alice", "uid": "x", "role": "user", "ver": 1}]
+)
+async def test_authorize_user_stateless_malformed_claims(db_session: MagicMock, claims: dict):
+    """Test that a stateless token with missing or invalid claims is rejected."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256, stateless=True)
+    service = UserService(db_session, jwt_config=jwt_config)
+
+    with pytest.raises(errors.InvalidCredentialsError):
+        await service.authorize_user(jwt.encode(claims, "testsecret", algorithm="HS256"))
@@ -0,0 +1,76 @@
+import time
+
+from docuisine.utils.cache import TTLCache
+
+
+def test_get_and_set():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_entries_expire():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_entry_ttl_is_capped_by_cache_ttl():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1, ttl=60)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_non_positive_ttl_is_not_stored():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0)
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    cache: TTLCache[str, int] = TTLCache(maxsize=0, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_pop_and_clear():
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_stats():
+    cache: TTLCache[str, int] = TTLCache(maxsize=1, ttl=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.set("b", 2)
+    cache.set("c", 3, ttl=0.01)
+    time.sleep(0.02)
+    cache.get("c")
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (1, 2, 2, 1)
+    assert stats.size == 0
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import status
+import pytest
+
+from docuisine.db.models import Category, Store
+from docuisine.utils.etag import entity_etag, etag_matches, not_modified, page_etag
+from docuisine.utils.pagination import KeysetPage
+
+UPDATED = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def test_entity_etag_changes_with_updated_at():
+    category = Category(id=1, name="Dessert", updated_at=UPDATED)
+    etag = entity_etag(category)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == entity_etag(Category(id=1, name="Renamed", updated_at=UPDATED))
+    assert etag != entity_etag(Category(id=1, name="Dessert", updated_at=datetime.now()))
+    assert etag != entity_etag(Store(id=1, name="Dessert", updated_at=UPDATED))
+
+
+def test_entity_etag_ignores_time_zone_of_updated_at():
+    """SQLite reads UTC timestamps back without a time zone, PostgreSQL with one."""
+    etag = entity_etag(Category(id=1, name="Dessert", updated_at=UPDATED))
+    aware = UPDATED.replace(tzinfo=timezone.utc)
+    shifted = aware.astimezone(timezone(timedelta(hours=9)))
+
+    assert etag == entity_etag(Category(id=1, name="Dessert", updated_at=aware))
+    assert etag == entity_etag(Category(id=1, name="Dessert", updated_at=shifted))
+
+
+def test_page_etag_changes_with_rows():
+    first = Category(id=1, name="Dessert", updated_at=UPDATED)
+    second = Category(id=2, name="Korean", updated_at=UPDATED)
+    etag = page_etag(KeysetPage(items=[first, second]))
+
+    assert etag == page_etag(KeysetPage(items=[first, second]))
+    assert etag != page_etag(KeysetPage(items=[second, first]))
+    assert etag != page_etag(KeysetPage(items=[first]))
+    assert etag != page_etag(KeysetPage(items=[first, second], next="cursor"))
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_not_modified():
+    response = not_modified('"abc"')
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == '"abc"'
+    assert response.body == b""
@@ -0,0 +1,127 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select, tuple_
+
+from docuisine.db.models import Category
+from docuisine.utils.errors import InvalidCursorError
+from docuisine.utils.pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+
+pytestmark = pytest.mark.anyio
+
+SORT_COLUMNS = {"id": Category.id, "name": Category.name}
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("name", ["Dessert", 4])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "name") == ["Dessert", 4]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", encode_cursor("id", 1)])
+def test_decode_invalid_cursor(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "id")
+
+
+def test_decode_cursor_other_sort():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("id", [1]), "name")
+
+
+async def test_paginate_first_page(db_session: MagicMock):
+    db_session.scalars.return_value = [Category(id=i, name=f"C{i}") for i in (1, 2, 3)]
+
+    page = await paginate(db_session, select(Category), SORT_COLUMNS, limit=2)
+
+    assert [category.id for category in page.items] == [1, 2]
+    assert decode_cursor(page.next, "id") == [2]
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Category).order_by(Category.id).limit(3)
+    )
+
+
+async def test_paginate_last_page(db_session: MagicMock):
+    db_session.scalars.return_value = [Category(id=3, name="C3")]
+
+    page = await paginate(db_session, select(Category), SORT_COLUMNS, limit=2)
+
+    assert len(page.items) == 1
+    assert page.next is None
+
+
+async def test_paginate_after_cursor_sorted_by_name(db_session: MagicMock):
+    db_session.scalars.return_value = [Category(id=7, name="Korean"), Category(id=2, name="Thai")]
+    after = encode_cursor("name", ["Dessert", 4])
+
+    page = await paginate(db_session, select(Category), SORT_COLUMNS, "name", limit=1, after=after)
+
+    assert [category.id for category in page.items] == [7]
+    assert decode_cursor(page.next, "name") == ["Korean", 7]
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Category)
+        .where(tuple_(Category.name, Category.id) > tuple_("Dessert", 4))
+        .order_by(Category.name, Category.id)
+        .limit(2)
+    )
+
+
+async def test_paginate_caps_page_size(db_session: MagicMock):
+    db_session.scalars.return_value = []
+
+    await paginate(db_session, select(Category), SORT_COLUMNS, limit=MAX_PAGE_SIZE * 10)
+
+    assert db_session.scalars.await_args.args[0].compare(
+        select(Category).order_by(Category.id).limit(MAX_PAGE_SIZE + 1)
+    )
+
+
+async def test_paginate_loads_selected_fields(db_session: MagicMock):
+    db_session.scalars.return_value = []
+
+    await paginate(db_session, select(Category), SORT_COLUMNS, "name", fields=("description",))
+
+    statement = str(db_session.scalars.await_args.args[0])
+    columns = statement.split("FROM")[0]
+    for column in ("id", "name", "description", "updated_at"):
+        assert f"categories.{column}" in columns
+    assert "categories.img" not in columns
+
+
+async def test_paginate_unknown_sort(db_session: MagicMock):
+    with pytest.raises(ValueError):
+        await paginate(db_session, select(Category), SORT_COLUMNS, "description")
+
+
+async def test_paginate_cursor_key_mismatch(db_session: MagicMock):
+    with pytest.raises(InvalidCursorError):
+        await paginate(
+            db_session, select(Category), SORT_COLUMNS, after=encode_cursor("id", ["x", 1])
+        )
+
+
+@pytest.mark.parametrize(
+    "sort, key",
+    [
+        ("id", ["abc"]),
+        ("id", [1.5]),
+        ("id", [True]),
+        ("id", [None]),
+        ("id", [2**31]),
+        ("name", [4, 4]),
+        ("name", ["Dessert", "4"]),
+        ("name", ["Dess\x00ert", 4]),
+    ],
+)
+async def test_paginate_cursor_key_types(db_session: MagicMock, sort: str, key: list):
+    """Test that cursor key values not matching the sort columns never reach the database."""
+    with pytest.raises(InvalidCursorError):
+        await paginate(
+            db_session, select(Category), SORT_COLUMNS, sort, after=encode_cursor(sort, key)
+        )
+    db_session.scalars.assert_not_awaited()
@@ -0,0 +1,147 @@
+import gzip
+from unittest.mock import AsyncMock
+
+from fastapi import status
+import pytest
+
+from docuisine.core.cache import Cache, MemoryCacheBackend
+from docuisine.core.config import Settings
+from docuisine.schemas.common import Page
+from docuisine.schemas.store import StoreOut
+from docuisine.utils.responses import ModelResponse, cached_response
+
+pytestmark = pytest.mark.anyio
+
+ETAG = '"abc"'
+
+
+def make_page(count: int) -> Page[StoreOut]:
+    return Page[StoreOut](
+        items=[StoreOut(id=i, name=f"Store {i}", address="Main St") for i in range(count)]
+    )
+
+
+@pytest.fixture
+def cache() -> Cache:
+    return Cache(MemoryCacheBackend(), "stores", maxsize=8, ttl=60)
+
+
+async def test_cached_response_hit_skips_build(cache: Cache):
+    build = AsyncMock(return_value=(ETAG, make_page(1)))
+
+    first = await cached_response(cache, "/stores/", build)
+    second = await cached_response(cache, "/stores/", build)
+
+    build.assert_awaited_once()
+    assert first.body == second.body == make_page(1).model_dump_json().encode()
+    assert second.headers["ETag"] == ETAG
+    assert second.headers["Content-Type"] == "application/json"
+
+
+async def test_cached_response_without_cache():
+    build = AsyncMock(return_value=(ETAG, make_page(1)))
+
+    await cached_response(None, "/stores/", build)
+    await cached_response(None, "/stores/", build)
+
+    assert build.await_count == 2
+
+
+async def test_cached_response_drops_body_built_during_write(cache: Cache):
+    async def build_during_write():
+        # A write starts and clears the cache while the old content is loaded.
+        await cache.bump_generation()
+        await cache.clear()
+        return ETAG, make_page(1)
+
+    await cached_response(cache, "/stores/", build_during_write)
+    build = AsyncMock(return_value=('"new"', make_page(2)))
+    response = await cached_response(cache, "/stores/", build)
+
+    build.assert_awaited_once()
+    assert response.headers["ETag"] == '"new"'
+
+
+async def test_cached_response_not_modified(cache: Cache):
+    build = AsyncMock(return_value=(ETAG, make_page(1)))
+
+    response = await cached_response(cache, "/stores/", build, if_none_match=ETAG)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.body == b""
+
+
+def use_compression(monkeypatch, **options) -> None:
+    settings = Settings.from_env().model_copy(update=options)
+    monkeypatch.setattr("docuisine.utils.responses.get_settings", lambda: settings)
+
+
+async def test_cached_response_gzip(cache: Cache, monkeypatch):
+    use_compression(monkeypatch, COMPRESSION_ENCODINGS=("gzip",), COMPRESSION_MIN_SIZE=1024)
+    page = make_page(50)
+    assert len(page.model_dump_json()) >= 1024
+    build = AsyncMock(return_value=(ETAG, page))
+
+    response = await cached_response(cache, "/stores/", build, accept_encoding="gzip, br")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == '"abc-gzip"'
+    assert gzip.decompress(response.body) == page.model_dump_json().encode()
+
+    plain = await cached_response(cache, "/stores/", build)
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == ETAG
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, br", "br"),
+        ("gzip, br;q=0.5", "gzip"),
+        ("zstd, gzip", "gzip"),
+        ("*", "br"),
+        ("br;q=0, gzip;q=0", None),
+        ("identity", None),
+    ],
+)
+async def test_cached_response_negotiates_encoding(
+    cache: Cache, monkeypatch, accept_encoding: str, expected: str
+):
+    pytest.importorskip("brotli")
+    use_compression(monkeypatch, COMPRESSION_ENCODINGS=("br", "gzip"), COMPRESSION_MIN_SIZE=0)
+    build = AsyncMock(return_value=(ETAG, make_page(50)))
+
+    response = await cached_response(cache, "/stores/", build, accept_encoding=accept_encoding)
+
+    assert response.headers.get("Content-Encoding") == expected
+    assert response.headers["ETag"] == (ETAG if expected is None else f'"abc-{expected}"')
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"COMPRESSION_ENCODINGS": ()},
+        {"COMPRESSION_MIN_SIZE": 1_000_000},
+        {"COMPRESSION_CONTENT_TYPES": ("text/*",)},
+    ],
+)
+async def test_cached_response_respects_compression_settings(
+    cache: Cache, monkeypatch, options: dict
+):
+    use_compression(monkeypatch, **{"COMPRESSION_ENCODINGS": ("gzip",), **options})
+    build = AsyncMock(return_value=(ETAG, make_page(50)))
+
+    response = await cached_response(cache, "/stores/", build, accept_encoding="gzip")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == ETAG
+
+
+def test_model_response_encodes_model():
+    page = make_page(2)
+    response = ModelResponse(page, status_code=status.HTTP_201_CREATED, headers={"ETag": ETAG})
+
+    assert response.body == page.model_dump_json().encode()
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == ETAG
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from docuisine.db.models import Recipe, Store
+from docuisine.schemas.recipe import RecipeOut
+from docuisine.schemas.store import StoreOut
+from docuisine.schemas.user import UserOut
+from docuisine.utils.errors import InvalidFieldsError
+from docuisine.utils.serialization import (
+    SCHEMA_CACHE_SIZE,
+    dump_list_json,
+    list_adapter,
+    select_fields,
+    sparse_schema,
+    validate_list,
+)
+
+
+def test_validate_list_matches_model_validate():
+    stores = [Store(id=i, name=f"Store {i}", address="Main St") for i in range(3)]
+    for store in stores:
+        store.description = store.img = store.preview_img = None
+        store.created_at = store.updated_at = None
+
+    assert validate_list(StoreOut, stores) == [StoreOut.model_validate(store) for store in stores]
+    assert list_adapter(StoreOut) is list_adapter(StoreOut)
+
+
+def test_validate_list_reads_attributes_of_partially_loaded_rows():
+    """Test that a row missing a field in its loaded values is read through its attributes."""
+
+    class Row:
+        def __init__(self) -> None:
+            self.id, self.user_id, self.name = 3, 1, "Pie"
+
+        @property
+        def servings(self) -> int:
+            return 4
+
+    recipe = Recipe(id=1, user_id=1, name="Cake")
+
+    items = validate_list(RecipeOut, [recipe, {"id": 2, "user_id": 1, "name": "Soup"}, Row()])
+
+    assert [item.name for item in items] == ["Cake", "Soup", "Pie"]
+    assert items[2].servings == 4
+
+
+def test_dump_list_json():
+    items = [StoreOut(id=1, name="Market", address="Main St")]
+    assert json.loads(dump_list_json(StoreOut, items)) == [items[0].model_dump(mode="json")]
+
+
+def test_select_fields():
+    assert select_fields(StoreOut, None) is None
+    assert select_fields(StoreOut, " name, id,name") == ("id", "name")
+    assert select_fields(StoreOut, ",".join(StoreOut.model_fields)) is None
+
+
+@pytest.mark.parametrize("fields", ["id,password", "", " , "])
+def test_select_fields_rejects_invalid(fields: str):
+    with pytest.raises(InvalidFieldsError):
+        select_fields(UserOut, fields)
+
+
+def test_sparse_schema_keeps_field_constraints():
+    schema = sparse_schema(UserOut, ("id", "email"))
+
+    assert sparse_schema(UserOut, ("id", "email")) is schema
+    assert sparse_schema(UserOut, None) is UserOut
+    assert list(schema.model_fields) == ["id", "email"]
+    store = Store(id=1, name="Market")
+    assert validate_list(sparse_schema(StoreOut, ("name",)), [store])[0].model_dump() == {
+        "name": "Market"
+    }
+    with pytest.raises(ValueError):
+        validate_list(schema, [{"id": 1, "email": "not an email"}])
+
+
+def test_sparse_schemas_are_bounded():
+    """Test that scanning fieldsets does not keep a schema per selection forever."""
+    for schema in (RecipeOut, StoreOut, UserOut):
+        names = list(schema.model_fields)
+        for i in range(1, 2 ** len(names)):
+            fields = tuple(name for bit, name in enumerate(names) if i >> bit & 1)
+            list_adapter(sparse_schema(schema, fields))
+
+    assert sparse_schema.cache_info().currsize <= SCHEMA_CACHE_SIZE
+    assert list_adapter.cache_info().currsize <= SCHEMA_CACHE_SIZE
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from docuisine.db.models import Store
+from docuisine.schemas.store import StoreOut
+from docuisine.utils.streaming import stream_json_array
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeResult:
+    """Stand-in for `AsyncScalarResult` yielding pre-built partitions."""
+
+    def __init__(self, partitions: list[list[Store]]):
+        self._partitions = partitions
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+async def collect(result: FakeResult) -> bytes:
+    return b"".join([chunk async for chunk in stream_json_array(result, StoreOut)])  # type: ignore
+
+
+async def test_stream_json_array_empty():
+    assert await collect(FakeResult([])) == b"[]"
+
+
+async def test_stream_json_array_partitions():
+    stores = [Store(id=i, name=f"Store {i}", address=f"{i} Main St") for i in range(1, 6)]
+    body = await collect(FakeResult([stores[:2], stores[2:4], stores[4:]]))
+
+    data = json.loads(body)
+    assert [store["id"] for store in data] == [1, 2, 3, 4, 5]
+    assert data[0] == StoreOut.model_validate(stores[0]).model_dump(mode="json")